@@ -5,7 +5,10 @@ This package provides functionality for fetching, analyzing, and grading
 CrowdStrike Falcon policies against minimum security standards.
 """
 
+import functools
+import importlib
 import importlib.metadata
+from email.utils import parseaddr
 from pathlib import Path
 
 # Defaults
@@ -14,9 +17,13 @@ __author__ = "CrowdStrike Community"
 __maintainers__ = ['Scott MacGregor']
 __license__ = "MIT"
 
+_DIST_NAME = "falcon-policy-scoring"
+_PYPROJECT_PATH = Path(__file__).parent.parent.parent / "pyproject.toml"
 
+
+@functools.lru_cache(maxsize=1)
 def _read_pyproject_toml():
-    """Read and parse pyproject.toml file."""
+    """Read and parse pyproject.toml file (parsed at most once per process)."""
     try:
         import tomllib  # Python 3.11+
     except ModuleNotFoundError:
@@ -25,38 +32,94 @@ def _read_pyproject_toml():
         except ModuleNotFoundError:
             return None
 
-    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-    if pyproject_path.exists():
-        with open(pyproject_path, "rb") as f:
+    try:
+        with open(_PYPROJECT_PATH, "rb") as f:
             return tomllib.load(f)
-    return None
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _package_metadata():
+    """Return the installed distribution metadata, or None when not installed.
+
+    The dist-info lookup walks sys.path, so it is performed at most once per
+    process.
+    """
+    try:
+        return importlib.metadata.metadata(_DIST_NAME)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _maintainers_from_metadata(md):
+    """Build a pyproject-style maintainers list from core package metadata."""
+    maintainers = []
+    for entry in md.get_all("Maintainer-email") or []:
+        for address in entry.split(","):
+            name, email = parseaddr(address.strip())
+            if name or email:
+                maintainers.append({'name': name or email, 'email': email})
+    for name in md.get_all("Maintainer") or []:
+        maintainers.append({'name': name})
+    return maintainers
+
 
+def _resolve_package_info():
+    """Resolve (version, author, maintainers, license) for the package.
+
+    Installed packages are described entirely by their dist-info metadata, so
+    the TOML parser is never imported. Uninstalled source-tree runs fall back
+    to pyproject.toml.
+    """
+    version, author, maintainers, license_name = __version__, __author__, __maintainers__, __license__
+
+    md = _package_metadata()
+    if md is not None:
+        version = md.get("Version") or version
+        author = md.get("Author") or author
+        maintainers = _maintainers_from_metadata(md) or maintainers
+
+        # License may carry the full license file text; only accept a short identifier
+        license_text = md.get("License-Expression") or md.get("License")
+        if license_text and '\n' not in license_text:
+            license_name = license_text
+        return version, author, maintainers, license_name
 
-# Try to get version from installed package metadata
-try:
-    __version__ = importlib.metadata.version("falcon-policy-scoring")
-except importlib.metadata.PackageNotFoundError:
-    # Fallback: read from pyproject.toml
     pyproject_data = _read_pyproject_toml()
     if pyproject_data:
-        __version__ = pyproject_data.get("project", {}).get("version", __version__)
+        project = pyproject_data.get("project", {})
+
+        version = project.get("version", version)
+
+        # Extract author from first author entry
+        authors = project.get("authors", [])
+        if authors:
+            author = authors[0].get("name", author)
 
-# Read author, maintainers, and license from pyproject.toml
-pyproject_data = _read_pyproject_toml()
-if pyproject_data:
-    project = pyproject_data.get("project", {})
+        # Extract maintainers list
+        maintainers = project.get("maintainers", maintainers)
 
-    # Extract author from first author entry
-    authors = project.get("authors", [])
-    if authors:
-        __author__ = authors[0].get("name", __author__)
+        # Extract license (handle both string and dict with 'file' key)
+        license_info = project.get("license")
+        if license_info and not isinstance(license_info, dict):
+            license_name = license_info
 
-    # Extract maintainers list
-    __maintainers__ = project.get("maintainers", __maintainers__)
+    return version, author, maintainers, license_name
 
-    # Extract license (handle both string and dict with 'file' key)
-    license_info = project.get("license")
-    if license_info and not isinstance(license_info, dict):
-        __license__ = license_info
+
+__version__, __author__, __maintainers__, __license__ = _resolve_package_info()
 
 __all__ = ['__version__', '__author__', '__maintainers__', '__license__']
+
+# Subpackages are resolved on first attribute access (PEP 562) so importing the
+# package for ``__version__`` does not pull in the API clients or grading code.
+_LAZY_SUBMODULES = frozenset({'grading', 'falconapi', 'utils'})
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
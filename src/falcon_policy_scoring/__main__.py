@@ -6,25 +6,47 @@ Fetches, grades, and displays CrowdStrike Falcon security policies.
 Supports filtering by policy type, platform, and grading status.
 """
 
-from falcon_policy_scoring.utils.exceptions import CliError, ConfigurationError, ApiConnectionError, DatabaseError
-from falcon_policy_scoring.cli.schema import handle_schema_generation
-from falcon_policy_scoring.cli.output_strategies import get_output_strategy
-from falcon_policy_scoring.cli.operations import handle_fetch_operations, handle_regrade_operations
-from falcon_policy_scoring.cli.cli_setup import parse_arguments, setup_environment
-from falcon_policy_scoring.cli.context import CliContext
-from rich.console import Console
+import json
 import sys
+import traceback
 from pathlib import Path
 
+from falcon_policy_scoring.cli.cli_setup import parse_arguments
+
+# Everything else is imported inside the code path that needs it, so cheap
+# invocations (--help, --version, generate-schema) skip the API client, database
+# adapters and grading engine entirely.
+
+
+def _make_console():
+    """Return the shared Rich console (rich is imported on first use)."""
+    from falcon_policy_scoring.cli.context import get_console
+    return get_console()
+
+
+def _make_context(args, json_output_mode=None):
+    """Create the CLI context for a subcommand run.
+
+    ``json_output_mode`` defaults to the flag precomputed on ``args`` by
+    parse_arguments (True for any structured output format).
+    """
+    from falcon_policy_scoring.cli.context import CliContext
+    if json_output_mode is None:
+        json_output_mode = args.json_output_mode
+    return CliContext(
+        console=_make_console(),
+        verbose=args.verbose,
+        json_output_mode=json_output_mode
+    )
+
 
 def _handle_error(error, error_type, ctx, exit_code=1):
     """Handle error reporting for both JSON and console output modes."""
     if ctx.json_output_mode:
-        print(f'{{"error": "{error_type}", "message": "{str(error)}"}}')
+        print(json.dumps({"error": error_type, "message": str(error)}))
     else:
         ctx.console.print(f"[bold red]{error_type}:[/bold red] {error}")
-        if ctx.verbose and hasattr(error, '__traceback__'):
-            import traceback
+        if ctx.verbose and error.__traceback__ is not None:
             ctx.console.print(traceback.format_exc())
     sys.exit(exit_code)
 
@@ -41,109 +63,37 @@ def main():
     # Parse command line arguments
     args = parse_arguments()
 
-    # Handle subcommands
-    if args.command == 'generate-schema':
-        handle_schema_generation(args)
-        return
-
-    if args.command == 'policies':
-        # Create CLI context
-        ctx = CliContext(
-            console=Console(),
-            verbose=args.verbose,
-            json_output_mode=(args.output_format == 'json')
-        )
-        # Transform args to match legacy structure for output_strategies
-        args.show_policies = True
-        args.show_hosts = False
-        args.sort_policies = args.sort
-        args.fetch = False  # policies subcommand doesn't fetch
-        _run_legacy_mode(args, ctx)
-        return
-
-    if args.command == 'hosts':
-        # Create CLI context
-        ctx = CliContext(
-            console=Console(),
-            verbose=args.verbose,
-            json_output_mode=(args.output_format == 'json')
-        )
-        # Transform args to match legacy structure for output_strategies
-        args.show_hosts = True
-        args.show_policies = False
-        args.sort_hosts = args.sort
-        args.details = False  # hosts subcommand doesn't have details
-        args.hostname = None  # hosts subcommand doesn't filter by hostname
-        args.fetch = False  # hosts subcommand doesn't fetch
-        _run_legacy_mode(args, ctx)
+    # Every subcommand (and no subcommand, for backward compatibility) is
+    # resolved with a single table lookup
+    handler = _COMMAND_HANDLERS.get(args.command)
+    if handler is not None:
+        handler(args)
         return
 
-    if args.command == 'host':
-        # Create CLI context
-        ctx = CliContext(
-            console=Console(),
-            verbose=args.verbose,
-            json_output_mode=(args.output_format == 'json')
-        )
-        # Transform args to match legacy structure for output_strategies
-        args.show_hosts = True
-        args.show_policies = False
-        args.sort_hosts = 'platform'
-        args.host_status = None  # single host view doesn't filter by status
-        args.platform = None  # single host view doesn't filter by platform
-        args.fetch = False  # host subcommand doesn't fetch
-        # hostname is already set as positional argument
-        # details is already set in the subcommand
-        _run_legacy_mode(args, ctx)
-        return
+    # Unknown subcommand (shouldn't happen with argparse)
+    console = _make_console()
+    console.print(f"[bold red]Error:[/bold red] Unknown command '{args.command}'")
+    sys.exit(1)
 
-    if args.command == 'fetch':
-        # Create CLI context
-        ctx = CliContext(
-            console=Console(),
-            verbose=args.verbose,
-            json_output_mode=(args.output_format == 'json')
-        )
-        # Transform args to match legacy structure for fetch operations
-        args.fetch = True
-        args.show_policies = False
-        args.show_hosts = False
-        _run_legacy_mode(args, ctx)
-        return
 
-    if args.command == 'regrade':
-        # Create CLI context. Suppress rich console output for any structured
-        # format (json/csv) so stdout stays clean; the structured payload is
-        # emitted by output_regrade_summary instead.
-        ctx = CliContext(
-            console=Console(),
-            verbose=args.verbose,
-            json_output_mode=(args.output_format != 'text')
-        )
-        # Run regrade operation
-        _run_regrade_mode(args, ctx)
-        return
+def _run_legacy_command(args):
+    """Run a display/fetch subcommand through legacy mode."""
+    # Transform args to match legacy structure for output_strategies
+    for attr, value in _LEGACY_ARG_OVERRIDES[args.command].items():
+        setattr(args, attr, value)
+    sort_attr = _LEGACY_SORT_ALIASES.get(args.command)
+    if sort_attr:
+        setattr(args, sort_attr, args.sort)
 
-    if args.command == 'daemon':
-        # Run in daemon mode
-        _run_daemon_mode(args)
-        return
+    # Create CLI context
+    ctx = _make_context(args)
+    _run_legacy_mode(args, ctx)
 
-    # If no subcommand specified, use legacy mode (backward compatibility)
-    if args.command is None:
-        # Create CLI context for legacy mode
-        ctx = CliContext(
-            console=Console(),
-            verbose=args.verbose,
-            json_output_mode=(args.output_format == 'json')
-        )
-        _run_legacy_mode(args, ctx)
-        return
 
-    # Unknown subcommand (shouldn't happen with argparse)
-    console = Console()
-    console.print(f"[bold red]Error:[/bold red] Unknown command '{args.command}'")
-    sys.exit(1)
+def _run_schema_mode(args):
+    """Generate JSON schema(s) for policy-audit report types."""
+    from falcon_policy_scoring.cli.schema import handle_schema_generation
+    handle_schema_generation(args)
 
 
 def _run_daemon_mode(args):
@@ -153,46 +103,41 @@ def _run_daemon_mode(args):
     from falcon_policy_scoring.utils.logger import setup_logging
 
     # Create minimal context for error handling
-    ctx = CliContext(
-        console=Console(),
-        verbose=args.verbose,
-        json_output_mode=False  # Daemon mode doesn't support JSON output
-    )
+    # (daemon mode doesn't support JSON output)
+    ctx = _make_context(args, json_output_mode=False)
 
     try:
         # Setup logging for daemon mode
         config = read_config_from_yaml(args.config)
         setup_logging(config, worker_name="daemon")
 
-        # Override health port if specified
-        if args.health_port:
-            config.setdefault('daemon', {}).setdefault('health_check', {})['port'] = args.health_port
+        # Health port: --health-port override, then config, then default 8088
+        health_check_config = config.setdefault('daemon', {}).setdefault('health_check', {})
+        health_check_config['port'] = args.health_port or health_check_config.get('port') or 8088
 
-        # Default health port to 8088 if not specified
-        if not config.get('daemon', {}).get('health_check', {}).get('port'):
-            config.setdefault('daemon', {}).setdefault('health_check', {})['port'] = 8088
-
-        # Ensure output directory exists
+        # Ensure output directory exists (usually already there on restarts)
         output_dir = Path(args.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if not output_dir.is_dir():
+            output_dir.mkdir(parents=True, exist_ok=True)
 
         # Create and run daemon
         daemon = DaemonRunner(args.config, str(output_dir), immediate=args.immediate)
         daemon.initialize()
 
-        ctx.console.print("[bold green]Daemon started[/bold green]")
-        ctx.console.print(f"Config: {args.config}")
-        ctx.console.print(f"Output: {output_dir}")
-
         # Show health check URL only if enabled
-        health_check_config = config.get('daemon', {}).get('health_check', {})
         if health_check_config.get('enabled', True):
-            health_port = health_check_config.get('port', 8088)
-            ctx.console.print(f"Health check: http://localhost:{health_port}/health")
+            health_line = f"Health check: http://localhost:{health_check_config['port']}/health"
         else:
-            ctx.console.print("Health check: [dim]disabled[/dim]")
+            health_line = "Health check: [dim]disabled[/dim]"
 
-        ctx.console.print("\n[yellow]Press Ctrl+C to stop[/yellow]\n")
+        # Render the startup banner in a single console write
+        ctx.console.print("\n".join((
+            "[bold green]Daemon started[/bold green]",
+            f"Config: {args.config}",
+            f"Output: {output_dir}",
+            health_line,
+            "\n[yellow]Press Ctrl+C to stop[/yellow]\n",
+        )))
 
         daemon.run()
         sys.exit(0)
@@ -205,18 +150,27 @@ def _run_daemon_mode(args):
         _handle_error(e, "Daemon Error", ctx)
 
 
-def _run_regrade_mode(args, ctx):
+def _run_regrade_mode(args):
     """Run the regrade mode to re-grade existing policies."""
+    from falcon_policy_scoring.cli.cli_setup import setup_environment
+    from falcon_policy_scoring.cli.operations import handle_regrade_operations
+    from falcon_policy_scoring.utils.exceptions import CliError, ConfigurationError, DatabaseError
+
+    # Rich console output is suppressed for any structured format (json/csv)
+    # so stdout stays clean; the structured payload is emitted by
+    # output_regrade_summary instead.
+    ctx = _make_context(args)
+
     try:
         # Setup environment (config, database - no API needed)
-        ctx = setup_environment(args)
+        setup_environment(args, ctx)
 
         # Handle regrade operations (returns a structured summary)
         summary = handle_regrade_operations(ctx.adapter, ctx.cid, args, ctx)
 
         # In text mode regrade_policies already printed rich output; emit
         # structured formats (json/csv) here so --output-format is honored.
-        if args.output_format != 'text':
+        if args.json_output_mode:
             from falcon_policy_scoring.cli.output_strategies import output_regrade_summary
             output_regrade_summary(summary, args, ctx)
 
@@ -238,10 +192,14 @@ def _run_regrade_mode(args, ctx):
 
 def _run_legacy_mode(args, ctx):
     """Run the legacy CLI mode (without subcommands)."""
+    from falcon_policy_scoring.cli.cli_setup import setup_environment
+    from falcon_policy_scoring.cli.operations import handle_fetch_operations
+    from falcon_policy_scoring.cli.output_strategies import get_output_strategy
+    from falcon_policy_scoring.utils.exceptions import CliError, ConfigurationError, ApiConnectionError, DatabaseError
 
     try:
         # Setup environment (config, database, API)
-        ctx = setup_environment(args)
+        setup_environment(args, ctx)
 
         # Handle fetch operations if requested
         if args.fetch:
@@ -278,5 +236,55 @@ def _run_legacy_mode(args, ctx):
         _handle_error(e, "Unexpected Error", ctx)
 
 
+# Run mode for each subcommand; None is the legacy no-subcommand invocation
+_COMMAND_HANDLERS = {
+    None: _run_legacy_command,
+    'policies': _run_legacy_command,
+    'hosts': _run_legacy_command,
+    'host': _run_legacy_command,
+    'fetch': _run_legacy_command,
+    'generate-schema': _run_schema_mode,
+    'regrade': _run_regrade_mode,
+    'daemon': _run_daemon_mode,
+}
+
+# Legacy attribute values each legacy-mode subcommand sets on args
+_LEGACY_ARG_OVERRIDES = {
+    None: {},
+    'policies': {
+        'show_policies': True,
+        'show_hosts': False,
+        'fetch': False,  # policies subcommand doesn't fetch
+    },
+    'hosts': {
+        'show_hosts': True,
+        'show_policies': False,
+        'details': False,  # hosts subcommand doesn't have details
+        'hostname': None,  # hosts subcommand doesn't filter by hostname
+        'fetch': False,  # hosts subcommand doesn't fetch
+    },
+    # hostname is the positional argument and details is set by the subcommand
+    'host': {
+        'show_hosts': True,
+        'show_policies': False,
+        'sort_hosts': 'platform',
+        'host_status': None,  # single host view doesn't filter by status
+        'platform': None,  # single host view doesn't filter by platform
+        'fetch': False,  # host subcommand doesn't fetch
+    },
+    'fetch': {
+        'fetch': True,
+        'show_policies': False,
+        'show_hosts': False,
+    },
+}
+
+# Legacy sort attribute that receives the subcommand's --sort value
+_LEGACY_SORT_ALIASES = {
+    'policies': 'sort_policies',
+    'hosts': 'sort_hosts',
+}
+
+
 if __name__ == "__main__":
     main()
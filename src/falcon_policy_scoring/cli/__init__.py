@@ -1,10 +1,27 @@
 """CLI module for policy-audit tool."""
 
-from falcon_policy_scoring.cli.cli_setup import parse_arguments, setup_environment
-from falcon_policy_scoring.cli.context import CliContext
-from falcon_policy_scoring.cli.operations import handle_fetch_operations, handle_regrade_operations
-from falcon_policy_scoring.cli.output_strategies import get_output_strategy
-from falcon_policy_scoring.cli.schema import handle_schema_generation
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cli_setup import parse_arguments, setup_environment
+    from .context import CliContext
+    from .operations import handle_fetch_operations, handle_regrade_operations
+    from .output_strategies import get_output_strategy
+    from .schema import handle_schema_generation
+
+# Public names are resolved on first access (PEP 562) so that importing a single
+# CLI submodule (e.g. cli_setup for argument parsing) does not load the
+# operations, output and schema modules as a side effect.
+_LAZY_EXPORTS = {
+    'parse_arguments': 'cli_setup',
+    'setup_environment': 'cli_setup',
+    'CliContext': 'context',
+    'handle_fetch_operations': 'operations',
+    'handle_regrade_operations': 'operations',
+    'get_output_strategy': 'output_strategies',
+    'handle_schema_generation': 'schema',
+}
 
 __all__ = [
     'parse_arguments',
@@ -15,3 +32,12 @@ __all__ = [
     'get_output_strategy',
     'handle_schema_generation'
 ]
+
+
+def __getattr__(name):
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
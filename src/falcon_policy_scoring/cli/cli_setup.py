@@ -1,24 +1,74 @@
-"""CLI setup and initialization functions."""
+"""CLI setup and initialization functions.
+
+Third-party and API/database imports (falconpy, rich, dotenv, the database
+factory) are deferred into the functions that use them so that argument
+parsing, ``--help`` and ``--version`` load no third-party code.
+"""
 import argparse
+import functools
 import os
-from typing import Tuple
-from datetime import datetime, timedelta
-from dotenv import load_dotenv
-from falconpy import APIHarnessV2
+import sys
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
+from datetime import timedelta
 from falcon_policy_scoring import __version__, __author__, __maintainers__, __license__
-from falcon_policy_scoring.utils.config import read_config_from_yaml
+from falcon_policy_scoring.utils.config import read_config_from_yaml, YamlSafeLoader
 from falcon_policy_scoring.utils.constants import POLICY_TYPE_REGISTRY
 from falcon_policy_scoring.utils.logger import setup_logging
-from falcon_policy_scoring.factories.database_factory import DatabaseFactory
-from falcon_policy_scoring.falconapi.cid import get_cid
 from falcon_policy_scoring.utils.exceptions import ConfigurationError, ApiConnectionError, DatabaseError
-from falcon_policy_scoring.cli.context import CliContext
-from rich.console import Console
+from falcon_policy_scoring.cli.context import ApiCreds, CliContext, get_console
+
+if TYPE_CHECKING:
+    from falconpy import APIHarnessV2
+
+
+# Accepted -t/--type values (besides 'all'), derived once from the registry
+VALID_POLICY_TYPES = frozenset(v['cli_name'] for v in POLICY_TYPE_REGISTRY.values())
+_VALID_POLICY_TYPES_TEXT = ', '.join(sorted(VALID_POLICY_TYPES))
+
+
+# Mapping from --last-seen input to look-back duration
+LAST_SEEN_DURATIONS = {
+    'hour': timedelta(hours=1),
+    '12 hours': timedelta(hours=12),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1)
+}
+
+# The same look-back durations as whole seconds, for epoch arithmetic
+_LAST_SEEN_SECONDS = {key: int(duration.total_seconds()) for key, duration in LAST_SEEN_DURATIONS.items()}
+
+
+@functools.lru_cache(maxsize=64)
+def _build_last_seen_filter(value: str, minute_bucket: int) -> str:
+    """Build the last_seen FQL filter for a look-back value and UTC minute.
+
+    Args:
+        value: Key of LAST_SEEN_DURATIONS
+        minute_bucket: Minutes since the epoch the look-back is anchored to
+
+    Returns:
+        FQL filter string for last_seen
+    """
+    # Calculate timestamp: start of the current minute minus the duration, in
+    # epoch seconds, broken down to UTC fields without building datetimes
+    timestamp = time.gmtime(minute_bucket * 60 - _LAST_SEEN_SECONDS[value])
+
+    # Format as UTC timestamp: YYYY-MM-DDTHH:MM:SSZ (direct field formatting
+    # avoids strftime's format-string parsing and locale layer)
+    timestamp_str = (f"{timestamp.tm_year:04d}-{timestamp.tm_mon:02d}-{timestamp.tm_mday:02d}"
+                     f"T{timestamp.tm_hour:02d}:{timestamp.tm_min:02d}:{timestamp.tm_sec:02d}Z")
+
+    # Return FQL filter with >= comparison
+    return f"last_seen:>='{timestamp_str}'"
 
 
 def validate_last_seen(value: str) -> str:
     """Validate and convert last-seen argument to FQL filter with timestamp.
 
+    The look-back is anchored to the start of the current UTC minute, so every
+    parse within the same minute yields the identical (memoized) filter.
+
     Args:
         value: Last seen time period ('hour', '12 hours', 'day', 'week')
 
@@ -28,28 +78,13 @@ def validate_last_seen(value: str) -> str:
     Raises:
         argparse.ArgumentTypeError: If validation fails
     """
-    # Mapping from user input to timedelta
-    duration_map = {
-        'hour': timedelta(hours=1),
-        '12 hours': timedelta(hours=12),
-        'day': timedelta(days=1),
-        'week': timedelta(weeks=1)
-    }
-
-    if value not in duration_map:
+    if value not in LAST_SEEN_DURATIONS:
         raise argparse.ArgumentTypeError(
             f"Invalid last-seen value: {value}. "
             f"Valid values are: hour, 12 hours, day, week"
         )
 
-    # Calculate timestamp: current time minus the duration
-    timestamp = datetime.utcnow() - duration_map[value]
-
-    # Format as UTC timestamp: YYYY-MM-DDTHH:MM:SSZ
-    timestamp_str = timestamp.strftime('%Y-%m-%dT%H:%M:%SZ')
-
-    # Return FQL filter with >= comparison
-    return f"last_seen:>='{timestamp_str}'"
+    return _build_last_seen_filter(value, int(time.time() // 60))
 
 
 def validate_policy_types(value: str) -> str:
@@ -67,7 +102,9 @@ def validate_policy_types(value: str) -> str:
     Raises:
         argparse.ArgumentTypeError: If validation fails
     """
-    valid_types = {v['cli_name'] for v in POLICY_TYPE_REGISTRY.values()}
+    # Default and by far the most common value
+    if value == 'all':
+        return value
 
     # Split by comma and strip whitespace
     types = [t.strip() for t in value.split(',')]
@@ -81,16 +118,44 @@ def validate_policy_types(value: str) -> str:
         return value
 
     # Validate each type
-    invalid_types = [t for t in types if t not in valid_types]
+    invalid_types = [t for t in types if t not in VALID_POLICY_TYPES]
     if invalid_types:
         raise argparse.ArgumentTypeError(
             f"Invalid policy type(s): {', '.join(invalid_types)}. "
-            f"Valid types are: all, {', '.join(sorted(valid_types))}"
+            f"Valid types are: all, {_VALID_POLICY_TYPES_TEXT}"
         )
 
     return value
 
 
+def _choice(*allowed: str) -> dict:
+    """Build add_argument() keyword arguments restricting a value to ``allowed``.
+
+    Used instead of ``choices=[...]`` so membership is a frozenset lookup in a
+    ``type=`` validator. The metavar and error message match what argparse
+    renders for ``choices``.
+
+    Args:
+        *allowed: Accepted values, in display order
+
+    Returns:
+        Dict with ``type`` and ``metavar`` entries
+    """
+    allowed_set = frozenset(allowed)
+    allowed_text = ', '.join(map(repr, allowed))
+
+    def check(value: str) -> str:
+        if value not in allowed_set:
+            raise argparse.ArgumentTypeError(f"invalid choice: {value!r} (choose from {allowed_text})")
+        return value
+
+    return {'type': check, 'metavar': '{' + ','.join(allowed) + '}'}
+
+
+_OUTPUT_FORMAT_CHOICE = _choice('text', 'json', 'csv')
+_PLATFORM_CHOICE = _choice('Windows', 'Mac', 'Linux')
+
+
 # Sentinel used so global options attach to both the top-level parser and every
 # subparser WITHOUT their unspecified copies writing (and clobbering) the
 # namespace. Real defaults are applied once, post-parse, by
@@ -148,7 +213,7 @@ def _build_global_parser() -> argparse.ArgumentParser:
     # Output Options
     global_parser.add_argument(
         "--output-format",
-        choices=['text', 'json', 'csv'],
+        **_OUTPUT_FORMAT_CHOICE,
         default=argparse.SUPPRESS,
         help="Output format (default: text)"
     )
@@ -175,10 +240,14 @@ def _apply_global_defaults(args: argparse.Namespace) -> None:
     applies the real default for anything still missing, giving deterministic
     precedence regardless of whether the flag came before or after the
     subcommand.
+
+    Also derives ``json_output_mode`` once from the final ``output_format``:
+    any structured format (json/csv) suppresses rich console output.
     """
     for dest, default in GLOBAL_DEFAULTS.items():
         if not hasattr(args, dest):
             setattr(args, dest, default)
+    args.json_output_mode = args.output_format != 'text'
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -289,12 +358,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     policies_parser.add_argument(
         '-p', '--platform',
-        choices=['Windows', 'Mac', 'Linux'],
+        **_PLATFORM_CHOICE,
         help='Filter by platform'
     )
     policies_parser.add_argument(
         '-s', '--status',
-        choices=['passed', 'failed', 'ungradable'],
+        **_choice('passed', 'failed', 'ungradable'),
         help='Filter by grading status'
     )
     policies_parser.add_argument(
@@ -304,7 +373,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     policies_parser.add_argument(
         '--sort',
-        choices=['platform', 'name', 'score'],
+        **_choice('platform', 'name', 'score'),
         default='platform',
         help='Sort policies by: platform (default), name, or score'
     )
@@ -333,14 +402,14 @@ def build_parser() -> argparse.ArgumentParser:
     )
     hosts_parser.add_argument(
         '-p', '--platform',
-        choices=['Windows', 'Mac', 'Linux'],
+        **_PLATFORM_CHOICE,
         help='Client-side display filter (applied to cached data; does not reduce '
              'fetch cost): filter by platform'
     )
     hosts_parser.add_argument(
         '-s', '--status',
         dest='host_status',
-        choices=['all-passed', 'any-failed'],
+        **_choice('all-passed', 'any-failed'),
         help='Client-side display filter (applied to cached data; does not reduce '
              'fetch cost): filter hosts by policy status'
     )
@@ -366,7 +435,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     hosts_parser.add_argument(
         '--sort',
-        choices=['platform', 'hostname', 'status'],
+        **_choice('platform', 'hostname', 'status'),
         default='platform',
         help='Sort hosts by: platform (default), hostname, or status (failed first)'
     )
@@ -422,7 +491,7 @@ def build_parser() -> argparse.ArgumentParser:
     schema_parser.add_argument(
         'report_type',
         nargs='?',
-        choices=['host-details', 'policy-audit', 'host-summary', 'metrics'],
+        **_choice('host-details', 'policy-audit', 'host-summary', 'metrics'),
         help='Report type to generate schema for (default: generate all)'
     )
     schema_parser.add_argument(
@@ -492,13 +561,126 @@ def _resolve_config_path(explicit):
     return "config/config.yaml"
 
 
-def parse_arguments() -> argparse.Namespace:
+# Fast path for the common ``policy-audit <subcommand> [simple options]`` shape
+# (e.g. the container's ``policy-audit daemon -c ... -o ...``). Options map to
+# (dest, converter); a converter of None marks a store_true flag. Anything not
+# described here -- help, version, positionals, abbreviations, ``--opt=value``,
+# globals placed before the subcommand -- falls back to the full argparse tree.
+# The tables must mirror build_parser(); tests compare both paths.
+_FAST_GLOBAL_OPTIONS = {
+    '-c': ('config', str),
+    '--config': ('config', str),
+    '--client-id': ('client_id', str),
+    '--client-secret': ('client_secret', str),
+    '--base-url': ('base_url', str),
+    '--output-format': ('output_format', _OUTPUT_FORMAT_CHOICE['type']),
+    '--output-file': ('output_file', str),
+    '-v': ('verbose', None),
+    '--verbose': ('verbose', None),
+}
+
+_FAST_POLICY_TYPE_OPTIONS = {
+    '-t': ('policy_type', validate_policy_types),
+    '--type': ('policy_type', validate_policy_types),
+}
+
+# Subcommand -> (subcommand defaults, subcommand-specific options)
+_FAST_SUBCOMMANDS = {
+    'fetch': (
+        {'policy_type': 'all', 'product_types': None, 'host_groups': None,
+         'host_group_ids': None, 'tags': None, 'last_seen': None},
+        _FAST_POLICY_TYPE_OPTIONS,
+    ),
+    'policies': (
+        {'policy_type': 'all', 'platform': None, 'status': None, 'details': False,
+         'sort': 'platform', 'wide': True},
+        _FAST_POLICY_TYPE_OPTIONS,
+    ),
+    'hosts': (
+        {'policy_type': 'all', 'platform': None, 'host_status': None, 'host_groups': None,
+         'host_group_ids': None, 'tags': None, 'sort': 'platform', 'wide': True},
+        _FAST_POLICY_TYPE_OPTIONS,
+    ),
+    'regrade': (
+        {'policy_type': 'all'},
+        _FAST_POLICY_TYPE_OPTIONS,
+    ),
+    'daemon': (
+        {'output_dir': './output', 'health_port': None, 'immediate': False},
+        {
+            '-o': ('output_dir', str),
+            '--output-dir': ('output_dir', str),
+            '--health-port': ('health_port', int),
+            '--immediate': ('immediate', None),
+        },
+    ),
+}
+
+
+def _fast_parse_arguments(argv) -> Optional[argparse.Namespace]:
+    """Parse simple subcommand invocations without building the argparse tree.
+
+    Args:
+        argv: Argument list (without the program name)
+
+    Returns:
+        Parsed namespace (global defaults not yet applied), or None when the
+        invocation needs the full parser.
+    """
+    if not argv or argv[0] not in _FAST_SUBCOMMANDS:
+        return None
+
+    defaults, options = _FAST_SUBCOMMANDS[argv[0]]
+    args = argparse.Namespace(command=argv[0], **defaults)
+
+    tokens = iter(argv[1:])
+    for token in tokens:
+        spec = options.get(token) or _FAST_GLOBAL_OPTIONS.get(token)
+        if spec is None:
+            return None
+        dest, converter = spec
+        if converter is None:
+            setattr(args, dest, True)
+            continue
+        value = next(tokens, None)
+        if value is None or value.startswith('-'):
+            return None
+        try:
+            setattr(args, dest, converter(value))
+        except (ValueError, argparse.ArgumentTypeError):
+            # Let argparse produce its usual usage error
+            return None
+
+    return args
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_parser() -> argparse.ArgumentParser:
+    """Return a parser built once per process for :func:`parse_arguments`.
+
+    :func:`build_parser` still returns a fresh parser for callers that may
+    modify it.
+    """
+    return build_parser()
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
     """Parse command line arguments.
 
+    Simple subcommand invocations are handled by a table-driven fast path;
+    everything else goes through the full argparse parser.
+
+    Args:
+        argv: Argument list (defaults to ``sys.argv[1:]``)
+
     Returns:
         Parsed arguments namespace
     """
-    args = build_parser().parse_args()
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _fast_parse_arguments(argv)
+    if args is None:
+        args = _cached_parser().parse_args(argv)
     _apply_global_defaults(args)
     args.config = _resolve_config_path(args.config)
     return args
@@ -518,7 +700,7 @@ def load_configuration(args, ctx) -> dict:
         ConfigurationError: If configuration is invalid
     """
     try:
-        ctx.log_verbose(f"Loading configuration from {args.config}")
+        ctx.log_verbose(f"Loading configuration from {args.config} (YAML loader: {YamlSafeLoader.__name__})")
         config = read_config_from_yaml(args.config)
         setup_logging(config, worker_name="policy-audit")
         return config
@@ -528,7 +710,36 @@ def load_configuration(args, ctx) -> dict:
         raise ConfigurationError(f"Failed to load configuration: {e}") from e
 
 
-def build_api_credentials(args, config, required: bool = True) -> dict:
+@functools.lru_cache(maxsize=1)
+def _load_dotenv_once() -> bool:
+    """Load the nearest .env file into the environment, once per process.
+
+    Existing environment variables are never overridden by load_dotenv, so
+    re-reading the file on later calls (e.g. daemon reloads) would be a no-op.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    from dotenv import find_dotenv, load_dotenv
+
+    dotenv_path = find_dotenv()
+    if not dotenv_path:
+        return False
+    return load_dotenv(dotenv_path)
+
+
+# Credentials resolved by build_api_credentials: (ApiCreds field, CLI flag,
+# default used when the value is required but not provided). Each key is also
+# read from the <prefix><KEY> environment variable and the falcon_credentials
+# config section.
+_CREDENTIAL_FIELDS = (
+    ('client_id', '--client-id', None),
+    ('client_secret', '--client-secret', None),
+    ('base_url', '--base-url', 'US1'),
+)
+
+
+def build_api_credentials(args, config, required: bool = True) -> ApiCreds:
     """Build API credentials from arguments and config.
 
     Args:
@@ -537,75 +748,45 @@ def build_api_credentials(args, config, required: bool = True) -> dict:
         required: Whether credentials are required (False for cache-only operations)
 
     Returns:
-        API credentials dictionary (may be empty if not required and not provided)
+        ApiCreds (fields may be None if not required and not provided)
 
     Raises:
         ConfigurationError: If required=True and credentials are missing
     """
     # Load environment variables from .env file if present
-    load_dotenv()
+    _load_dotenv_once()
 
-    apicreds = {}
+    resolved = {}
+
+    # Credentials section of the config file, looked up once
+    falcon_config = config.get('falcon_credentials') or {}
 
     # Get environment variable prefix from config
-    prefix = config.get('falcon_credentials', {}).get('prefix', '')
-
-    # Client ID - Priority: CLI arg > ENV var > config file
-    if args.client_id:
-        apicreds['client_id'] = args.client_id
-    else:
-        # Try environment variable first
-        env_client_id = os.environ.get(prefix + 'CLIENT_ID')
-        if env_client_id:
-            apicreds['client_id'] = env_client_id
-        else:
-            # Fall back to config file
-            client_id = config.get('falcon_credentials', {}).get('client_id')
-            if client_id:
-                apicreds['client_id'] = client_id
-            elif required:
-                raise ConfigurationError(f"No client_id provided. Use --client-id, set {prefix}CLIENT_ID env var, or configure in YAML")
-
-    # Client Secret - Priority: CLI arg > ENV var > config file
-    if args.client_secret:
-        apicreds['client_secret'] = args.client_secret
-    else:
-        # Try environment variable first
-        env_client_secret = os.environ.get(prefix + 'CLIENT_SECRET')
-        if env_client_secret:
-            apicreds['client_secret'] = env_client_secret
-        else:
-            # Fall back to config file
-            client_secret = config.get('falcon_credentials', {}).get('client_secret')
-            if client_secret:
-                apicreds['client_secret'] = client_secret
-            elif required:
-                raise ConfigurationError(f"No client_secret provided. Use --client-secret, set {prefix}CLIENT_SECRET env var, or configure in YAML")
-
-    # Base URL - Priority: CLI arg > ENV var > config file
-    if args.base_url:
-        apicreds['base_url'] = args.base_url
-    else:
-        # Try environment variable first
-        env_base_url = os.environ.get(prefix + 'BASE_URL')
-        if env_base_url:
-            apicreds['base_url'] = env_base_url
-        else:
-            # Fall back to config file
-            base_url = config.get('falcon_credentials', {}).get('base_url')
-            if base_url:
-                apicreds['base_url'] = base_url
-            elif required:
-                # For API operations, default to US1 if not specified
-                apicreds['base_url'] = 'US1'
-            # For cache-only operations, base_url is optional and will be retrieved from cache
+    prefix = falcon_config.get('prefix', '')
+
+    for key, flag, required_default in _CREDENTIAL_FIELDS:
+        # Priority: CLI arg > ENV var > config file
+        value = getattr(args, key) or os.environ.get(prefix + key.upper()) or falcon_config.get(key)
+        if not value and required:
+            if required_default is None:
+                raise ConfigurationError(
+                    f"No {key} provided. Use {flag}, set {prefix}{key.upper()} env var, or configure in YAML"
+                )
+            value = required_default
+        # For cache-only operations, missing values are left unset (base_url
+        # is then retrieved from cache)
+        if value:
+            resolved[key] = value
 
-    return apicreds
+    return ApiCreds(**resolved)
 
 
 def setup_database(config, ctx):
     """Setup database connection.
 
+    Adapters are cached per backend configuration, so repeated setup within
+    one process (e.g. reloads) reuses the open connection while it is healthy.
+
     Args:
         config: Configuration dictionary
         ctx: CLI context
@@ -616,21 +797,29 @@ def setup_database(config, ctx):
     Raises:
         DatabaseError: If database connection fails
     """
+    from falcon_policy_scoring.factories.adapter_cache import connect_adapter, get_cached_adapter
+    from falcon_policy_scoring.factories.database_factory import DatabaseFactory
+
     try:
-        ctx.log_verbose("Connecting to database...")
         db_type = config.get('db', {}).get('type', 'tiny_db')
-        adapter = DatabaseFactory.create_adapter(db_type)
-        adapter.connect(config[DatabaseFactory.get_config_key(db_type)])
-        return adapter
+        db_config = config[DatabaseFactory.get_config_key(db_type)]
+
+        adapter = get_cached_adapter(db_type, db_config)
+        if adapter is not None:
+            ctx.log_verbose("Reusing database connection...")
+            return adapter
+
+        ctx.log_verbose("Connecting to database...")
+        return connect_adapter(db_type, db_config)
     except Exception as e:
         raise DatabaseError(f"Failed to connect to database: {e}") from e
 
 
-def setup_falcon_api(apicreds, ctx) -> Tuple[APIHarnessV2, str]:
+def setup_falcon_api(apicreds: ApiCreds, ctx) -> Tuple['APIHarnessV2', str]:
     """Setup Falcon API connection and get CID.
 
     Args:
-        apicreds: API credentials dictionary
+        apicreds: API credentials
         ctx: CLI context
 
     Returns:
@@ -639,21 +828,24 @@ def setup_falcon_api(apicreds, ctx) -> Tuple[APIHarnessV2, str]:
     Raises:
         ApiConnectionError: If API connection fails
     """
+    from falcon_policy_scoring.falconapi.cid import get_cid
+    from falcon_policy_scoring.falconapi.session import get_falcon_client
+
     try:
         ctx.log_verbose("Connecting to CrowdStrike Falcon API...")
-        falcon = APIHarnessV2(**apicreds)
+        falcon = get_falcon_client(**apicreds.to_kwargs())
         cid = get_cid(falcon)
         return falcon, cid
     except Exception as e:
         raise ApiConnectionError(f"Failed to connect to CrowdStrike API: {e}") from e
 
 
-def get_or_fetch_cid(adapter, apicreds, fetch_required, ctx):
+def get_or_fetch_cid(adapter, apicreds: ApiCreds, fetch_required, ctx):
     """Get CID from cache or fetch from API if needed.
 
     Args:
         adapter: Database adapter instance
-        apicreds: API credentials dictionary
+        apicreds: API credentials
         fetch_required: Boolean indicating if fetch operation is requested
         ctx: CLI context
 
@@ -664,48 +856,50 @@ def get_or_fetch_cid(adapter, apicreds, fetch_required, ctx):
         ApiConnectionError: If API connection fails when needed
         ConfigurationError: If CID cannot be retrieved from cache or API
     """
-    base_url = apicreds.get('base_url', 'US1')
-
-    # Try to get CID from cache first
-    cached_cid = adapter.get_cid(base_url)
+    base_url = apicreds.base_url or 'US1'
 
-    if cached_cid and not fetch_required:
-        # Use cached CID, no API connection needed
-        ctx.log_verbose(f"Using cached CID for {base_url}")
-        return None, cached_cid
+    # A fetch always connects to the API, so only consult the CID cache when
+    # its answer can be used
+    if not fetch_required:
+        cached_cid = adapter.get_cid(base_url)
+        if cached_cid:
+            # Use cached CID, no API connection needed
+            ctx.log_verbose(f"Using cached CID for {base_url}")
+            return None, cached_cid
 
     # Need to connect to API (either no cache or fetch requested)
-    if fetch_required or not cached_cid:
-        ctx.log_verbose("Connecting to CrowdStrike Falcon API to retrieve CID...")
-        try:
-            falcon = APIHarnessV2(**apicreds)
-            cid = get_cid(falcon)
-            # Cache the CID for future use
-            adapter.put_cid(cid, base_url)
-            return falcon, cid
-        except Exception as e:
-            raise ApiConnectionError(f"Failed to connect to CrowdStrike API: {e}") from e
+    ctx.log_verbose("Connecting to CrowdStrike Falcon API to retrieve CID...")
+    from falcon_policy_scoring.falconapi.cid import get_cid
+    from falcon_policy_scoring.falconapi.session import get_falcon_client
 
-    return None, cached_cid
+    try:
+        falcon = get_falcon_client(**apicreds.to_kwargs())
+        cid = get_cid(falcon)
+        # Cache the CID for future use
+        adapter.put_cid(cid, base_url)
+        return falcon, cid
+    except Exception as e:
+        raise ApiConnectionError(f"Failed to connect to CrowdStrike API: {e}") from e
 
 
-def setup_environment(args) -> CliContext:
+def setup_environment(args, ctx: Optional[CliContext] = None) -> CliContext:
     """Setup complete environment (config, database, API).
 
     Args:
         args: Parsed command line arguments
+        ctx: Existing CLI context to populate (a new one is created if omitted)
 
     Returns:
         CliContext with all environment setup complete
     """
-    # Create CLI context. Suppress rich console banners for any structured
-    # output format (json/csv) so stdout stays clean for machine consumption.
-    console = Console()
-    ctx = CliContext(
-        console=console,
-        verbose=args.verbose,
-        json_output_mode=(args.output_format != 'text')
-    )
+    # Suppress rich console banners for any structured output format
+    # (json/csv) so stdout stays clean for machine consumption.
+    if ctx is None:
+        ctx = CliContext(
+            console=get_console(),
+            verbose=args.verbose,
+            json_output_mode=(args.output_format != 'text')
+        )
 
     # Load configuration
     config = load_configuration(args, ctx)
@@ -769,4 +963,5 @@ def setup_environment(args) -> CliContext:
     ctx.adapter = adapter
     ctx.falcon = falcon
     ctx.cid = cid
+    ctx.base_url = apicreds.base_url or 'US1'
     return ctx
@@ -1,9 +1,50 @@
 """CLI context and configuration."""
-from dataclasses import dataclass
-from rich.console import Console
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from falcon_policy_scoring.utils.constants import DATACLASS_OPTIONS
 
-@dataclass
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_CONSOLE = None
+
+
+def get_console() -> 'Console':
+    """Return the process-wide Rich console, creating it on first use.
+
+    Console construction probes the terminal (size, color system, encoding),
+    so every CLI code path shares one instance instead of building its own.
+    """
+    global _CONSOLE  # pylint: disable=global-statement
+    if _CONSOLE is None:
+        from rich.console import Console
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class ApiCreds:
+    """Resolved CrowdStrike API credentials.
+
+    Attributes:
+        client_id: API client ID
+        client_secret: API client secret (omitted from repr)
+        base_url: Falcon cloud region or base URL
+
+    Any field may be None for cache-only commands, where credentials are
+    optional.
+    """
+    client_id: Optional[str] = None
+    client_secret: Optional[str] = field(default=None, repr=False)
+    base_url: Optional[str] = None
+
+    def to_kwargs(self) -> Dict[str, str]:
+        """Return the provided credentials as APIHarnessV2 keyword arguments."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name)}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class CliContext:
     """Context object for CLI operations.
 
@@ -14,10 +55,20 @@ class CliContext:
         console: Rich Console instance for output
         verbose: Whether verbose output is enabled
         json_output_mode: Whether JSON output mode is active
+        config: Loaded configuration dictionary (set by setup_environment)
+        adapter: Connected database adapter (set by setup_environment)
+        falcon: Falcon API client, or None for cache-only commands
+        cid: Customer ID the run operates on
+        base_url: Falcon cloud region the CID belongs to
     """
-    console: Console
+    console: 'Console'
     verbose: bool = False
     json_output_mode: bool = False
+    config: Optional[Dict] = None
+    adapter: Any = None
+    falcon: Any = None
+    cid: Optional[str] = None
+    base_url: Optional[str] = None
 
     def log_verbose(self, message: str):
         """Print verbose messages if verbose mode is enabled.
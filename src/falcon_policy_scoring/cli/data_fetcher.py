@@ -1,10 +1,16 @@
 """Data fetching operations for policy-audit CLI."""
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from falconpy import APIHarnessV2
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
 from falcon_policy_scoring.utils.policy_helpers import get_policy_status
 from falcon_policy_scoring.utils import host_data as host_data_utils
 
+# Best batch size learned per CID, reused as the starting point of later fetches
+# in the same process (e.g. subsequent daemon cycles).
+_LEARNED_BATCH_SIZES: Dict[str, int] = {}
+
 
 def find_host_by_name(adapter, cid: str, hostname: str) -> Optional[Dict]:
     """Search for a host by hostname.
@@ -14,12 +20,13 @@ def find_host_by_name(adapter, cid: str, hostname: str) -> Optional[Dict]:
     return host_data_utils.find_host_by_name(adapter, cid, hostname)
 
 
-def collect_host_data(adapter, cid: str, policy_records: Dict, config: Dict = None) -> List[Dict]:
+def collect_host_data(adapter, cid: str, policy_records: Dict, config: Dict = None,
+                      hosts_in_db: Optional[Dict] = None) -> List[Dict]:
     """Collect host data with policy status.
 
     Wrapper for utils function to maintain backward compatibility.
     """
-    return host_data_utils.collect_host_data(adapter, cid, policy_records, get_policy_status, config)
+    return host_data_utils.collect_host_data(adapter, cid, policy_records, get_policy_status, config, hosts_in_db)
 
 
 def calculate_host_stats(host_rows: List[Dict]) -> Dict:
@@ -38,8 +45,146 @@ def process_host_batch(falcon: APIHarnessV2, adapter, batch: List[str]) -> tuple
     return host_data_utils.process_host_batch(falcon, adapter, batch)
 
 
+class BatchSizeTuner:
+    """Grow the host-detail batch size while per-host latency keeps dropping.
+
+    Each full batch is timed; the batch size doubles (up to ``max_batch_size``)
+    for as long as the seconds-per-host figure improves. Once a larger batch is
+    no slower per host than the best seen so far, the tuner falls back to the
+    best size and stops adjusting.
+    """
+
+    def __init__(self, batch_size: int, max_batch_size: Optional[int] = None):
+        self.batch_size = batch_size
+        self.best_batch_size = batch_size
+        self.max_batch_size = max(batch_size, max_batch_size or batch_size)
+        self._best_latency = None
+        self._settled = self.batch_size >= self.max_batch_size
+
+    @classmethod
+    def for_cid(cls, cid: str, batch_size: int, max_batch_size: Optional[int] = None) -> 'BatchSizeTuner':
+        """Create a tuner starting from the size previously learned for ``cid``."""
+        learned = _LEARNED_BATCH_SIZES.get(cid, batch_size)
+        return cls(min(max(learned, batch_size), max_batch_size or batch_size), max_batch_size)
+
+    def remember(self, cid: str):
+        """Record the best batch size seen so far for ``cid``."""
+        _LEARNED_BATCH_SIZES[cid] = self.best_batch_size
+
+    def record(self, host_count: int, elapsed: float):
+        """Feed back the timing of one batch request."""
+        # Short (final) batches and batches requested before the last resize
+        # are not a fair sample of the current size.
+        if self._settled or host_count != self.batch_size:
+            return
+
+        latency = elapsed / host_count
+        if self._best_latency is not None and latency >= self._best_latency:
+            self.batch_size = self.best_batch_size
+            self._settled = True
+            return
+
+        self._best_latency = latency
+        self.best_batch_size = self.batch_size
+        self.batch_size = min(self.batch_size * 2, self.max_batch_size)
+        self._settled = self.batch_size == self.best_batch_size
+
+
+def _split_batches(host_ids: List[str], tuner: BatchSizeTuner) -> Iterator[List[str]]:
+    """Slice ``host_ids`` into batches sized by the tuner's current batch size."""
+    offset = 0
+    while offset < len(host_ids):
+        batch = host_ids[offset:offset + tuner.batch_size]
+        offset += len(batch)
+        yield batch
+
+
+def _timed_fetch(falcon: APIHarnessV2, batch: List[str]) -> Tuple[Optional[List[Dict]], float]:
+    """Fetch device details for a batch and return them with the elapsed time."""
+    start = time.perf_counter()
+    resources = host_data_utils.fetch_host_details(falcon, batch)
+    return resources, time.perf_counter() - start
+
+
+def iter_host_batches(falcon: APIHarnessV2, adapter, host_ids: List[str], batch_size: int,
+                      workers: int = 1,
+                      tuner: Optional[BatchSizeTuner] = None) -> Iterator[Tuple[List[str], int, int]]:
+    """Fetch and store host details batch by batch.
+
+    With more than one worker the device-details API calls run concurrently on
+    a bounded thread pool (clients from setup_falcon_api share one keep-alive
+    HTTP session across them), while every adapter write stays on the calling
+    thread, so adapters never need to be thread-safe. Batches complete in
+    arbitrary order.
+
+    Args:
+        falcon: FalconPy API client
+        adapter: Database adapter
+        host_ids: List of host IDs
+        batch_size: Batch size for API calls (ignored when ``tuner`` is given)
+        workers: Maximum number of concurrent API calls
+        tuner: Optional BatchSizeTuner that adapts the size of later batches
+
+    Yields:
+        Tuple of (batch, fetched_count, error_count) per completed batch
+    """
+    tuner = tuner or BatchSizeTuner(batch_size)
+    batches = _split_batches(host_ids, tuner)
+
+    if workers <= 1:
+        for batch in batches:
+            resources, elapsed = _timed_fetch(falcon, batch)
+            tuner.record(len(batch), elapsed)
+            yield (batch, *host_data_utils.store_host_details(adapter, batch, resources))
+        return
+
+    # Keep at most `workers` requests in flight so each new batch is sized
+    # with the latest tuning feedback.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        for batch in batches:
+            pending[executor.submit(_timed_fetch, falcon, batch)] = batch
+            if len(pending) >= workers:
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = pending.pop(future)
+                resources, elapsed = future.result()
+                tuner.record(len(batch), elapsed)
+
+                next_batch = next(batches, None)
+                if next_batch:
+                    pending[executor.submit(_timed_fetch, falcon, next_batch)] = next_batch
+
+                yield (batch, *host_data_utils.store_host_details(adapter, batch, resources))
+
+
+def _fetch_batches(falcon: APIHarnessV2, adapter, host_ids: List[str], batch_size: int,
+                   workers: int, tuner: Optional[BatchSizeTuner] = None,
+                   on_batch: Optional[Callable[[List[str]], None]] = None) -> Dict:
+    """Run :func:`iter_host_batches` to completion and total the counts."""
+    fetched_count = 0
+    error_count = 0
+
+    for batch, batch_fetched, batch_errors in iter_host_batches(falcon, adapter, host_ids,
+                                                                 batch_size, workers, tuner):
+        fetched_count += batch_fetched
+        error_count += batch_errors
+        if on_batch:
+            on_batch(batch)
+
+    return {
+        'total_hosts': len(host_ids),
+        'fetched': fetched_count,
+        'errors': error_count
+    }
+
+
 def fetch_hosts_with_progress(falcon: APIHarnessV2, adapter, host_ids: List[str],
-                              batch_size: int, ctx) -> Dict:
+                              batch_size: int, ctx,
+                              workers: int = 1, tuner: Optional[BatchSizeTuner] = None) -> Dict:
     """Fetch hosts with progress bar.
 
     Args:
@@ -48,13 +193,15 @@ def fetch_hosts_with_progress(falcon: APIHarnessV2, adapter, host_ids: List[str]
         host_ids: List of host IDs
         batch_size: Batch size for API calls
         ctx: CLI context
+        workers: Maximum number of concurrent API calls
+        tuner: Optional BatchSizeTuner that adapts the batch size as it goes
 
     Returns:
         Result dictionary with counts
     """
+    if tuner is not None:
+        batch_size = tuner.batch_size
     total_hosts = len(host_ids)
-    fetched_count = 0
-    error_count = 0
 
     ctx.console.print(f"[bold]Fetching details for {total_hosts:,} hosts in batches of {batch_size}...[/bold]")
 
@@ -69,23 +216,17 @@ def fetch_hosts_with_progress(falcon: APIHarnessV2, adapter, host_ids: List[str]
     ) as progress:
         task = progress.add_task("[cyan]Fetching host details...", total=total_hosts)
 
-        # Process in batches
-        for i in range(0, total_hosts, batch_size):
-            batch = host_ids[i:i + batch_size]
-            batch_fetched, batch_errors = process_host_batch(falcon, adapter, batch)
-            fetched_count += batch_fetched
-            error_count += batch_errors
-            progress.update(task, advance=len(batch))
+        results = _fetch_batches(
+            falcon, adapter, host_ids, batch_size, workers, tuner,
+            on_batch=lambda batch: progress.update(task, advance=len(batch))
+        )
 
-    return {
-        'total_hosts': total_hosts,
-        'fetched': fetched_count,
-        'errors': error_count
-    }
+    return results
 
 
 def fetch_hosts_simple(falcon: APIHarnessV2, adapter, host_ids: List[str],
-                       batch_size: int, ctx) -> Dict:
+                       batch_size: int, ctx, workers: int = 1,
+                       tuner: Optional[BatchSizeTuner] = None) -> Dict:
     """Fetch hosts without progress bar.
 
     Args:
@@ -94,25 +235,12 @@ def fetch_hosts_simple(falcon: APIHarnessV2, adapter, host_ids: List[str],
         host_ids: List of host IDs
         batch_size: Batch size for API calls
         ctx: CLI context
+        workers: Maximum number of concurrent API calls
+        tuner: Optional BatchSizeTuner that adapts the batch size as it goes
 
     Returns:
         Result dictionary with counts
     """
-    total_hosts = len(host_ids)
-    fetched_count = 0
-    error_count = 0
-
-    ctx.log_verbose(f"Fetching details for {total_hosts} hosts...")
-
-    # Process in batches
-    for i in range(0, total_hosts, batch_size):
-        batch = host_ids[i:i + batch_size]
-        batch_fetched, batch_errors = process_host_batch(falcon, adapter, batch)
-        fetched_count += batch_fetched
-        error_count += batch_errors
+    ctx.log_verbose(f"Fetching details for {len(host_ids)} hosts...")
 
-    return {
-        'total_hosts': total_hosts,
-        'fetched': fetched_count,
-        'errors': error_count
-    }
+    return _fetch_batches(falcon, adapter, host_ids, batch_size, workers, tuner)
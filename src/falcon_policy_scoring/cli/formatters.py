@@ -1,13 +1,43 @@
 """Formatters for displaying policy audit results."""
+import time
+from functools import lru_cache
 from rich.table import Table
-from typing import Dict, List, Optional
-from falcon_policy_scoring.utils.constants import Style, PolicyStatus, POLICY_TYPE_REGISTRY
+from rich.text import Text
+from typing import Dict, List, Optional, Union
+from falcon_policy_scoring.utils.constants import Style, PolicyStatus, POLICY_TYPE_REGISTRY, MAX_RICH_TABLE_ROWS
 from .helpers import calculate_score_percentage, get_platform_name
+from .plain_table import PlainTable
 from falcon_policy_scoring.utils.policy_helpers import calculate_policy_stats
 from falcon_policy_scoring.utils.cache_helpers import (
-    calculate_cache_age, get_policy_ttl, is_cache_expired, format_cache_display_with_ttl
+    calculate_cache_age, get_hosts_ttl, get_policy_ttl, is_cache_expired, format_cache_display_with_ttl
 )
-from falcon_policy_scoring.utils.models import CacheInfo
+from falcon_policy_scoring.utils.models import CacheInfo, HostFetchingConfig
+
+
+# Pre-rendered status cell markup: status -> (wide, compact)
+_STATUS_CELLS = {
+    PolicyStatus.PASSED.value: (f"[{Style.GREEN}]✓ PASSED[/{Style.GREEN}]", f"[{Style.GREEN}]✓[/{Style.GREEN}]"),
+    PolicyStatus.FAILED.value: (f"[{Style.RED}]✗ FAILED[/{Style.RED}]", f"[{Style.RED}]✗[/{Style.RED}]"),
+    "UNGRADABLE": (f"[{Style.YELLOW}]⚠ UNGRADABLE[/{Style.YELLOW}]", f"[{Style.YELLOW}]⚠[/{Style.YELLOW}]"),
+    PolicyStatus.NOT_GRADED.value: (f"[{Style.YELLOW}]NOT GRADED[/{Style.YELLOW}]", f"[{Style.YELLOW}]–[/{Style.YELLOW}]"),
+    "N/A": (f"[{Style.DIM}]— N/A[/{Style.DIM}]", f"[{Style.DIM}]—[/{Style.DIM}]"),
+}
+_STATUS_CELLS_WIDE = {status: cells[0] for status, cells in _STATUS_CELLS.items()}
+_STATUS_CELLS_COMPACT = {status: cells[1] for status, cells in _STATUS_CELLS.items()}
+
+# NO POLICY ASSIGNED (and any unrecognised status)
+_NO_POLICY_CELL_WIDE = f"[{Style.DIM}]NO POLICY[/{Style.DIM}]"
+_NO_POLICY_CELL_COMPACT = f"[{Style.DIM}]ⁿ/ₐ[/{Style.DIM}]"
+
+# Wide status cells pre-parsed once for Text assembly (no per-line markup parsing)
+_STATUS_TEXT_WIDE = {status: Text.from_markup(cell) for status, cell in _STATUS_CELLS_WIDE.items()}
+_NO_POLICY_TEXT_WIDE = Text.from_markup(_NO_POLICY_CELL_WIDE)
+
+
+@lru_cache(maxsize=16)
+def _pretty_policy_type(policy_type: str) -> str:
+    """Return a display title for a policy type (e.g. 'device_control' -> 'Device Control')."""
+    return policy_type.replace('_', ' ').title()
 
 
 def format_status_cell(status: str, wide: bool = True) -> str:
@@ -20,39 +50,29 @@ def format_status_cell(status: str, wide: bool = True) -> str:
     Returns:
         Formatted string with Rich color markup
     """
-    if status == PolicyStatus.PASSED.value:
-        return f"[{Style.GREEN}]✓ PASSED[/{Style.GREEN}]" if wide else f"[{Style.GREEN}]✓[/{Style.GREEN}]"
-    if status == PolicyStatus.FAILED.value:
-        return f"[{Style.RED}]✗ FAILED[/{Style.RED}]" if wide else f"[{Style.RED}]✗[/{Style.RED}]"
-    if status == "UNGRADABLE":
-        return f"[{Style.YELLOW}]⚠ UNGRADABLE[/{Style.YELLOW}]" if wide else f"[{Style.YELLOW}]⚠[/{Style.YELLOW}]"
-    if status == PolicyStatus.NOT_GRADED.value:
-        return f"[{Style.YELLOW}]NOT GRADED[/{Style.YELLOW}]" if wide else f"[{Style.YELLOW}]–[/{Style.YELLOW}]"
-    if status == "N/A":
-        return f"[{Style.DIM}]— N/A[/{Style.DIM}]" if wide else f"[{Style.DIM}]—[/{Style.DIM}]"
-    # NO POLICY ASSIGNED
-    return f"[{Style.DIM}]NO POLICY[/{Style.DIM}]" if wide else f"[{Style.DIM}]ⁿ/ₐ[/{Style.DIM}]"
+    if wide:
+        return _STATUS_CELLS_WIDE.get(status, _NO_POLICY_CELL_WIDE)
+    return _STATUS_CELLS_COMPACT.get(status, _NO_POLICY_CELL_COMPACT)
 
 
-def calculate_cache_info(graded_record: Dict, config: Dict, policy_type: str) -> CacheInfo:
-    """Calculate cache information for a graded policy record.
+# Sentinel for records without an 'epoch' field
+_NO_EPOCH = object()
 
-    Args:
-        graded_record: Graded policies record
-        config: Configuration dictionary
-        policy_type: Type of policy
 
-    Returns:
-        CacheInfo object with age and TTL information
+@lru_cache(maxsize=32)
+def _cache_info_for(epoch, ttl_seconds: int, now_second: int) -> CacheInfo:  # pylint: disable=unused-argument
+    """Build CacheInfo for a record epoch and TTL.
+
+    ``now_second`` only keys the cache, so repeated renders within the same
+    wall-clock second share one result while ages still advance between
+    renders in long-running processes.
     """
     cache_age_seconds = 0
     cache_age_display = "Unknown"
 
-    if 'epoch' in graded_record:
-        cache_age_seconds, cache_age_display = calculate_cache_age(graded_record['epoch'])
+    if epoch is not _NO_EPOCH:
+        cache_age_seconds, cache_age_display = calculate_cache_age(epoch)
 
-    # Get TTL for this policy type
-    ttl_seconds = get_policy_ttl(config, policy_type)
     cache_age_display = format_cache_display_with_ttl(cache_age_display, ttl_seconds)
 
     expired = is_cache_expired(cache_age_seconds, ttl_seconds)
@@ -65,6 +85,35 @@ def calculate_cache_info(graded_record: Dict, config: Dict, policy_type: str) ->
     )
 
 
+def calculate_cache_info(graded_record: Dict, config: Dict, policy_type: str) -> CacheInfo:
+    """Calculate cache information for a graded policy record.
+
+    Args:
+        graded_record: Graded policies record
+        config: Configuration dictionary
+        policy_type: Type of policy
+
+    Returns:
+        CacheInfo object with age and TTL information
+    """
+    # Get TTL for this policy type
+    ttl_seconds = get_policy_ttl(config, policy_type)
+    return _cache_info_for(graded_record.get('epoch', _NO_EPOCH), ttl_seconds, int(time.time()))
+
+
+def calculate_host_cache_info(hosts_record: Dict, config: Dict) -> CacheInfo:
+    """Calculate cache information for the stored host list record.
+
+    Args:
+        hosts_record: Host list record from ``adapter.get_hosts`` (with 'epoch')
+        config: Configuration dictionary
+
+    Returns:
+        CacheInfo object with age and TTL information
+    """
+    return _cache_info_for(hosts_record['epoch'], get_hosts_ttl(config), int(time.time()))
+
+
 _PLATFORM_ABBREV = {
     'Windows': 'Win',
     'Linux': 'Lin',
@@ -73,6 +122,22 @@ _PLATFORM_ABBREV = {
 }
 
 
+# Score and checks cell templates for policy table rows (%-formatted per row)
+_SCORE_PASSED_TEMPLATE = f"[{Style.GREEN}]%.1f%%[/{Style.GREEN}]"
+_SCORE_NEAR_MISS_TEMPLATE = f"[{Style.YELLOW}]%.1f%%[/{Style.YELLOW}]"
+_SCORE_FAILED_TEMPLATE = f"[{Style.RED}]%.1f%%[/{Style.RED}]"
+_SCORE_NA_CELL = f"[{Style.DIM}]N/A[/{Style.DIM}]"
+_SCORE_UNGRADABLE_CELL = f"[{Style.YELLOW}]N/A[/{Style.YELLOW}]"
+
+# (wide, compact) checks cell templates, formatted with (failures, checks)
+_CHECKS_PASSED_TEMPLATES = (f"[{Style.GREEN}]%s/%s[/{Style.GREEN}] failed", f"[{Style.GREEN}]%s/%s[/{Style.GREEN}]")
+_CHECKS_FAILED_TEMPLATES = (f"[{Style.RED}]%s/%s[/{Style.RED}] failed", f"[{Style.RED}]%s/%s[/{Style.RED}]")
+_PASSED_CELL_COMPACT = _STATUS_CELLS_COMPACT[PolicyStatus.PASSED.value]
+_FAILED_CELL_COMPACT = _STATUS_CELLS_COMPACT[PolicyStatus.FAILED.value]
+_UNGRADABLE_CELL_COMPACT = _STATUS_CELLS_COMPACT["UNGRADABLE"]
+_CHECKS_UNGRADABLE_CELLS = (f"[{Style.YELLOW}]ungradable[/{Style.YELLOW}]", f"[{Style.YELLOW}]N/A[/{Style.YELLOW}]")
+
+
 def format_policy_table_row(policy: Dict, wide: bool = True) -> tuple:
     """Format a single policy as a table row.
 
@@ -83,57 +148,54 @@ def format_policy_table_row(policy: Dict, wide: bool = True) -> tuple:
     Returns:
         Tuple of (status_icon, policy_name, platform, checks_display, score_display)
     """
+    get = policy.get
     platform_name = get_platform_name(policy)
-    if not wide:
-        platform_name = _PLATFORM_ABBREV.get(platform_name, platform_name)
+    policy_name = get('policy_name', 'Unknown')
 
-    policy_name = policy.get('policy_name', 'Unknown')
-    if not wide and len(policy_name) > 30:
-        policy_name = policy_name[:29] + '…'
-
-    checks_count = policy.get('checks_count', 0)
-    failures_count = policy.get('failures_count', 0)
-    grading_status = policy.get('grading_status', 'graded')
-
-    # Determine status
-    if grading_status == 'ungradable':
-        status = "UNGRADABLE"
-        score_display = "N/A"
-        score_style = Style.YELLOW
-        checks_display = "N/A" if not wide else "ungradable"
-        checks_style = Style.YELLOW
-        checks_suffix = ""
-    elif policy.get('passed', False):
-        status = "PASSED"
-        if checks_count > 0:
-            score_pct = calculate_score_percentage(checks_count, failures_count)
-            score_display = f"{score_pct:.1f}%"
-            score_style = Style.GREEN
-        else:
-            score_display = "N/A"
-            score_style = Style.DIM
-        checks_display = f"{failures_count}/{checks_count}"
-        checks_style = Style.GREEN
-        checks_suffix = "" if not wide else " failed"
+    # Template tuples are (wide, compact)
+    if wide:
+        variant = 0
     else:
-        status = "FAILED"
-        if checks_count > 0:
-            score_pct = calculate_score_percentage(checks_count, failures_count)
-            score_display = f"{score_pct:.1f}%"
-            score_style = Style.YELLOW if score_pct >= 80 else Style.RED
+        variant = 1
+        platform_name = _PLATFORM_ABBREV.get(platform_name, platform_name)
+        if len(policy_name) > 30:
+            policy_name = policy_name[:29] + '…'
+
+    if get('grading_status', 'graded') == 'ungradable':
+        return (
+            _UNGRADABLE_CELL_COMPACT,
+            policy_name,
+            platform_name,
+            _CHECKS_UNGRADABLE_CELLS[variant],
+            _SCORE_UNGRADABLE_CELL
+        )
+
+    checks_count = get('checks_count', 0)
+    failures_count = get('failures_count', 0)
+    passed = get('passed', False)
+
+    if checks_count > 0:
+        score_pct = calculate_score_percentage(checks_count, failures_count)
+        if passed:
+            score_cell = _SCORE_PASSED_TEMPLATE % score_pct
+        elif score_pct >= 80:
+            score_cell = _SCORE_NEAR_MISS_TEMPLATE % score_pct
         else:
-            score_display = "N/A"
-            score_style = Style.DIM
-        checks_display = f"{failures_count}/{checks_count}"
-        checks_style = Style.RED
-        checks_suffix = "" if not wide else " failed"
+            score_cell = _SCORE_FAILED_TEMPLATE % score_pct
+    else:
+        score_cell = _SCORE_NA_CELL
+
+    if passed:
+        status_cell, checks_template = _PASSED_CELL_COMPACT, _CHECKS_PASSED_TEMPLATES[variant]
+    else:
+        status_cell, checks_template = _FAILED_CELL_COMPACT, _CHECKS_FAILED_TEMPLATES[variant]
 
     return (
-        format_status_cell(status, wide=False),
+        status_cell,
         policy_name,
         platform_name,
-        f"[{checks_style}]{checks_display}[/{checks_style}]{checks_suffix}",
-        f"[{score_style}]{score_display}[/{score_style}]"
+        checks_template % (failures_count, checks_count),
+        score_cell
     )
 
 
@@ -152,8 +214,12 @@ def print_policy_table(graded_record: Dict, policy_type: str, config: Dict, poli
         ctx.console.print(f"[{Style.YELLOW}]No policies match the specified filters[/{Style.YELLOW}]\n")
         return
 
-    # Create table
-    table = Table(title=f"{policy_type.replace('_', ' ').title()} Policies", show_lines=True)
+    # Create table (borderless PlainTable when Rich's per-cell layout would be too slow)
+    title = f"{_pretty_policy_type(policy_type)} Policies"
+    if len(policies) > MAX_RICH_TABLE_ROWS:
+        table = PlainTable(title=title)
+    else:
+        table = Table(title=title, show_lines=True)
 
     if wide:
         table.add_column("Status", justify="center", style="bold", width=8)
@@ -181,22 +247,27 @@ def print_policy_table(graded_record: Dict, policy_type: str, config: Dict, poli
     # Calculate cache info
     cache_info = calculate_cache_info(graded_record, config, policy_type)
 
-    # Print summary
-    ctx.console.print(f"\n[{Style.BOLD}]Summary:[/{Style.BOLD}]")
-    ctx.console.print(f"  ✅ Passed: [{Style.GREEN}]{stats['passed_count']}[/{Style.GREEN}]")
-    ctx.console.print(f"  ❌ Failed: [{Style.RED}]{stats['failed_count']}[/{Style.RED}]")
+    # Print summary as one block
+    lines = [
+        f"\n[{Style.BOLD}]Summary:[/{Style.BOLD}]",
+        f"  ✅ Passed: [{Style.GREEN}]{stats['passed_count']}[/{Style.GREEN}]",
+        f"  ❌ Failed: [{Style.RED}]{stats['failed_count']}[/{Style.RED}]",
+    ]
     if stats.get('ungradable_count', 0) > 0:
-        ctx.console.print(f"  ⚠️  Ungradable: [{Style.YELLOW}]{stats['ungradable_count']}[/{Style.YELLOW}]")
+        lines.append(f"  ⚠️  Ungradable: [{Style.YELLOW}]{stats['ungradable_count']}[/{Style.YELLOW}]")
     if stats['total_checks'] > 0:
         overall_score = calculate_score_percentage(stats['total_checks'], stats['total_failures'])
-        ctx.console.print(f"  📊 Overall Score: {overall_score:.1f}%")
-    ctx.console.print(f"  🕒 Cache Age: [{Style.DIM}]{cache_info.age_display}[/{Style.DIM}]")
+        lines.append(f"  📊 Overall Score: {overall_score:.1f}%")
+    lines.append(f"  🕒 Cache Age: [{Style.DIM}]{cache_info.age_display}[/{Style.DIM}]")
 
-    # Print cache warning if expired
+    # Cache warning if expired, then the trailing blank line
     if cache_info.expired:
-        print_cache_warning(cache_info, ctx)
+        lines.append(_CACHE_WARNING_LINE)
+    lines.append("")
+    ctx.console.print("\n".join(lines))
+
 
-    ctx.console.print()
+_CACHE_WARNING_LINE = f"  [{Style.YELLOW}]⚠ Cache exceeded TTL. Consider using fetch subcommand to refresh[/{Style.YELLOW}]"
 
 
 def print_cache_warning(cache_info: CacheInfo, ctx):
@@ -206,7 +277,50 @@ def print_cache_warning(cache_info: CacheInfo, ctx):
         cache_info: Cache information
         ctx: CLI context
     """
-    ctx.console.print(f"  [{Style.YELLOW}]⚠ Cache exceeded TTL. Consider using fetch subcommand to refresh[/{Style.YELLOW}]")
+    ctx.console.print(_CACHE_WARNING_LINE)
+
+
+# Markup fragments used inside the per-policy / per-failure detail loops
+_BOLD_OPEN, _BOLD_CLOSE = f"[{Style.BOLD}]", f"[/{Style.BOLD}]"
+_FAILURE_MARK = f"    [{Style.RED}]✗[/{Style.RED}] "
+_POLICY_LABEL = f"{_BOLD_OPEN}Policy:{_BOLD_CLOSE} "
+_FAILED_STATUS_LINE = f"{_BOLD_OPEN}Status:{_BOLD_CLOSE} [{Style.RED}]FAILED[/{Style.RED}]"
+_UNGRADABLE_STATUS_LINE = f"{_BOLD_OPEN}Status:{_BOLD_CLOSE} [{Style.YELLOW}]UNGRADABLE[/{Style.YELLOW}]"
+_FAILED_CHECKS_LABEL = f"{_BOLD_OPEN}Failed Checks:{_BOLD_CLOSE} "
+_FAILURES_LINE = f"{_BOLD_OPEN}Failures:{_BOLD_CLOSE}"
+_REASON_LABEL = f"{_BOLD_OPEN}Reason:{_BOLD_CLOSE} "
+
+
+# Failure detail line templates (%-formatted per setting / failure)
+_SETTING_TEMPLATE = f"  [{Style.YELLOW}]• %s[/{Style.YELLOW}]"
+_SETTING_WITH_ID_TEMPLATE = _SETTING_TEMPLATE + " (%s)"
+_MISMATCH_FAILURE_TEMPLATE = _FAILURE_MARK + "%s != %s"
+
+# Threshold failure lines: ring_points is a ceiling, every other field a floor
+_MAXIMUM_FAILURE_TEMPLATE = _FAILURE_MARK + "%s: %s > %s (maximum)"
+_MINIMUM_FAILURE_TEMPLATE = _FAILURE_MARK + "%s: %s < %s (minimum)"
+_THRESHOLD_FAILURE_TEMPLATES = {'ring_points': _MAXIMUM_FAILURE_TEMPLATE}
+
+
+def _format_list_failures(setting_results: List[Dict], console_print):
+    """Print failures for list-shaped setting results (sensor_update, prevention, etc.)."""
+    template_for = _THRESHOLD_FAILURE_TEMPLATES.get
+    for setting_result in setting_results:
+        if setting_result.get('passed', True):
+            continue
+        console_print(_SETTING_WITH_ID_TEMPLATE % (setting_result['setting_name'], setting_result['setting_id']))
+        for failure in setting_result.get('failures', []):
+            field_name = failure['field']
+            console_print(template_for(field_name, _MINIMUM_FAILURE_TEMPLATE)
+                          % (field_name, failure['actual'], failure['minimum']))
+
+
+def _format_dict_failures(setting_results: Dict, console_print):
+    """Print failures for dict-shaped setting results (firewall, device_control, etc.)."""
+    for failure in setting_results.get('failures', ()):
+        console_print(_SETTING_TEMPLATE % (failure.get('field', '').replace('class.', ''),))
+        expected = failure.get('minimum', failure.get('expected', 'expected'))
+        console_print(_MISMATCH_FAILURE_TEMPLATE % (failure['actual'], expected))
 
 
 def format_failure_details(setting_results, ctx):
@@ -217,23 +331,12 @@ def format_failure_details(setting_results, ctx):
         ctx: CLI context
     """
     if isinstance(setting_results, list):
-        # List format (sensor_update, prevention, etc.)
-        for setting_result in setting_results:
-            if not setting_result.get('passed', True):
-                ctx.console.print(f"  [{Style.YELLOW}]• {setting_result['setting_name']}[/{Style.YELLOW}] ({setting_result['setting_id']})")
-                for failure in setting_result.get('failures', []):
-                    if failure.get('field') == 'ring_points':
-                        ctx.console.print(f"    [{Style.RED}]✗[/{Style.RED}] {failure['field']}: {failure['actual']} > {failure['minimum']} (maximum)")
-                    else:
-                        ctx.console.print(f"    [{Style.RED}]✗[/{Style.RED}] {failure['field']}: {failure['actual']} < {failure['minimum']} (minimum)")
+        handler = _format_list_failures
     elif isinstance(setting_results, dict):
-        # Dict format (firewall, device_control, etc.)
-        if 'failures' in setting_results:
-            for failure in setting_results['failures']:
-                field_name = failure.get('field', '').replace('class.', '')
-                ctx.console.print(f"  [{Style.YELLOW}]• {field_name}[/{Style.YELLOW}]")
-                expected = failure.get('minimum', failure.get('expected', 'expected'))
-                ctx.console.print(f"    [{Style.RED}]✗[/{Style.RED}] {failure['actual']} != {expected}")
+        handler = _format_dict_failures
+    else:
+        return
+    handler(setting_results, ctx.console.print)
 
 
 def print_policy_details(graded_record: Dict, policy_type: str, ctx):
@@ -247,46 +350,56 @@ def print_policy_details(graded_record: Dict, policy_type: str, ctx):
     if not graded_record or 'graded_policies' not in graded_record:
         return
 
-    failed_policies = [p for p in graded_record['graded_policies']
-                       if p.get('grading_status', 'graded') == 'graded' and not p.get('passed', True)]
-    ungradable_policies = [p for p in graded_record['graded_policies']
-                           if p.get('grading_status') == 'ungradable']
+    title = _pretty_policy_type(policy_type)
 
-    if not failed_policies and not ungradable_policies:
-        ctx.console.print(f"[{Style.GREEN}]All {policy_type.replace('_', ' ').title()} policies passed! ✓[/{Style.GREEN}]\n")
-        return
+    # Print failed policies as they are found; ungradable ones are listed after
+    printed_header = False
+    ungradable_policies = []
+    for policy_result in graded_record['graded_policies']:
+        grading_status = policy_result.get('grading_status', 'graded')
+        if grading_status == 'ungradable':
+            ungradable_policies.append(policy_result)
+            continue
+        if grading_status != 'graded' or policy_result.get('passed', True):
+            continue
 
-    # Print failed policies
-    if failed_policies:
-        ctx.console.print(f"\n[{Style.BOLD}][{Style.RED}]Failed {policy_type.replace('_', ' ').title()} Policies - Detailed Results:[/{Style.RED}][/{Style.BOLD}]\n")
+        if not printed_header:
+            ctx.console.print(f"\n[{Style.BOLD}][{Style.RED}]Failed {title} Policies - Detailed Results:[/{Style.RED}][/{Style.BOLD}]\n")
+            printed_header = True
 
-        for policy_result in failed_policies:
-            platform_name = get_platform_name(policy_result)
+        platform_name = get_platform_name(policy_result)
 
-            ctx.console.print(f"[{Style.BOLD}]Policy:[/{Style.BOLD}] {policy_result.get('policy_name', 'Unknown')} ({platform_name})")
-            ctx.console.print(f"[{Style.BOLD}]Status:[/{Style.BOLD}] [{Style.RED}]FAILED[/{Style.RED}]")
-            ctx.console.print(f"[{Style.BOLD}]Failed Checks:[/{Style.BOLD}] {policy_result.get('failures_count', 0)}/{policy_result.get('checks_count', 0)}\n")
+        ctx.console.print(f"{_POLICY_LABEL}{policy_result.get('policy_name', 'Unknown')} ({platform_name})")
+        ctx.console.print(_FAILED_STATUS_LINE)
+        ctx.console.print(f"{_FAILED_CHECKS_LABEL}{policy_result.get('failures_count', 0)}/{policy_result.get('checks_count', 0)}\n")
 
-            ctx.console.print(f"[{Style.BOLD}]Failures:[/{Style.BOLD}]")
+        ctx.console.print(_FAILURES_LINE)
 
+        # A recorded zero failure count means there are no failed settings to walk
+        if policy_result.get('failures_count') != 0:
             format_failure_details(policy_result.get('setting_results', []), ctx)
 
-            ctx.console.print()
+        ctx.console.print()
+
+    if not printed_header and not ungradable_policies:
+        ctx.console.print(f"[{Style.GREEN}]All {title} policies passed! ✓[/{Style.GREEN}]\n")
+        return
 
     # Print ungradable policies
     if ungradable_policies:
-        ctx.console.print(f"\n[{Style.BOLD}][{Style.YELLOW}]Ungradable {policy_type.replace('_', ' ').title()} Policies - Details:[/{Style.YELLOW}][/{Style.BOLD}]\n")
+        ctx.console.print(f"\n[{Style.BOLD}][{Style.YELLOW}]Ungradable {title} Policies - Details:[/{Style.YELLOW}][/{Style.BOLD}]\n")
 
         for policy_result in ungradable_policies:
             platform_name = get_platform_name(policy_result)
             reason = policy_result.get('ungradable_reason', 'unknown')
 
-            ctx.console.print(f"[{Style.BOLD}]Policy:[/{Style.BOLD}] {policy_result.get('policy_name', 'Unknown')} ({platform_name})")
-            ctx.console.print(f"[{Style.BOLD}]Status:[/{Style.BOLD}] [{Style.YELLOW}]UNGRADABLE[/{Style.YELLOW}]")
-            ctx.console.print(f"[{Style.BOLD}]Reason:[/{Style.BOLD}] {reason.replace('_', ' ').title()}\n")
+            ctx.console.print(f"{_POLICY_LABEL}{policy_result.get('policy_name', 'Unknown')} ({platform_name})")
+            ctx.console.print(_UNGRADABLE_STATUS_LINE)
+            ctx.console.print(f"{_REASON_LABEL}{reason.replace('_', ' ').title()}\n")
 
 
-def build_host_table(host_rows: List[Dict], ctx, config: Dict = None, policy_types: List[str] = None, wide: bool = True) -> Table:
+def build_host_table(host_rows: List[Dict], ctx, config: Dict = None, policy_types: List[str] = None,
+                     wide: bool = True) -> Union[Table, PlainTable]:
     """Build a Rich table for host policy status.
 
     Args:
@@ -298,13 +411,16 @@ def build_host_table(host_rows: List[Dict], ctx, config: Dict = None, policy_typ
               If False, use abbreviated headers and compact status symbols.
 
     Returns:
-        Rich Table object
+        Rich Table object, or a PlainTable above MAX_RICH_TABLE_ROWS rows
     """
     # Default to all policy types if not specified (gradable only — matches historical behaviour)
     if policy_types is None:
         policy_types = [k for k, v in POLICY_TYPE_REGISTRY.items() if v.get('gradable', True)]
 
-    table = Table(title="Host Policy Status", show_lines=True)
+    if len(host_rows) > MAX_RICH_TABLE_ROWS:
+        table = PlainTable(title="Host Policy Status")
+    else:
+        table = Table(title="Host Policy Status", show_lines=True)
     table.add_column("Hostname", style=Style.CYAN, width=30)
     table.add_column("OS" if not wide else "Platform", justify="center", width=4 if not wide else 12)
 
@@ -314,44 +430,69 @@ def build_host_table(host_rows: List[Dict], ctx, config: Dict = None, policy_typ
         for k, v in POLICY_TYPE_REGISTRY.items()
     ]
 
-    # Add only the requested policy columns
+    # Add only the requested policy columns (registry order; set for membership)
+    requested_types = frozenset(policy_types)
     active_columns = []
     for policy_type, wide_name, narrow_name, status_key, narrow_width in policy_columns:
-        if policy_type in policy_types:
+        if policy_type in requested_types:
             col_name = wide_name if wide else narrow_name
             col_width = 15 if wide else narrow_width
             table.add_column(col_name, justify="center", width=col_width)
             active_columns.append(status_key)
 
     # Add Zero Trust column if enabled
-    include_zta = config.get('host_fetching', {}).get('include_zta', True) if config else True
+    include_zta = HostFetchingConfig.from_config(config).include_zta
     if include_zta:
         table.add_column("ZTA" if not wide else "Zero Trust", justify="center", width=9 if not wide else 18)
 
-    for row in host_rows:
-        platform_val = row['platform']
-        if not wide:
-            platform_val = _PLATFORM_ABBREV.get(platform_val, platform_val)
-        row_data = [
-            row['hostname'],
-            platform_val
-        ]
-
-        # Add only the active policy columns
-        for status_key in active_columns:
-            row_data.append(format_status_cell(row[status_key], wide=wide))
+    # Render column by column, then zip the columns back into rows
+    status_cells = _STATUS_CELLS_WIDE if wide else _STATUS_CELLS_COMPACT
+    no_policy_cell = _NO_POLICY_CELL_WIDE if wide else _NO_POLICY_CELL_COMPACT
+    platform_abbrev = {} if wide else _PLATFORM_ABBREV
 
-        if include_zta:
-            row_data.append(format_zta_cell(row.get('zta_assessment'), wide=wide))
+    columns = [
+        [row['hostname'] for row in host_rows],
+        [platform_abbrev.get(row['platform'], row['platform']) for row in host_rows],
+    ]
+    columns.extend(
+        [status_cells.get(row[status_key], no_policy_cell) for row in host_rows]
+        for status_key in active_columns
+    )
+    if include_zta:
+        columns.append([format_zta_cell(row.get('zta_assessment'), wide=wide) for row in host_rows])
 
-        table.add_row(*row_data)
+    add_row = table.add_row
+    for cells in zip(*columns):
+        add_row(*cells)
 
     return table
 
 
+@lru_cache(maxsize=4096)
+def _format_zta_scores(sensor_config: Optional[int], os_score: Optional[int],
+                       overall: Optional[int], wide: bool) -> str:
+    """Render ZTA scores (None for a non-integer score) as cell markup."""
+    if not wide:
+        sensor_str = "-" if sensor_config is None else str(sensor_config)
+        os_str = "-" if os_score is None else str(os_score)
+        overall_str = "-" if overall is None else str(overall)
+        return f"[dim]{sensor_str}/{os_str}[/dim]:[bold]{overall_str}[/bold]"
+
+    # Format each number with 3-character width, right-aligned
+    sensor_str = "  -" if sensor_config is None else f"{sensor_config:>3}"
+    os_str = "  -" if os_score is None else f"{os_score:>3}"
+    overall_str = "  -" if overall is None else f"{overall:>3}"
+
+    # Format: dim (XXX/XXX) then bold XXX
+    return f"[dim]({sensor_str}/{os_str})[/dim] [bold]{overall_str}[/bold]"
+
+
 def format_zta_cell(zta_assessment: Optional[Dict], wide: bool = True) -> str:
     """Format Zero Trust Assessment cell with aligned scores.
 
+    Scores are 0-100 integers, so the rendered markup is memoized per score
+    triple.
+
     Args:
         zta_assessment: Zero Trust Assessment dictionary containing sensor_config, os, and overall scores
         wide: If True, use full format; if False, use compact format
@@ -366,19 +507,44 @@ def format_zta_cell(zta_assessment: Optional[Dict], wide: bool = True) -> str:
     os_score = zta_assessment.get('os', 0)
     overall = zta_assessment.get('overall', 0)
 
-    if not wide:
-        sensor_str = str(sensor_config) if isinstance(sensor_config, int) else "-"
-        os_str = str(os_score) if isinstance(os_score, int) else "-"
-        overall_str = str(overall) if isinstance(overall, int) else "-"
-        return f"[dim]{sensor_str}/{os_str}[/dim]:[bold]{overall_str}[/bold]"
+    # Exact type checks: faster than isinstance and keep bools out of the
+    # score cache (True == 1 would otherwise share a cache entry).
+    # pylint: disable=unidiomatic-typecheck
+    if type(sensor_config) is int and type(os_score) is int and type(overall) is int:
+        return _format_zta_scores(sensor_config, os_score, overall, wide)
+
+    return _format_zta_scores(
+        sensor_config if type(sensor_config) is int else None,
+        os_score if type(os_score) is int else None,
+        overall if type(overall) is int else None,
+        wide
+    )
 
-    # Format each number with 3-character width, right-aligned
-    sensor_str = f"{sensor_config:>3}" if isinstance(sensor_config, int) else "  -"
-    os_str = f"{os_score:>3}" if isinstance(os_score, int) else "  -"
-    overall_str = f"{overall:>3}" if isinstance(overall, int) else "  -"
 
-    # Format: dim (XXX/XXX) then bold XXX
-    return f"[dim]({sensor_str}/{os_str})[/dim] [bold]{overall_str}[/bold]"
+def print_host_policy_details(host_info: Dict, detail_rows: List[tuple], ctx):
+    """Print one host's per-policy assignment and status block.
+
+    The block is assembled from styled Text pieces and pre-parsed status cells,
+    so Rich does not re-parse markup for every line, and is written once.
+    Policy names are rendered literally.
+
+    Args:
+        host_info: Host lookup result with 'device_id' and 'device_data'
+        detail_rows: (display name, policy name, status, note lines) per policy type
+        ctx: CLI context
+    """
+    device_data = host_info['device_data']
+    lines = [
+        Text(f"\nPolicy Details for Host: {device_data.get('hostname', 'Unknown')}", style="bold cyan"),
+        Text(f"Device ID: {host_info['device_id']}", style=Style.DIM),
+        Text(f"Platform: {device_data.get('platform_name', 'Unknown')}\n", style=Style.DIM),
+    ]
+    for display_name, policy_name, status, note_lines in detail_rows:
+        lines.append(Text.assemble((f"{display_name} Policy:", Style.BOLD), f" {policy_name}"))
+        lines.append(Text.assemble("  Status: ", _STATUS_TEXT_WIDE.get(status, _NO_POLICY_TEXT_WIDE)))
+        lines.extend(Text(note) for note in note_lines)
+        lines.append(Text())
+    ctx.console.print(Text("\n").join(lines))
 
 
 def print_host_stats(stats: Dict, cache_info: CacheInfo, ctx):
@@ -389,13 +555,14 @@ def print_host_stats(stats: Dict, cache_info: CacheInfo, ctx):
         cache_info: Cache information
         ctx: CLI context
     """
-    ctx.console.print(f"\n[{Style.BOLD}]Host Summary:[/{Style.BOLD}]")
-    ctx.console.print(f"  Total Hosts: {stats['total']}")
-    ctx.console.print(f"  ✅ All Policies Passed: [{Style.GREEN}]{stats['all_passed']}[/{Style.GREEN}]")
-    ctx.console.print(f"  ❌ Any Policy Failed: [{Style.RED}]{stats['any_failed']}[/{Style.RED}]")
-    ctx.console.print(f"  🕒 Cache Age: [{Style.DIM}]{cache_info.age_display}[/{Style.DIM}]")
-
+    lines = [
+        f"\n[{Style.BOLD}]Host Summary:[/{Style.BOLD}]",
+        f"  Total Hosts: {stats['total']}",
+        f"  ✅ All Policies Passed: [{Style.GREEN}]{stats['all_passed']}[/{Style.GREEN}]",
+        f"  ❌ Any Policy Failed: [{Style.RED}]{stats['any_failed']}[/{Style.RED}]",
+        f"  🕒 Cache Age: [{Style.DIM}]{cache_info.age_display}[/{Style.DIM}]",
+    ]
     if cache_info.expired:
-        print_cache_warning(cache_info, ctx)
-
-    ctx.console.print()
+        lines.append(_CACHE_WARNING_LINE)
+    lines.append("")
+    ctx.console.print("\n".join(lines))
@@ -1,11 +1,16 @@
 """Operations for fetching and grading policies and hosts."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from types import SimpleNamespace
 from falcon_policy_scoring.falconapi.hosts import Hosts
 from falcon_policy_scoring.falconapi.host_group import HostGroup
-from falcon_policy_scoring.falconapi.zero_trust import fetch_zero_trust_assessments
+from falcon_policy_scoring.falconapi.zero_trust import iter_zero_trust_assessments
 from falcon_policy_scoring.utils.policy_registry import get_policy_registry
 from falcon_policy_scoring.grading.engine import load_grading_config, POLICY_GRADERS, DEFAULT_GRADING_CONFIGS
 from falcon_policy_scoring.falconapi.policies import get_policy_table_name
-from falcon_policy_scoring.utils.constants import Style, DEFAULT_PROGRESS_THRESHOLD, DEFAULT_BATCH_SIZE
+from falcon_policy_scoring.utils.constants import Style, DEFAULT_POLICY_FETCH_WORKERS
+from falcon_policy_scoring.utils.models import HostFetchingConfig, HostFilters
 from .helpers import parse_host_groups, parse_host_group_ids, parse_tags
 
 
@@ -27,9 +32,8 @@ def parse_product_types(product_types_arg):
     return ['Workstation', 'Domain Controller', 'Server']
 
 
-def fetch_and_store_hosts(falcon, adapter, cid: str, product_types, config, ctx,
-                          host_group_names=None, last_seen_filter=None,
-                          host_group_ids=None, tags=None):
+def fetch_and_store_hosts(falcon, adapter, cid: str, product_types, host_fetching: HostFetchingConfig, ctx,
+                          filters: HostFilters = None, on_host_ids=None):
     """Fetch and store hosts from CrowdStrike API.
 
     Host group and tag filtering are applied server-side in the FQL query so the
@@ -42,24 +46,26 @@ def fetch_and_store_hosts(falcon, adapter, cid: str, product_types, config, ctx,
         adapter: Database adapter
         cid: Customer ID
         product_types: List of product types to filter
-        config: Configuration dictionary
+        host_fetching: Host fetching settings (batch sizes, workers, progress threshold)
         ctx: CLI context
-        host_group_names: Optional list of host group names to resolve to IDs and filter by
-        last_seen_filter: Optional FQL filter for last_seen time period
-        host_group_ids: Optional list of host group IDs to filter by directly
-        tags: Optional list of normalized Falcon tags to filter by
+        filters: Optional server-side host filters (host groups, last seen, tags)
+        on_host_ids: Optional callable given the host ID list as soon as it is
+            stored, before host details are fetched
 
     Returns:
-        Results dictionary with counts
+        Results dictionary with counts, plus the fetched ``host_ids`` list
     """
-    from .data_fetcher import fetch_hosts_with_progress, fetch_hosts_simple
+    from .data_fetcher import fetch_hosts_with_progress, fetch_hosts_simple, BatchSizeTuner
 
     ctx.log_verbose("Fetching hosts...")
+    filters = filters or HostFilters()
+    host_group_names = filters.host_group_names
+    tags = filters.tags
 
     # Resolve host group names to IDs (cheap lookup, no member fetch) and union
     # with any explicitly-supplied group IDs. These feed the server-side FQL
     # groups: clause.
-    group_ids = list(host_group_ids) if host_group_ids else []
+    group_ids = list(filters.host_group_ids) if filters.host_group_ids else []
     if host_group_names:
         ctx.log_verbose(f"Resolving host groups to IDs: {', '.join(host_group_names)}")
 
@@ -82,28 +88,40 @@ def fetch_and_store_hosts(falcon, adapter, cid: str, product_types, config, ctx,
         ctx.log_verbose(f"Filtering by tags server-side: {', '.join(tags)}")
 
     # Get host list (all filtering applied server-side in FQL)
-    hosts_api = Hosts(cid, falcon, filter_str=last_seen_filter, product_types=product_types,
+    hosts_api = Hosts(cid, falcon, filter_str=filters.last_seen_filter, product_types=product_types,
                       group_ids=group_ids, tags=tags)
     hosts_list = hosts_api.get_devices()
     adapter.put_hosts(hosts_list)
 
     host_ids = hosts_list.get('hosts', [])
     total_hosts = len(host_ids)
+    if on_host_ids:
+        on_host_ids(host_ids)
 
-    # Get batch settings
-    batch_size = config.get('host_fetching', {}).get('batch_size', DEFAULT_BATCH_SIZE)
-    progress_threshold = config.get('host_fetching', {}).get('progress_threshold', DEFAULT_PROGRESS_THRESHOLD)
+    batch_size = host_fetching.batch_size
+
+    # Start from the batch size learned on earlier fetches for this CID and keep
+    # growing it while per-host latency drops
+    tuner = BatchSizeTuner.for_cid(cid, batch_size, host_fetching.max_batch_size)
 
     # Fetch host details
-    if total_hosts > progress_threshold:
-        results = fetch_hosts_with_progress(falcon, adapter, host_ids, batch_size, ctx)
+    if total_hosts > host_fetching.progress_threshold:
+        results = fetch_hosts_with_progress(falcon, adapter, host_ids, batch_size, ctx,
+                                            workers=host_fetching.workers, tuner=tuner)
     else:
-        results = fetch_hosts_simple(falcon, adapter, host_ids, batch_size, ctx)
+        results = fetch_hosts_simple(falcon, adapter, host_ids, batch_size, ctx,
+                                     workers=host_fetching.workers, tuner=tuner)
+
+    tuner.remember(cid)
+    ctx.log_verbose(f"Host detail batch size settled at {tuner.best_batch_size}")
 
+    # Hand the ID list back so callers need not re-read the host record just stored
+    results['host_ids'] = host_ids
     return results
 
 
-def fetch_and_store_zta(falcon, adapter, host_ids: list, ctx):
+def fetch_and_store_zta(falcon, adapter, host_ids: list, ctx, show_status: bool = True,
+                        cancel_event: threading.Event = None):
     """Fetch and store Zero Trust Assessment data for hosts.
 
     Args:
@@ -111,6 +129,10 @@ def fetch_and_store_zta(falcon, adapter, host_ids: list, ctx):
         adapter: Database adapter
         host_ids: List of device IDs to fetch ZTA data for
         ctx: CLI context
+        show_status: Show a status spinner (disable when another live display,
+            such as the host progress bar, may be running)
+        cancel_event: Optional event checked between API batches; once set, no
+            further batches are requested
 
     Returns:
         Results dictionary with counts
@@ -121,21 +143,114 @@ def fetch_and_store_zta(falcon, adapter, host_ids: list, ctx):
 
     ctx.log_verbose(f"Fetching Zero Trust Assessments for {len(host_ids)} hosts...")
 
-    with ctx.console.status(f"[{Style.BOLD}][{Style.GREEN}]Fetching Zero Trust Assessments...[/{Style.GREEN}][/{Style.BOLD}]"):
-        result = fetch_zero_trust_assessments(falcon, host_ids)
+    fetched = 0
+    errors = []
+    with _status_spinner(ctx, "Fetching Zero Trust Assessments...") if show_status else nullcontext():
+        # Store each batch as it arrives rather than holding every assessment
+        for batch in iter_zero_trust_assessments(falcon, host_ids, errors):
+            adapter.put_many_host_zta(batch)
+            fetched += len(batch)
+            if cancel_event is not None and cancel_event.is_set():
+                ctx.log_verbose("Zero Trust Assessment fetch cancelled")
+                break
 
-    # Store each assessment
-    for device_id, assessment_data in result['assessments'].items():
-        adapter.put_host_zta(device_id, assessment_data)
-
-    ctx.log_verbose(f"Stored {result['count']} ZTA assessments")
+    ctx.log_verbose(f"Stored {fetched} ZTA assessments")
 
     return {
-        'fetched': result['count'],
-        'errors': len(result.get('errors', []))
+        'fetched': fetched,
+        'errors': len(errors)
     }
 
 
+class _SerializedAdapter:
+    """Proxy that lets worker threads share one database adapter.
+
+    Every method call on the wrapped adapter runs under a single lock, so
+    adapters that are not thread-safe (shared SQLite cursor, TinyDB file)
+    see one call at a time while API calls in other threads proceed.
+    """
+
+    def __init__(self, adapter):
+        self._adapter = adapter
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._adapter, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return locked
+
+
+_NO_STATUS = SimpleNamespace(update=lambda *args, **kwargs: None)
+
+
+def _status_spinner(ctx, message: str):
+    """Return a console status spinner, or a no-op stand-in in JSON output mode.
+
+    Both support ``with ... as status`` and ``status.update(...)``.
+    """
+    if ctx.json_output_mode:
+        return nullcontext(_NO_STATUS)
+    return ctx.console.status(f"[{Style.BOLD}][{Style.GREEN}]{message}[/{Style.GREEN}][/{Style.BOLD}]")
+
+
+def _iter_resolved_policy_types(policy_types: list, policy_registry):
+    """Yield registry keys for policy type arguments, skipping unknown names.
+
+    'all' expands to every registered type; otherwise each argument may be an
+    internal key (e.g., 'prevention') or a CLI name
+    (e.g., 'sensor-update' -> 'sensor_update').
+    """
+    if 'all' in policy_types:
+        yield from policy_registry.get_all_types()
+        return
+
+    for policy_type in policy_types:
+        key = policy_type if policy_registry.get(policy_type) else policy_registry.get_key_by_cli_name(policy_type)
+        if key:
+            yield key
+
+
+def _print_policy_fetch_result(policy_info, result: dict, ctx):
+    """Print the one-line outcome of fetching and grading a policy type."""
+    if result.get('permission_error'):
+        # Show permission error with assist message
+        ctx.console.print(
+            f"[{Style.YELLOW}]⚠ Failed to fetch {policy_info.display_name} policies[/{Style.YELLOW}]"
+        )
+        assist_msg = result.get('assist_message')
+        if assist_msg:
+            ctx.console.print(f"[{Style.YELLOW}]{assist_msg}[/{Style.YELLOW}]")
+    elif result.get('grade_success'):
+        passed = result.get('passed_policies', 0)
+        failed = result.get('failed_policies', 0)
+        ungradable = result.get('ungradable_policies', 0)
+        total = result.get('policies_count', 0)
+
+        status_parts = [f"{passed}/{total} passed"]
+        if failed > 0:
+            status_parts.append(f"{failed} failed")
+        if ungradable > 0:
+            status_parts.append(f"{ungradable} ungradable")
+
+        ctx.console.print(
+            f"[{Style.BOLD}][{Style.GREEN}]✓ {policy_info.display_name} Policies: "
+            f"{', '.join(status_parts)}[/{Style.GREEN}][/{Style.BOLD}]"
+        )
+    elif result.get('fetch_success'):
+        ctx.console.print(
+            f"[{Style.YELLOW}]⚠ {policy_info.display_name} policies fetched but not graded[/{Style.YELLOW}]"
+        )
+    else:
+        ctx.console.print(
+            f"[{Style.YELLOW}]⚠ Failed to fetch {policy_info.display_name} policies[/{Style.YELLOW}]"
+        )
+
+
 def fetch_and_grade_all_policies(falcon, adapter, cid: str, policy_types: list, ctx):
     """Fetch and grade all specified policy types.
 
@@ -150,76 +265,36 @@ def fetch_and_grade_all_policies(falcon, adapter, cid: str, policy_types: list,
     policy_registry = get_policy_registry()
 
     # Determine which policies to fetch
-    if 'all' in policy_types:
-        policies_to_fetch = policy_registry.get_all_types()
-    else:
-        # Convert CLI names to internal names
-        policies_to_fetch = []
-        for policy_type in policy_types:
-            # Try direct lookup first (e.g., 'prevention')
-            if policy_registry.get(policy_type):
-                policies_to_fetch.append(policy_type)
-            else:
-                # Try by CLI name (e.g., 'sensor-update' -> 'sensor_update')
-                for key, info in policy_registry.get_all().items():
-                    if info.cli_name == policy_type:
-                        policies_to_fetch.append(key)
-                        break
-
-    ctx.log_verbose(f"Fetching and grading {len(policies_to_fetch)} policy types...")
-
-    # Fetch and grade each policy type
-    for policy_type in policies_to_fetch:
+    gradable = []
+    for policy_type in _iter_resolved_policy_types(policy_types, policy_registry):
         policy_info = policy_registry.get(policy_type)
         if policy_info and policy_info.grader_func:
-            ctx.log_verbose(f"Fetching and grading {policy_info.display_name} policies...")
-
-            with ctx.console.status(f"[{Style.BOLD}][{Style.GREEN}]Fetching {policy_info.display_name} policies...[/{Style.GREEN}][/{Style.BOLD}]"):
-                if policy_type == 'sca' and ctx.verbose:
-                    result = policy_info.grader_func(
-                        falcon, adapter, cid,
-                        verbose_print=ctx.log_verbose,
-                    )
-                else:
-                    result = policy_info.grader_func(falcon, adapter, cid)
-
-            # Show results
-            if not ctx.json_output_mode:
-                if result.get('permission_error'):
-                    # Show permission error with assist message
-                    ctx.console.print(
-                        f"[{Style.YELLOW}]⚠ Failed to fetch {policy_info.display_name} policies[/{Style.YELLOW}]"
-                    )
-                    assist_msg = result.get('assist_message')
-                    if assist_msg:
-                        ctx.console.print(f"[{Style.YELLOW}]{assist_msg}[/{Style.YELLOW}]")
-                elif result.get('grade_success'):
-                    passed = result.get('passed_policies', 0)
-                    failed = result.get('failed_policies', 0)
-                    ungradable = result.get('ungradable_policies', 0)
-                    total = result.get('policies_count', 0)
-
-                    status_parts = [f"{passed}/{total} passed"]
-                    if failed > 0:
-                        status_parts.append(f"{failed} failed")
-                    if ungradable > 0:
-                        status_parts.append(f"{ungradable} ungradable")
-
-                    ctx.console.print(
-                        f"[{Style.BOLD}][{Style.GREEN}]✓ {policy_info.display_name} Policies: "
-                        f"{', '.join(status_parts)}[/{Style.GREEN}][/{Style.BOLD}]"
-                    )
-                elif result.get('fetch_success'):
-                    ctx.console.print(
-                        f"[{Style.YELLOW}]⚠ {policy_info.display_name} policies fetched but not graded[/{Style.YELLOW}]"
-                    )
-                else:
-                    ctx.console.print(
-                        f"[{Style.YELLOW}]⚠ Failed to fetch {policy_info.display_name} policies[/{Style.YELLOW}]"
-                    )
+            gradable.append((policy_type, policy_info))
         else:
             ctx.log_verbose(f"No grader function for policy type: {policy_type}")
 
+    ctx.log_verbose(f"Fetching and grading {len(gradable)} policy types...")
+
+    # Policy types are independent and dominated by API latency, so they are
+    # fetched and graded concurrently. Adapter calls are serialized, and the
+    # results are reported in registry order once each one is ready.
+    if gradable:
+        shared_adapter = _SerializedAdapter(adapter)
+        workers = min(DEFAULT_POLICY_FETCH_WORKERS, len(gradable))
+        with ThreadPoolExecutor(max_workers=workers) as executor, \
+                _status_spinner(ctx, f"Fetching {len(gradable)} policy types...") as status:
+            futures = []
+            for policy_type, policy_info in gradable:
+                ctx.log_verbose(f"Fetching and grading {policy_info.display_name} policies...")
+                grader_kwargs = {'verbose_print': ctx.log_verbose} if policy_type == 'sca' and ctx.verbose else {}
+                futures.append(executor.submit(policy_info.grader_func, falcon, shared_adapter, cid, **grader_kwargs))
+
+            for (policy_type, policy_info), future in zip(gradable, futures):
+                status.update(f"[{Style.BOLD}][{Style.GREEN}]Fetching {policy_info.display_name} policies...[/{Style.GREEN}][/{Style.BOLD}]")
+                result = future.result()
+                if not ctx.json_output_mode:
+                    _print_policy_fetch_result(policy_info, result, ctx)
+
     if not ctx.json_output_mode:
         ctx.console.print()
 
@@ -244,38 +319,61 @@ def handle_fetch_operations(falcon, adapter, cid: str, args, config, ctx):
     # Parse product types
     product_types = parse_product_types(args.product_types)
 
-    # Parse host groups if provided
-    host_group_names = parse_host_groups(getattr(args, 'host_groups', None))
-    host_group_ids = parse_host_group_ids(getattr(args, 'host_group_ids', None))
-    tags = parse_tags(getattr(args, 'tags', None))
-
-    # Get last_seen filter if provided
-    last_seen_filter = getattr(args, 'last_seen', None)
-
-    # Fetch hosts (with optional server-side host group and tag filtering)
-    host_results = fetch_and_store_hosts(falcon, adapter, cid, product_types, config, ctx,
-                                         host_group_names, last_seen_filter,
-                                         host_group_ids, tags)
-
-    # Show summary in text mode
-    if not ctx.json_output_mode:
-        ctx.console.print(f"\n[{Style.BOLD}][{Style.GREEN}]✓ Fetched {host_results['fetched']:,} of {host_results['total_hosts']:,} hosts[/{Style.GREEN}][/{Style.BOLD}]")
-        if host_results['errors'] > 0:
-            ctx.console.print(f"[{Style.YELLOW}]⚠ {host_results['errors']:,} hosts had errors[/{Style.YELLOW}]")
-        ctx.console.print()
-
-    # Fetch Zero Trust Assessments for hosts (if enabled)
-    include_zta = config.get('host_fetching', {}).get('include_zta', True)
-    if include_zta:
-        hosts_list = adapter.get_hosts(cid)
-        host_ids = hosts_list.get('hosts', []) if hosts_list else []
+    # Server-side host filters (host groups, last_seen period, tags) if provided
+    filters = HostFilters(
+        host_group_names=parse_host_groups(getattr(args, 'host_groups', None)),
+        last_seen_filter=getattr(args, 'last_seen', None),
+        host_group_ids=parse_host_group_ids(getattr(args, 'host_group_ids', None)),
+        tags=parse_tags(getattr(args, 'tags', None)),
+    )
+
+    # Zero Trust Assessments only need the host ID list, so (if enabled) they
+    # are fetched on a background thread while host details are fetched, with
+    # adapter calls from both serialized.
+    host_fetching = HostFetchingConfig.from_config(config)
+    include_zta = host_fetching.include_zta
+    host_adapter = _SerializedAdapter(adapter) if include_zta else adapter
+    zta_futures = []
+    zta_cancel = threading.Event()
+    zta_executor = ThreadPoolExecutor(max_workers=1)
+
+    def start_zta(host_ids):
         if host_ids:
-            zta_results = fetch_and_store_zta(falcon, adapter, host_ids, ctx)
+            zta_futures.append(zta_executor.submit(
+                fetch_and_store_zta, falcon, host_adapter, host_ids, ctx,
+                show_status=False, cancel_event=zta_cancel
+            ))
+
+    try:
+        # Fetch hosts (with optional server-side host group and tag filtering)
+        host_results = fetch_and_store_hosts(falcon, host_adapter, cid, product_types, host_fetching, ctx,
+                                             filters, on_host_ids=start_zta if include_zta else None)
+
+        # Show summary in text mode
+        if not ctx.json_output_mode:
+            ctx.console.print(f"\n[{Style.BOLD}][{Style.GREEN}]✓ Fetched {host_results['fetched']:,} of {host_results['total_hosts']:,} hosts[/{Style.GREEN}][/{Style.BOLD}]")
+            if host_results['errors'] > 0:
+                ctx.console.print(f"[{Style.YELLOW}]⚠ {host_results['errors']:,} hosts had errors[/{Style.YELLOW}]")
+            ctx.console.print()
+
+        if zta_futures:
+            with _status_spinner(ctx, "Fetching Zero Trust Assessments..."):
+                zta_results = zta_futures[0].result()
             if not ctx.json_output_mode:
                 ctx.console.print(f"[{Style.BOLD}][{Style.GREEN}]✓ Fetched {zta_results['fetched']:,} Zero Trust Assessments[/{Style.GREEN}][/{Style.BOLD}]")
                 if zta_results['errors'] > 0:
                     ctx.console.print(f"[{Style.YELLOW}]⚠ {zta_results['errors']:,} ZTA errors[/{Style.YELLOW}]")
                 ctx.console.print()
+    except BaseException:
+        # Host fetch failed or was interrupted (Ctrl-C): stop the ZTA fetch after
+        # its current batch instead of waiting for every remaining batch.
+        # (Futures are cancelled by hand; cancel_futures needs Python 3.9+.)
+        zta_cancel.set()
+        for future in zta_futures:
+            future.cancel()
+        zta_executor.shutdown(wait=False)
+        raise
+    zta_executor.shutdown()
 
     # Fetch and grade policies
     if args.policy_type == 'all':
@@ -291,6 +389,26 @@ def handle_fetch_operations(falcon, adapter, cid: str, args, config, ctx):
         ctx.console.print(f"[{Style.BOLD}][{Style.GREEN}]Fetch and Grade Complete![/{Style.GREEN}][/{Style.BOLD}]\n")
 
 
+def _regrade_simple(policy_type: str, policies_data: list, _policies_record: dict, grading_config: dict):
+    """Grade with a grader taking (policies, grading_config)."""
+    return POLICY_GRADERS[policy_type](policies_data, grading_config)
+
+
+def _regrade_with_record_map(map_key: str):
+    """Build a regrade call for graders that also take a stored metadata map."""
+    def regrade(policy_type, policies_data, policies_record, grading_config):
+        return POLICY_GRADERS[policy_type](policies_data, policies_record.get(map_key, {}), grading_config)
+    return regrade
+
+
+# Graders needing extra metadata from the stored policies record; every other
+# type uses _regrade_simple
+_REGRADE_DISPATCH = {
+    'firewall': _regrade_with_record_map('policy_containers'),
+    'device_control': _regrade_with_record_map('policy_settings'),
+}
+
+
 def regrade_policies(adapter, cid: str, policy_types: list, ctx):
     """Re-grade existing policies from the database with current grading criteria.
 
@@ -307,63 +425,44 @@ def regrade_policies(adapter, cid: str, policy_types: list, ctx):
     # Get the policy registry
     policy_registry = get_policy_registry()
 
-    # Determine which policies to regrade
-    if 'all' in policy_types:
-        policies_to_regrade = policy_registry.get_all_types()
-    else:
-        # Convert CLI names to internal names
-        policies_to_regrade = []
-        for policy_type in policy_types:
-            # Try direct lookup first (e.g., 'prevention')
-            if policy_registry.get(policy_type):
-                policies_to_regrade.append(policy_type)
-            else:
-                # Try by CLI name (e.g., 'sensor-update' -> 'sensor_update')
-                for key, info in policy_registry.get_all().items():
-                    if info.cli_name == policy_type:
-                        policies_to_regrade.append(key)
-                        break
-
-    ctx.log_verbose(f"Re-grading {len(policies_to_regrade)} policy types with current criteria...")
+    ctx.log_verbose("Re-grading policy types with current criteria...")
 
     total_passed = 0
     total_failed = 0
     total_ungradable = 0
     total_policies = 0
     per_type_results = {}
+    # Result lines are collected and printed once after the loop (text mode only)
+    lines = []
+
+    # Regrade each policy type under a single spinner
+    with _status_spinner(ctx, "Re-grading policy types...") as status:
+        for policy_type in _iter_resolved_policy_types(policy_types, policy_registry):
+            policy_info = policy_registry.get(policy_type)
+            if not policy_info:
+                ctx.log_verbose(f"Unknown policy type: {policy_type}")
+                continue
 
-    # Regrade each policy type
-    for policy_type in policies_to_regrade:
-        policy_info = policy_registry.get(policy_type)
-        if not policy_info:
-            ctx.log_verbose(f"Unknown policy type: {policy_type}")
-            continue
+            # Check if grader exists
+            if policy_type not in POLICY_GRADERS:
+                ctx.log_verbose(f"No grader available for policy type: {policy_type}")
+                continue
 
-        # Check if grader exists
-        if policy_type not in POLICY_GRADERS:
-            ctx.log_verbose(f"No grader available for policy type: {policy_type}")
-            continue
+            ctx.log_verbose(f"Re-grading {policy_info.display_name} policies...")
 
-        ctx.log_verbose(f"Re-grading {policy_info.display_name} policies...")
+            status.update(f"[{Style.BOLD}][{Style.GREEN}]Re-grading {policy_info.display_name} policies...[/{Style.GREEN}][/{Style.BOLD}]")
 
-        with ctx.console.status(f"[{Style.BOLD}][{Style.GREEN}]Re-grading {policy_info.display_name} policies...[/{Style.GREEN}][/{Style.BOLD}]"):
             # Retrieve stored policies from database
             table_name = get_policy_table_name(policy_type)
             policies_record = adapter.get_policies(table_name, cid)
 
             if not policies_record or 'error' in policies_record:
-                if not ctx.json_output_mode:
-                    ctx.console.print(
-                        f"[{Style.YELLOW}]⚠ No {policy_info.display_name} policies found in database[/{Style.YELLOW}]"
-                    )
+                lines.append(f"[{Style.YELLOW}]⚠ No {policy_info.display_name} policies found in database[/{Style.YELLOW}]")
                 continue
 
             policies_data = policies_record.get('policies', [])
             if not policies_data:
-                if not ctx.json_output_mode:
-                    ctx.console.print(
-                        f"[{Style.YELLOW}]⚠ No {policy_info.display_name} policies in database[/{Style.YELLOW}]"
-                    )
+                lines.append(f"[{Style.YELLOW}]⚠ No {policy_info.display_name} policies in database[/{Style.YELLOW}]")
                 continue
 
             # Load grading configuration
@@ -371,43 +470,31 @@ def regrade_policies(adapter, cid: str, policy_types: list, ctx):
             grading_config = load_grading_config(default_config)
 
             if not grading_config:
-                if not ctx.json_output_mode:
-                    ctx.console.print(
-                        f"[{Style.RED}]✗ Failed to load grading configuration for {policy_info.display_name}[/{Style.RED}]"
-                    )
+                lines.append(f"[{Style.RED}]✗ Failed to load grading configuration for {policy_info.display_name}[/{Style.RED}]")
                 continue
 
-            # Grade the policies using the appropriate grader
-            grader_func = POLICY_GRADERS[policy_type]
-
-            # Handle special cases that need additional metadata
-            if policy_type == 'firewall':
-                # Firewall grader needs policy_containers_map
-                policy_containers_map = policies_record.get('policy_containers', {})
-                graded_results = grader_func(policies_data, policy_containers_map, grading_config)
-            elif policy_type == 'device_control':
-                # Device control grader needs policy_settings_map
-                policy_settings_map = policies_record.get('policy_settings', {})
-                graded_results = grader_func(policies_data, policy_settings_map, grading_config)
-            else:
-                # Simple graders (prevention, sensor_update, content_update, it_automation)
-                graded_results = grader_func(policies_data, grading_config)
+            # Grade the policies using the grader's calling convention
+            regrade = _REGRADE_DISPATCH.get(policy_type, _regrade_simple)
+            graded_results = regrade(policy_type, policies_data, policies_record, grading_config)
 
             if graded_results is None:
-                if not ctx.json_output_mode:
-                    ctx.console.print(
-                        f"[{Style.RED}]✗ Grading failed for {policy_info.display_name}[/{Style.RED}]"
-                    )
+                lines.append(f"[{Style.RED}]✗ Grading failed for {policy_info.display_name}[/{Style.RED}]")
                 continue
 
             # Store graded results
             adapter.put_graded_policies(f'{policy_type}_policies', cid, graded_results)
 
-            # Calculate summary
-            passed = sum(1 for r in graded_results if r.get('grading_status', 'graded') == 'graded' and r.get('passed', False))
-            ungradable = sum(1 for r in graded_results if r.get('grading_status') == 'ungradable')
-            failed = len(graded_results) - passed - ungradable
+            # Calculate summary in a single pass over the results
+            passed = 0
+            ungradable = 0
+            for graded in graded_results:
+                grading_status = graded.get('grading_status', 'graded')
+                if grading_status == 'ungradable':
+                    ungradable += 1
+                elif grading_status == 'graded' and graded.get('passed', False):
+                    passed += 1
             total = len(graded_results)
+            failed = total - passed - ungradable
 
             total_passed += passed
             total_failed += failed
@@ -422,23 +509,25 @@ def regrade_policies(adapter, cid: str, policy_types: list, ctx):
             }
 
             # Show results
-            if not ctx.json_output_mode:
-                status_parts = [f"{passed}/{total} passed"]
-                if failed > 0:
-                    status_parts.append(f"{failed} failed")
-                if ungradable > 0:
-                    status_parts.append(f"{ungradable} ungradable")
-
-                ctx.console.print(
-                    f"[{Style.BOLD}][{Style.GREEN}]✓ {policy_info.display_name} Policies: "
-                    f"{', '.join(status_parts)}[/{Style.GREEN}][/{Style.BOLD}]"
-                )
-
-    # Print summary
+            status_parts = [f"{passed}/{total} passed"]
+            if failed > 0:
+                status_parts.append(f"{failed} failed")
+            if ungradable > 0:
+                status_parts.append(f"{ungradable} ungradable")
+
+            lines.append(
+                f"[{Style.BOLD}][{Style.GREEN}]✓ {policy_info.display_name} Policies: "
+                f"{', '.join(status_parts)}[/{Style.GREEN}][/{Style.BOLD}]"
+            )
+
+    # Print per-type results and summary in one write; the plain totals line
+    # skips markup parsing and highlighting
     if not ctx.json_output_mode:
-        ctx.console.print()
-        ctx.console.print(f"[{Style.BOLD}][{Style.GREEN}]Re-grade Complete![/{Style.GREEN}][/{Style.BOLD}]")
-        ctx.console.print(f"Total: {total_passed}/{total_policies} policies passed, {total_failed} failed\n")
+        lines.append("")
+        lines.append(f"[{Style.BOLD}][{Style.GREEN}]Re-grade Complete![/{Style.GREEN}][/{Style.BOLD}]")
+        ctx.console.print("\n".join(lines))
+        ctx.console.print(f"Total: {total_passed}/{total_policies} policies passed, {total_failed} failed\n",
+                          markup=False, highlight=False)
 
     return {
         'policy_types': per_type_results,
@@ -1,10 +1,155 @@
 """Output strategies for different display formats."""
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from types import ModuleType, SimpleNamespace
 from typing import Dict, Any
+import importlib
+import io
 import json
 import csv
 import sys
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from falcon_policy_scoring import __version__ as app_version
+from falcon_policy_scoring.utils.constants import Style, POLICY_TYPE_REGISTRY
+from falcon_policy_scoring.utils.datetime_utils import get_utc_iso_timestamp
+from falcon_policy_scoring.utils.host_data import _get_ods_status, _get_sca_status
+from falcon_policy_scoring.utils import json_builder
+from . import filters, helpers, sorters
+
+
+# Rich markup for fixed text-view messages, formatted once at import
+_NO_HOSTS_MATCH = f"[{Style.YELLOW}]No hosts match the specified filters[/{Style.YELLOW}]\n"
+_HOST_NOT_FOUND = f"[{Style.YELLOW}]Host '{{}}' not found in database[/{Style.YELLOW}]"
+_HELP_TIP = f"[{Style.YELLOW}]Use --help to show all available commands and options[/{Style.YELLOW}]\n"
+
+# (type key, display name, device_policies key) in registry order for host details;
+# a None device_policies key marks coverage-index handling (ODS).
+_DETAIL_POLICY_TYPES = tuple(
+    (k, v['display_name'], v['device_policies_key']) for k, v in POLICY_TYPE_REGISTRY.items()
+)
+
+# CSV host summary columns: policy type -> (header, host row status key)
+_CSV_HOST_COLUMNS = {
+    'prevention': ('Prevention', 'prevention_status'),
+    'sensor_update': ('Sensor Update', 'sensor_update_status'),
+    'content_update': ('Content Update', 'content_update_status'),
+    'firewall': ('Firewall', 'firewall_status'),
+    'device_control': ('Device Control', 'device_control_status'),
+    'it_automation': ('IT Automation', 'it_automation_status')
+}
+
+# CSV host detail header names by policy type
+_CSV_POLICY_DISPLAY_NAMES = {
+    'prevention': 'Prevention',
+    'sensor_update': 'Sensor Update',
+    'content_update': 'Content Update',
+    'firewall': 'Firewall',
+    'device_control': 'Device Control',
+    'it_automation': 'IT Automation'
+}
+
+
+@lru_cache(maxsize=None)
+def _cli_module(name: str) -> ModuleType:
+    """Import a Rich/FalconPy-backed CLI module on first use.
+
+    ``formatters`` and ``data_fetcher`` pull in rich and falconpy, which the
+    JSON path never needs, so they are resolved once here instead of at import.
+
+    Args:
+        name: Submodule name within the cli package
+
+    Returns:
+        The imported module
+    """
+    return importlib.import_module(f'.{name}', __package__)
+
+
+def _policy_id_to_name(policy_records: Dict[str, Any], policy_types) -> Dict[str, str]:
+    """Map graded policy IDs to names across the given policy types.
+
+    Args:
+        policy_records: Dictionary of graded policy records by type
+        policy_types: Policy types to include
+
+    Returns:
+        Dictionary of policy_id -> policy_name (policies missing either are skipped)
+    """
+    return {
+        policy_id: policy_name
+        for policy_type in policy_types
+        for policy in (policy_records.get(policy_type) or {}).get('graded_policies') or ()
+        if (policy_id := policy.get('policy_id')) and (policy_name := policy.get('policy_name'))
+    }
+
+
+def _graded_policies_by_id(graded_record: Dict[str, Any]) -> Dict[str, Dict]:
+    """Index a graded record's policy results by policy_id (first result wins).
+
+    Args:
+        graded_record: Graded policy record with a 'graded_policies' list
+
+    Returns:
+        Dictionary of policy_id -> policy result
+    """
+    index = {}
+    for policy_result in graded_record.get('graded_policies') or ():
+        policy_id = policy_result.get('policy_id')
+        if policy_id:
+            index.setdefault(policy_id, policy_result)
+    return index
+
+
+def _index_device_policies(device_policies: Dict[str, Any]) -> Dict[str, Any]:
+    """Index a host's device_policies under hyphen and underscore key variants.
+
+    Falcon reports some keys hyphenated (``content-update``) and others with
+    underscores; indexing both spellings once lets callers use a single lookup.
+    Exact keys take precedence over variants, and empty entries are skipped.
+
+    Args:
+        device_policies: The host's ``device_policies`` mapping
+
+    Returns:
+        Dictionary of key variant -> policy info
+    """
+    index = {}
+    for key, info in device_policies.items():
+        if info:
+            index.setdefault(key.replace('_', '-'), info)
+            index.setdefault(key.replace('-', '_'), info)
+    for key, info in device_policies.items():
+        if info:
+            index[key] = info
+    return index
+
+
+def _write_stdout_bytes(payload: bytes) -> None:
+    """Write encoded output to stdout, bypassing the text layer when possible.
+
+    Args:
+        payload: UTF-8 encoded bytes
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(payload.decode('utf-8'))
+        return
+    # Flush pending text first so output stays in order
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+def _dump_json_text(json_data: Dict[str, Any], stream) -> None:
+    """Stream indented JSON (non-ASCII kept as-is) plus a trailing newline to a text stream."""
+    json.dump(json_data, stream, indent=2, ensure_ascii=False)
+    stream.write('\n')
+
 
 class OutputStrategy(ABC):
     """Abstract base class for output strategies."""
@@ -22,8 +167,6 @@ class OutputStrategy(ABC):
 class TextOutputStrategy(OutputStrategy):
     """Strategy for text/table output."""
 
-    # Disable certain pylint warnings due to complexity of this function
-    # pylint: disable=too-many-branches, too-many-locals, too-many-statements, too-many-nested-blocks
     def output(self, data: Dict[str, Any], context) -> None:
         """Display data as Rich tables.
 
@@ -31,251 +174,202 @@ class TextOutputStrategy(OutputStrategy):
             data: Data dictionary containing adapter, cid, config, args
             context: CLI context
         """
-        # Import here to avoid circular dependencies
-        from .filters import filter_policies, filter_hosts
-        from .sorters import sort_policies, sort_hosts
-        from .formatters import (
-            print_policy_table, print_policy_details,
-            build_host_table, print_host_stats, format_status_cell
-        )
-        from .data_fetcher import collect_host_data, calculate_host_stats, find_host_by_name
-        from .helpers import fetch_all_graded_policies, determine_policy_types_to_display, get_policy_status, resolve_display_host_filters
-        from falcon_policy_scoring.utils.constants import Style, POLICY_TYPE_REGISTRY
-        from falcon_policy_scoring.utils.cache_helpers import (
-            calculate_cache_age, get_hosts_ttl, is_cache_expired, format_cache_display_with_ttl
-        )
-        from falcon_policy_scoring.utils.models import CacheInfo
-
         adapter = data['adapter']
         cid = data['cid']
-        config = data['config']
         args = data['args']
 
-        # Get all graded policies
-        policy_records = fetch_all_graded_policies(adapter, cid)
-
-        # Handle host-specific views
-        wide = getattr(args, 'wide', True)
-
-        # Resolve client-side host group / tag display filters once (applied over
-        # cached rows; does not reduce fetch cost).
-        host_group_id_filter, host_tag_filter = resolve_display_host_filters(args, context)
-
-        if args.show_hosts and args.hostname and getattr(args, 'details', False):
-            # Show host summary table for specific host, then details
-            host_data = collect_host_data(adapter, cid, policy_records, config)
-            filtered_hosts = filter_hosts(host_data, args.platform, args.host_status, args.hostname,
-                                          host_group_id_filter, host_tag_filter)
-
-            if filtered_hosts:
-                sorted_hosts = sort_hosts(filtered_hosts, args.sort_hosts)
-                # Determine which policy types to display in the table
-                policy_types_to_display = determine_policy_types_to_display(args.policy_type)
-                table = build_host_table(sorted_hosts, context, config, policy_types_to_display, wide=wide)
-                context.console.print(table)
-
-                # Calculate stats and cache info
-                stats = calculate_host_stats(sorted_hosts)
-                hosts_in_db = adapter.get_hosts(cid)
-
-                if hosts_in_db and 'epoch' in hosts_in_db:
-                    cache_age_seconds, cache_age_display = calculate_cache_age(hosts_in_db['epoch'])
-                    hosts_ttl_seconds = get_hosts_ttl(config)
-                    cache_age_display = format_cache_display_with_ttl(cache_age_display, hosts_ttl_seconds)
-                    cache_info = CacheInfo(
-                        age_seconds=cache_age_seconds,
-                        age_display=cache_age_display,
-                        ttl_seconds=hosts_ttl_seconds,
-                        expired=is_cache_expired(cache_age_seconds, hosts_ttl_seconds)
-                    )
-                    print_host_stats(stats, cache_info, context)
-
-            # Print host policy details
-            host_info = find_host_by_name(adapter, cid, args.hostname)
-            if host_info:
-                device_data = host_info['device_data']
-                device_policies = device_data.get('device_policies', {})
-
-                context.console.print(f"\n[bold cyan]Policy Details for Host: {device_data.get('hostname', 'Unknown')}[/bold cyan]")
-                context.console.print(f"[dim]Device ID: {host_info['device_id']}[/dim]")
-                context.console.print(f"[dim]Platform: {device_data.get('platform_name', 'Unknown')}[/dim]\n")
-
-                # Determine which policy types to display based on -t flag
-                policy_types_to_display = determine_policy_types_to_display(args.policy_type)
-
-                # Build policy ID to name lookup maps for each policy type
-                policy_id_to_name = {}
-                for policy_type in policy_types_to_display:
-                    graded_record = policy_records.get(policy_type)
-                    if graded_record and 'graded_policies' in graded_record:
-                        for policy in graded_record['graded_policies']:
-                            policy_id = policy.get('policy_id')
-                            policy_name = policy.get('policy_name')
-                            if policy_id and policy_name:
-                                policy_id_to_name[policy_id] = policy_name
-
-                # Helper to locate policy info with hyphen/underscore variants
-                def _find_policy_info(policy_map, key):
-                    # try exact key, underscore, hyphen variants
-                    candidates = [key, key.replace('_', '-'), key.replace('-', '_')]
-                    for k in candidates:
-                        info = policy_map.get(k)
-                        if info:
-                            return info
-                    return {}
-
-                # Load coverage indices for ODS and SCA (host-level status determination)
-                from falcon_policy_scoring.utils.host_data import _get_ods_status, _get_sca_status
-                ods_coverage_record = adapter.get_ods_scan_coverage(cid)
-                ods_coverage_index = ods_coverage_record.get('coverage_index', {}) if ods_coverage_record else {}
-                sca_coverage_record = adapter.get_sca_coverage(cid)
-                sca_coverage_index = sca_coverage_record.get('coverage_index', {}) if sca_coverage_record else {}
-
-                device_id_for_host = host_info['device_id']
-                platform_for_host = device_data.get('platform_name', 'Unknown')
-
-                # Build policy mappings from registry — display_name and device_policies_key
-                # are canonical there; filter to only the requested policy types.
-                # device_policies_key=None signals coverage-index handling (ODS).
-                policy_mappings = [
-                    (k, v['display_name'], policy_records.get(k), v['device_policies_key'])
-                    for k, v in POLICY_TYPE_REGISTRY.items()
-                    if k in policy_types_to_display
-                ]
+        # Everything the views share, with the argparse flags read once
+        view = SimpleNamespace(
+            adapter=adapter,
+            cid=cid,
+            config=data['config'],
+            args=args,
+            context=context,
+            # Get all graded policies
+            policy_records=helpers.fetch_all_graded_policies(adapter, cid),
+            show_hosts=args.show_hosts,
+            show_policies=args.show_policies,
+            hostname=args.hostname,
+            details=getattr(args, 'details', False),
+            platform=args.platform,
+            # policies subcommand has 'status', hosts/host have 'host_status'
+            policy_status=getattr(args, 'status', None),
+            wide=getattr(args, 'wide', True),
+            # Determine which policy types to display based on -t flag (shared by every view)
+            policy_types=helpers.determine_policy_types_to_display(args.policy_type),
+            # Client-side host group / tag display filters (applied over cached rows;
+            # does not reduce fetch cost)
+            host_filters=helpers.resolve_display_host_filters(args, context),
+        )
 
-                for policy_key, policy_display_name, graded_record, dp_key in policy_mappings:
-                    if dp_key is None:
-                        # ODS has no device_policies entry; coverage is determined via a host-group index
-                        status = _get_ods_status(device_id_for_host, platform_for_host, graded_record, ods_coverage_index)
-                        covering_scan_ids = ods_coverage_index.get(device_id_for_host, [])
-                        policy_name = ', '.join(policy_id_to_name.get(sid, sid) for sid in covering_scan_ids) if covering_scan_ids else 'No Scans Assigned'
-
-                        context.console.print(f"[{Style.BOLD}]{policy_display_name} Policy:[/{Style.BOLD}] {policy_name}")
-                        context.console.print(f"  Status: {format_status_cell(status)}")
-                        if status == "FAILED" and graded_record and 'graded_policies' in graded_record:
-                            for scan_id in covering_scan_ids:
-                                for policy_result in graded_record['graded_policies']:
-                                    if policy_result.get('policy_id') == scan_id and not policy_result.get('passed'):
-                                        scan_name = policy_id_to_name.get(scan_id, scan_id)
-                                        context.console.print(f"  Scan '{scan_name}' Failed Checks: {policy_result.get('failures_count', 0)}/{policy_result.get('checks_count', 0)}")
-                                        break
-                    else:
-                        policy_info = _find_policy_info(device_policies, dp_key)
-                        policy_id = policy_info.get('policy_id')
-
-                        # SCA: use per-host coverage index for accurate host-level status
-                        if policy_key == 'sca':
-                            status = _get_sca_status(device_id_for_host, sca_coverage_index)
-                        else:
-                            status = get_policy_status(policy_id, graded_record)
-
-                        # Look up policy name from graded policies, fall back to device_policies, then 'Not Assigned'
-                        policy_name = policy_id_to_name.get(policy_id) if policy_id else None
-                        if not policy_name:
-                            policy_name = policy_info.get('policy_name', 'Not Assigned')
-
-                        context.console.print(f"[{Style.BOLD}]{policy_display_name} Policy:[/{Style.BOLD}] {policy_name}")
-                        context.console.print(f"  Status: {format_status_cell(status)}")
-                        if status == "FAILED" and graded_record and 'graded_policies' in graded_record:
-                            for policy_result in graded_record['graded_policies']:
-                                if policy_result.get('policy_id') == policy_id:
-                                    context.console.print(f"  Failed Checks: {policy_result.get('failures_count', 0)}/{policy_result.get('checks_count', 0)}")
-                                    break
-
-                    context.console.print()
-            else:
-                context.console.print(f"[{Style.YELLOW}]Host '{args.hostname}' not found in database[/{Style.YELLOW}]")
-
-        elif args.show_hosts and args.hostname:
-            # Just show the host summary table for the specific host
-            host_data = collect_host_data(adapter, cid, policy_records, config)
-            filtered_hosts = filter_hosts(host_data, args.platform, args.host_status, args.hostname,
-                                          host_group_id_filter, host_tag_filter)
-
-            if filtered_hosts:
-                sorted_hosts = sort_hosts(filtered_hosts, args.sort_hosts)
-                # Determine which policy types to display in the table
-                policy_types_to_display = determine_policy_types_to_display(args.policy_type)
-                table = build_host_table(sorted_hosts, context, config, policy_types_to_display, wide=wide)
-                context.console.print(table)
-
-                # Calculate stats and cache info
-                stats = calculate_host_stats(sorted_hosts)
-                hosts_in_db = adapter.get_hosts(cid)
-
-                if hosts_in_db and 'epoch' in hosts_in_db:
-                    cache_age_seconds, cache_age_display = calculate_cache_age(hosts_in_db['epoch'])
-                    hosts_ttl_seconds = get_hosts_ttl(config)
-                    cache_age_display = format_cache_display_with_ttl(cache_age_display, hosts_ttl_seconds)
-                    cache_info = CacheInfo(
-                        age_seconds=cache_age_seconds,
-                        age_display=cache_age_display,
-                        ttl_seconds=hosts_ttl_seconds,
-                        expired=is_cache_expired(cache_age_seconds, hosts_ttl_seconds)
-                    )
-                    print_host_stats(stats, cache_info, context)
-            else:
-                context.console.print(f"[{Style.YELLOW}]No hosts match the specified filters[/{Style.YELLOW}]\n")
+        # Route on (single-host view, details requested)
+        view_name = self._VIEWS.get((bool(view.show_hosts and view.hostname), bool(view.details)),
+                                    '_render_default_view')
+        getattr(self, view_name)(view)
 
-        else:
-            # Show policy tables if explicitly requested or if filters are applied
-            # Use hasattr to safely check for status attribute (policies subcommand has 'status', hosts/host have 'host_status')
-            policy_status = getattr(args, 'status', None)
-            show_policy_tables = args.show_policies or (getattr(args, 'details', False) and not args.show_hosts) or (policy_status and not args.show_hosts)
+    def _render_host_summary(self, view, report_empty=True) -> None:
+        """Print the host summary table followed by its stats and cache footer.
 
-            if show_policy_tables:
-                # Display policy tables
-                policy_types_to_display = determine_policy_types_to_display(args.policy_type)
+        The host list record is read once and shared between host collection
+        and the cache-age footer.
 
-                for policy_type in policy_types_to_display:
-                    graded_record = policy_records.get(policy_type)
+        Args:
+            view: Shared render state built by :meth:`output`
+            report_empty: Print a notice when no hosts match the filters
+        """
+        formatters = _cli_module('formatters')
+        data_fetcher = _cli_module('data_fetcher')
+        adapter, args, config, context = view.adapter, view.args, view.config, view.context
 
-                    if graded_record and 'graded_policies' in graded_record:
-                        # Filter and sort policies
-                        policies = graded_record['graded_policies']
-                        filtered_policies = filter_policies(policies, args.platform, policy_status)
-                        sorted_policies = sort_policies(filtered_policies, args.sort_policies)
+        hosts_in_db = adapter.get_hosts(view.cid)
+        host_data = data_fetcher.collect_host_data(adapter, view.cid, view.policy_records, config, hosts_in_db)
+        filtered_hosts = filters.filter_hosts(host_data, args.platform, args.host_status, args.hostname,
+                                              *view.host_filters)
 
-                        print_policy_table(graded_record, policy_type, config, sorted_policies, context, wide=wide)
+        if not filtered_hosts:
+            if report_empty:
+                context.console.print(_NO_HOSTS_MATCH)
+            return
 
-                        if getattr(args, 'details', False):
-                            print_policy_details(graded_record, policy_type, context)
+        sorted_hosts = sorters.sort_hosts(filtered_hosts, args.sort_hosts)
+        table = formatters.build_host_table(sorted_hosts, context, config, view.policy_types, wide=view.wide)
+        context.console.print(table)
 
-            # Show host summary if requested (without hostname filter)
-            if args.show_hosts:
-                host_data = collect_host_data(adapter, cid, policy_records, config)
-                filtered_hosts = filter_hosts(host_data, args.platform, args.host_status, args.hostname,
-                                              host_group_id_filter, host_tag_filter)
+        # Calculate stats and cache info
+        stats = data_fetcher.calculate_host_stats(sorted_hosts)
+
+        if hosts_in_db and 'epoch' in hosts_in_db:
+            cache_info = formatters.calculate_host_cache_info(hosts_in_db, config)
+            formatters.print_host_stats(stats, cache_info, context)
+
+    def _render_policy_tables(self, view) -> None:
+        """Print a filtered, sorted policy table (and optional details) per policy type."""
+        formatters = _cli_module('formatters')
+
+        for policy_type in view.policy_types:
+            graded_record = view.policy_records.get(policy_type)
 
-                if filtered_hosts:
-                    sorted_hosts = sort_hosts(filtered_hosts, args.sort_hosts)
-                    # Determine which policy types to display in the table
-                    policy_types_to_display = determine_policy_types_to_display(args.policy_type)
-                    table = build_host_table(sorted_hosts, context, config, policy_types_to_display, wide=wide)
-                    context.console.print(table)
-
-                    # Calculate stats and cache info
-                    stats = calculate_host_stats(sorted_hosts)
-                    hosts_in_db = adapter.get_hosts(cid)
-
-                    if hosts_in_db and 'epoch' in hosts_in_db:
-                        cache_age_seconds, cache_age_display = calculate_cache_age(hosts_in_db['epoch'])
-                        hosts_ttl_seconds = get_hosts_ttl(config)
-                        cache_age_display = format_cache_display_with_ttl(cache_age_display, hosts_ttl_seconds)
-                        cache_info = CacheInfo(
-                            age_seconds=cache_age_seconds,
-                            age_display=cache_age_display,
-                            ttl_seconds=hosts_ttl_seconds,
-                            expired=is_cache_expired(cache_age_seconds, hosts_ttl_seconds)
-                        )
-                        print_host_stats(stats, cache_info, context)
+            if graded_record and 'graded_policies' in graded_record:
+                # Filter and sort policies
+                policies = graded_record['graded_policies']
+                filtered_policies = filters.filter_policies(policies, view.platform, view.policy_status)
+                sorted_policies = sorters.sort_policies(filtered_policies, view.args.sort_policies)
+
+                formatters.print_policy_table(graded_record, policy_type, view.config, sorted_policies,
+                                              view.context, wide=view.wide)
+
+                if view.details:
+                    formatters.print_policy_details(graded_record, policy_type, view.context)
+
+    # Disable certain pylint warnings due to complexity of this function
+    # pylint: disable=too-many-locals
+    def _render_host_details_view(self, view) -> None:
+        """Show the host summary table for one host, then its per-policy details."""
+        formatters = _cli_module('formatters')
+        adapter, cid, policy_records = view.adapter, view.cid, view.policy_records
+
+        self._render_host_summary(view, report_empty=False)
+
+        # Print host policy details
+        host_info = _cli_module('data_fetcher').find_host_by_name(adapter, cid, view.hostname)
+        if not host_info:
+            view.context.console.print(_HOST_NOT_FOUND.format(view.hostname))
+            return
+
+        device_data = host_info['device_data']
+        device_policies = device_data.get('device_policies', {})
+
+        # Build policy ID to name lookup maps for each policy type
+        policy_id_to_name = _policy_id_to_name(policy_records, view.policy_types)
+
+        # Index device_policies by hyphen/underscore key variants once
+        device_policies_index = _index_device_policies(device_policies)
+
+        # Load coverage indices for ODS and SCA (host-level status determination)
+        ods_coverage_record = adapter.get_ods_scan_coverage(cid)
+        ods_coverage_index = ods_coverage_record.get('coverage_index', {}) if ods_coverage_record else {}
+        sca_coverage_record = adapter.get_sca_coverage(cid)
+        sca_coverage_index = sca_coverage_record.get('coverage_index', {}) if sca_coverage_record else {}
+
+        device_id_for_host = host_info['device_id']
+        platform_for_host = device_data.get('platform_name', 'Unknown')
+
+        # Build policy mappings from registry — display_name and device_policies_key
+        # are canonical there; filter to only the requested policy types.
+        # device_policies_key=None signals coverage-index handling (ODS).
+        requested_types = frozenset(view.policy_types)
+        policy_mappings = [
+            (k, display_name, policy_records.get(k), dp_key)
+            for k, display_name, dp_key in _DETAIL_POLICY_TYPES
+            if k in requested_types
+        ]
+
+        # Collect (display name, policy name, status, note lines) per type and
+        # render them in one console write
+        detail_rows = []
+        for policy_key, policy_display_name, graded_record, dp_key in policy_mappings:
+            notes = []
+            if dp_key is None:
+                # ODS has no device_policies entry; coverage is determined via a host-group index
+                status = _get_ods_status(device_id_for_host, platform_for_host, graded_record, ods_coverage_index)
+                covering_scan_ids = ods_coverage_index.get(device_id_for_host, [])
+                policy_name = ', '.join(policy_id_to_name.get(sid, sid) for sid in covering_scan_ids) if covering_scan_ids else 'No Scans Assigned'
+
+                if status == "FAILED" and graded_record and 'graded_policies' in graded_record:
+                    results_by_id = _graded_policies_by_id(graded_record)
+                    for scan_id in covering_scan_ids:
+                        policy_result = results_by_id.get(scan_id)
+                        if policy_result and not policy_result.get('passed'):
+                            scan_name = policy_id_to_name.get(scan_id, scan_id)
+                            notes.append(f"  Scan '{scan_name}' Failed Checks: {policy_result.get('failures_count', 0)}/{policy_result.get('checks_count', 0)}")
+            else:
+                policy_info = device_policies_index.get(dp_key, {})
+                policy_id = policy_info.get('policy_id')
+
+                # SCA: use per-host coverage index for accurate host-level status
+                if policy_key == 'sca':
+                    status = _get_sca_status(device_id_for_host, sca_coverage_index)
                 else:
-                    context.console.print(f"[{Style.YELLOW}]No hosts match the specified filters[/{Style.YELLOW}]\n")
+                    status = helpers.get_policy_status(policy_id, graded_record)
+
+                # Look up policy name from graded policies, fall back to device_policies, then 'Not Assigned'
+                policy_name = policy_id_to_name.get(policy_id) if policy_id else None
+                if not policy_name:
+                    policy_name = policy_info.get('policy_name', 'Not Assigned')
+
+                if status == "FAILED" and graded_record and 'graded_policies' in graded_record:
+                    policy_result = _graded_policies_by_id(graded_record).get(policy_id)
+                    if policy_result:
+                        notes.append(f"  Failed Checks: {policy_result.get('failures_count', 0)}/{policy_result.get('checks_count', 0)}")
+
+            detail_rows.append((policy_display_name, policy_name, status, notes))
+
+        formatters.print_host_policy_details(host_info, detail_rows, view.context)
+    # pylint: enable=too-many-locals
+
+    def _render_host_view(self, view) -> None:
+        """Show just the host summary table for the specific host."""
+        self._render_host_summary(view)
+
+    def _render_default_view(self, view) -> None:
+        """Show policy tables and/or the host summary, or a usage tip when neither is requested."""
+        # Show policy tables if explicitly requested or if filters are applied
+        if view.show_policies or ((view.details or view.policy_status) and not view.show_hosts):
+            self._render_policy_tables(view)
+
+        # Show host summary if requested (without hostname filter)
+        if view.show_hosts:
+            self._render_host_summary(view)
+
+        # Print helpful tips if minimal output
+        if not view.show_policies and not view.show_hosts:
+            view.context.console.print(_HELP_TIP)
 
-            # Print helpful tips if minimal output
-            if not args.show_policies and not args.show_hosts:
-                context.console.print(f"[{Style.YELLOW}]Use --help to show all available commands and options[/{Style.YELLOW}]\n")
-    # pylint: enable=too-many-branches, too-many-locals, too-many-statements, too-many-nested-blocks
+    # (single-host view, details requested) -> renderer name; anything else is the default view
+    _VIEWS = {
+        (True, True): '_render_host_details_view',
+        (True, False): '_render_host_view',
+    }
 
 
 class JsonOutputStrategy(OutputStrategy):
@@ -288,26 +382,52 @@ class JsonOutputStrategy(OutputStrategy):
             data: Data dictionary containing adapter, cid, config, args
             context: CLI context
         """
-        # Import build_json_output function
-        from falcon_policy_scoring.utils.json_builder import build_json_output
-
         adapter = data['adapter']
         cid = data['cid']
         config = data['config']
         args = data['args']
 
-        json_data = build_json_output(adapter, cid, config, args)
-        json_str = json.dumps(json_data, indent=2)
+        json_data = json_builder.build_json_output(adapter, cid, config, args)
 
         output_file = args.output_file
 
+        if orjson is not None:
+            # orjson's C encoder is several times faster than json.dump on
+            # large host inventories; it produces bytes, written as-is.
+            payload = orjson.dumps(
+                json_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+            if output_file:
+                with open(output_file, 'wb') as f:
+                    f.write(payload)
+                print(f"JSON output written to: {output_file}", file=sys.stderr)
+            else:
+                _write_stdout_bytes(payload)
+            return
+
+        # Serialize straight into the destination rather than materializing the
+        # whole document as one string first (large host inventories). Raw UTF-8
+        # with '\n' line endings and a trailing newline, byte-for-byte what the
+        # orjson path writes.
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+            with open(output_file, 'w', encoding='utf-8', newline='\n') as f:
+                _dump_json_text(json_data, f)
             # Report destination to stderr so stdout stays clean for piping.
             print(f"JSON output written to: {output_file}", file=sys.stderr)
-        else:
-            print(json_str)
+            return
+
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            _dump_json_text(json_data, sys.stdout)
+            return
+        sys.stdout.flush()
+        stream = io.TextIOWrapper(buffer, encoding='utf-8', newline='\n')
+        try:
+            _dump_json_text(json_data, stream)
+            stream.flush()
+        finally:
+            stream.detach()
 
 
 class CsvOutputStrategy(OutputStrategy):
@@ -321,15 +441,13 @@ class CsvOutputStrategy(OutputStrategy):
             context: CLI context
         """
 
-        from .helpers import fetch_all_graded_policies
-
         adapter = data['adapter']
         cid = data['cid']
         config = data['config']
         args = data['args']
 
         # Get all graded policies
-        policy_records = fetch_all_graded_policies(adapter, cid)
+        policy_records = helpers.fetch_all_graded_policies(adapter, cid)
 
         # Determine base output path
         base_output = args.output_file if args.output_file else 'output'
@@ -356,11 +474,7 @@ class CsvOutputStrategy(OutputStrategy):
 
     def _output_policies_csv(self, adapter, cid, args, policy_records, base_output, context):
         """Output policy tables as separate CSV files per policy type."""
-        from .filters import filter_policies
-        from .sorters import sort_policies
-        from .helpers import determine_policy_types_to_display
-
-        policy_types_to_display = determine_policy_types_to_display(args.policy_type)
+        policy_types_to_display = helpers.determine_policy_types_to_display(args.policy_type)
         policy_status = getattr(args, 'status', None)
 
         files_created = []
@@ -373,8 +487,8 @@ class CsvOutputStrategy(OutputStrategy):
 
             # Filter and sort policies
             policies = graded_record['graded_policies']
-            filtered_policies = filter_policies(policies, args.platform, policy_status)
-            sorted_policies = sort_policies(filtered_policies, args.sort_policies)
+            filtered_policies = filters.filter_policies(policies, args.platform, policy_status)
+            sorted_policies = sorters.sort_policies(filtered_policies, args.sort_policies)
 
             if not sorted_policies:
                 continue
@@ -421,24 +535,19 @@ class CsvOutputStrategy(OutputStrategy):
 
     def _output_hosts_csv(self, adapter, cid, config, args, policy_records, base_output, context):
         """Output hosts summary as single CSV file."""
-        from .filters import filter_hosts
-        from .sorters import sort_hosts
-        from .data_fetcher import collect_host_data
-        from .helpers import determine_policy_types_to_display, resolve_display_host_filters
-
         # Client-side host group / tag display filters (over cached rows)
-        host_group_id_filter, host_tag_filter = resolve_display_host_filters(args, context)
+        host_group_id_filter, host_tag_filter = helpers.resolve_display_host_filters(args, context)
 
-        host_data = collect_host_data(adapter, cid, policy_records, config)
-        filtered_hosts = filter_hosts(host_data, args.platform, args.host_status, args.hostname,
-                                      host_group_id_filter, host_tag_filter)
+        host_data = _cli_module('data_fetcher').collect_host_data(adapter, cid, policy_records, config)
+        filtered_hosts = filters.filter_hosts(host_data, args.platform, args.host_status, args.hostname,
+                                              host_group_id_filter, host_tag_filter)
 
         if not filtered_hosts:
             print("No hosts match the specified filters; no CSV file written.", file=sys.stderr)
             return
 
-        sorted_hosts = sort_hosts(filtered_hosts, args.sort_hosts)
-        policy_types_to_display = determine_policy_types_to_display(args.policy_type)
+        sorted_hosts = sorters.sort_hosts(filtered_hosts, args.sort_hosts)
+        policy_types_to_display = helpers.determine_policy_types_to_display(args.policy_type)
 
         # Generate filename
         csv_filename = f"{base_output}_hosts.csv" if base_output != 'output' else "hosts.csv"
@@ -450,21 +559,11 @@ class CsvOutputStrategy(OutputStrategy):
             # Build header row dynamically based on policy types to display
             headers = ['Hostname', 'Platform']
 
-            # Map policy types to display names and status keys
-            policy_mappings = {
-                'prevention': ('Prevention', 'prevention_status'),
-                'sensor_update': ('Sensor Update', 'sensor_update_status'),
-                'content_update': ('Content Update', 'content_update_status'),
-                'firewall': ('Firewall', 'firewall_status'),
-                'device_control': ('Device Control', 'device_control_status'),
-                'it_automation': ('IT Automation', 'it_automation_status')
-            }
-
             # Track which status keys we need
             status_keys = []
             for policy_type in policy_types_to_display:
-                if policy_type in policy_mappings:
-                    display_name, status_key = policy_mappings[policy_type]
+                if policy_type in _CSV_HOST_COLUMNS:
+                    display_name, status_key = _CSV_HOST_COLUMNS[policy_type]
                     headers.append(display_name)
                     status_keys.append(status_key)
 
@@ -488,10 +587,7 @@ class CsvOutputStrategy(OutputStrategy):
 
     def _output_host_details_csv(self, adapter, cid, args, policy_records, base_output, context):
         """Output host details with policy information in wide format."""
-        from .data_fetcher import find_host_by_name
-        from .helpers import determine_policy_types_to_display, get_policy_status
-
-        host_info = find_host_by_name(adapter, cid, args.hostname)
+        host_info = _cli_module('data_fetcher').find_host_by_name(adapter, cid, args.hostname)
 
         if not host_info:
             print(f"Host '{args.hostname}' not found in database; no CSV file written.", file=sys.stderr)
@@ -500,22 +596,14 @@ class CsvOutputStrategy(OutputStrategy):
         device_data = host_info['device_data']
         device_policies = device_data.get('device_policies', {})
 
-        policy_types_to_display = determine_policy_types_to_display(args.policy_type)
+        policy_types_to_display = helpers.determine_policy_types_to_display(args.policy_type)
 
         # Generate filename
         hostname_clean = args.hostname.replace(' ', '_').replace('.', '_')
         csv_filename = f"{base_output}_{hostname_clean}_details.csv"
 
         # Build policy ID to name lookup
-        policy_id_to_name = {}
-        for policy_type in policy_types_to_display:
-            graded_record = policy_records.get(policy_type)
-            if graded_record and 'graded_policies' in graded_record:
-                for policy in graded_record['graded_policies']:
-                    policy_id = policy.get('policy_id')
-                    policy_name = policy.get('policy_name')
-                    if policy_id and policy_name:
-                        policy_id_to_name[policy_id] = policy_name
+        policy_id_to_name = _policy_id_to_name(policy_records, policy_types_to_display)
 
         # Write CSV
         with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
@@ -524,30 +612,14 @@ class CsvOutputStrategy(OutputStrategy):
             # Build header row
             headers = ['Hostname', 'Device ID', 'Platform']
 
-            # Map policy types to display names
-            policy_display_names = {
-                'prevention': 'Prevention',
-                'sensor_update': 'Sensor Update',
-                'content_update': 'Content Update',
-                'firewall': 'Firewall',
-                'device_control': 'Device Control',
-                'it_automation': 'IT Automation'
-            }
-
             for policy_type in policy_types_to_display:
-                display_name = policy_display_names.get(policy_type, policy_type.replace('_', ' ').title())
+                display_name = _CSV_POLICY_DISPLAY_NAMES.get(policy_type, policy_type.replace('_', ' ').title())
                 headers.extend([f"{display_name} Policy", f"{display_name} Status"])
 
             writer.writerow(headers)
 
-            # Helper to locate policy info with hyphen/underscore variants
-            def _find_policy_info(policy_map, key):
-                candidates = [key, key.replace('_', '-'), key.replace('-', '_')]
-                for k in candidates:
-                    info = policy_map.get(k)
-                    if info:
-                        return info
-                return {}
+            # Index device_policies by hyphen/underscore key variants once
+            device_policies_index = _index_device_policies(device_policies)
 
             # Data row
             row = [
@@ -558,7 +630,7 @@ class CsvOutputStrategy(OutputStrategy):
 
             for policy_type in policy_types_to_display:
                 graded_record = policy_records.get(policy_type)
-                policy_info = _find_policy_info(device_policies, policy_type)
+                policy_info = device_policies_index.get(policy_type, {})
                 policy_id = policy_info.get('policy_id')
 
                 # Look up policy name
@@ -566,7 +638,7 @@ class CsvOutputStrategy(OutputStrategy):
                 if not policy_name:
                     policy_name = policy_info.get('policy_name', 'Not Assigned')
 
-                status = get_policy_status(policy_id, graded_record)
+                status = helpers.get_policy_status(policy_id, graded_record)
 
                 row.extend([policy_name, status])
 
@@ -576,6 +648,15 @@ class CsvOutputStrategy(OutputStrategy):
         print(f"CSV output written to: {csv_filename}", file=sys.stderr)
 
 
+# Strategies are stateless, so one instance of each is shared across calls.
+_STRATEGIES: Dict[str, OutputStrategy] = {
+    'text': TextOutputStrategy(),
+    'json': JsonOutputStrategy(),
+    'csv': CsvOutputStrategy()
+}
+_DEFAULT_STRATEGY = _STRATEGIES['text']
+
+
 def get_output_strategy(format_type: str) -> OutputStrategy:
     """Factory function to get output strategy.
 
@@ -583,14 +664,9 @@ def get_output_strategy(format_type: str) -> OutputStrategy:
         format_type: Output format type ('text', 'json', or 'csv')
 
     Returns:
-        OutputStrategy instance
+        OutputStrategy instance (shared; strategies hold no state)
     """
-    strategies = {
-        'text': TextOutputStrategy(),
-        'json': JsonOutputStrategy(),
-        'csv': CsvOutputStrategy()
-    }
-    return strategies.get(format_type, TextOutputStrategy())
+    return _STRATEGIES.get(format_type, _DEFAULT_STRATEGY)
 
 
 def output_regrade_summary(summary: Dict[str, Any], args, context) -> None:
@@ -610,9 +686,6 @@ def output_regrade_summary(summary: Dict[str, Any], args, context) -> None:
     output_format = getattr(args, 'output_format', 'text')
 
     if output_format == 'json':
-        from falcon_policy_scoring.utils.datetime_utils import get_utc_iso_timestamp
-        from falcon_policy_scoring import __version__ as app_version
-
         payload = {
             "metadata": {
                 "version": app_version,
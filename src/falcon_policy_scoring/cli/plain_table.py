@@ -0,0 +1,129 @@
+"""Lightweight fixed-width table for very large result sets."""
+from typing import Dict, List, Optional, Tuple
+
+from rich.cells import cell_len
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
+from rich.text import Text
+
+
+class PlainTable:
+    """Minimal stand-in for ``rich.table.Table`` used above MAX_RICH_TABLE_ROWS rows.
+
+    Rich tables measure, wrap and box every cell, which makes rendering
+    thousands of rows take seconds. This table supports the subset of the
+    Table API the formatters use (``add_column``/``add_row`` with Rich markup
+    cells) but renders columns without borders, and lays out each distinct
+    cell value once per column, so output cost is linear in the row count.
+
+    Columns without a width are sized to their widest cell. When the columns
+    do not fit the console they shrink (widest first, down to their longest
+    word) and cells wrap onto extra lines, so no cell is ever cropped.
+    """
+
+    def __init__(self, title: Optional[str] = None):
+        self.title = title
+        self.columns: List[Tuple[str, Optional[int], str, Optional[str]]] = []
+        self.rows: List[Tuple[str, ...]] = []
+
+    def add_column(self, header: str = "", style: Optional[str] = None,
+                   justify: str = "left", width: Optional[int] = None):
+        """Add a column (same keyword names as ``Table.add_column``)."""
+        self.columns.append((header, width, justify, style))
+
+    def add_row(self, *cells: str):
+        """Add a row of Rich markup strings, one per column."""
+        self.rows.append(cells)
+
+    def _column_widths(self, headers: List[Text], parsed: List[Dict[str, Text]],
+                       max_width: int) -> List[int]:
+        """Resolve each column's width, shrinking columns to fit ``max_width``."""
+        texts = [[header, *cells.values()] for header, cells in zip(headers, parsed)]
+        natural = [max(text.cell_len for text in column) for column in texts]
+        widths = [width or size for (_, width, _, _), size in zip(self.columns, natural)]
+
+        available = max(max_width - (len(widths) - 1), len(widths))
+        if sum(widths) <= available:
+            return widths
+
+        # Drop the padding of fixed-width columns before wrapping any cell
+        widths = [min(width, size) for width, size in zip(widths, natural)]
+        words = [
+            max(cell_len(word) for text in column for word in text.plain.split() or [""])
+            for column in texts
+        ]
+        minimums = [max(word, 1) for word in words]
+        excess = sum(widths) - available
+        while excess > 0:
+            # Shrink the widest column that can still wrap on word boundaries,
+            # then fold long words once every column is down to its longest word
+            shrinkable = [i for i, width in enumerate(widths) if width > minimums[i]]
+            if not shrinkable:
+                shrinkable = [i for i, width in enumerate(widths) if width > 1]
+                if not shrinkable:
+                    break
+            widest = max(shrinkable, key=widths.__getitem__)
+            widths[widest] -= 1
+            excess -= 1
+        return widths
+
+    @staticmethod
+    def _lines(text: Text, console: Console, width: int, justify: str) -> List[List[Segment]]:
+        """Wrap a cell to ``width`` and render each line padded to the column width."""
+        lines = []
+        for line in text.wrap(console, width, overflow="fold"):
+            line.rstrip()
+            line.align(justify, width)
+            lines.append(list(line.render(console)))
+        return lines
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        # Parse each distinct cell value once per column (column style as base)
+        header_style = console.get_style("table.header")
+        headers = [Text(header, style=header_style) for header, _, _, _ in self.columns]
+        parsed: List[Dict[str, Text]] = [{} for _ in self.columns]
+        for row in self.rows:
+            for (_, _, _, style), cell, texts in zip(self.columns, row, parsed):
+                if cell not in texts:
+                    texts[cell] = Text.from_markup(cell, style=style or "")
+        widths = self._column_widths(headers, parsed, options.max_width)
+        justifies = [justify for _, _, justify, _ in self.columns]
+
+        separator = Segment(" ")
+        new_line = Segment.line()
+        total_width = sum(widths) + len(widths) - 1
+        blanks = [[Segment(" " * width)] for width in widths]
+
+        def render_row(cell_lines: List[List[List[Segment]]]) -> RenderResult:
+            for line_no in range(max(len(lines) for lines in cell_lines)):
+                for index, lines in enumerate(cell_lines):
+                    if index:
+                        yield separator
+                    yield from lines[line_no] if line_no < len(lines) else blanks[index]
+                yield new_line
+
+        if self.title:
+            title = Text(self.title, style=console.get_style("table.title"), justify="center")
+            for line in title.wrap(console, total_width):
+                line.rstrip()
+                yield from line.render(console)
+                yield new_line
+
+        yield from render_row([
+            self._lines(header, console, width, "left" if justify == "left" else "center")
+            for header, width, justify in zip(headers, widths, justifies)
+        ])
+        yield Segment("─" * total_width)
+        yield new_line
+
+        rendered: List[Dict[str, List[List[Segment]]]] = [{} for _ in self.columns]
+        for row in self.rows:
+            cell_lines = []
+            for index, cell in enumerate(row):
+                lines = rendered[index].get(cell)
+                if lines is None:
+                    lines = rendered[index][cell] = self._lines(
+                        parsed[index][cell], console, widths[index], justifies[index]
+                    )
+                cell_lines.append(lines)
+            yield from render_row(cell_lines)
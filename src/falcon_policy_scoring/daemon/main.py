@@ -12,6 +12,7 @@ from falcon_policy_scoring.utils.config import read_config_from_yaml
 from falcon_policy_scoring.factories.database_factory import DatabaseFactory
 from falcon_policy_scoring.falconapi.cid import get_cid
 from falcon_policy_scoring.falconapi.hosts import Hosts
+from falcon_policy_scoring.falconapi.session import create_session
 from falcon_policy_scoring.utils.policy_registry import get_policy_registry
 from falcon_policy_scoring.utils.host_data import collect_host_data, calculate_host_stats
 from falcon_policy_scoring.utils.policy_helpers import (
@@ -133,6 +134,7 @@ class DaemonRunner:
             client_secret=client_secret,
             base_url=base_url
         )
+        self.falcon.session = create_session()
         self.cid = get_cid(self.falcon)
         logger.info("Falcon API initialized for CID: %s", self.cid)
 
@@ -506,6 +508,10 @@ class DaemonRunner:
             if self.adapter:
                 self.adapter.close()
 
+            session = getattr(self.falcon, 'session', None)
+            if session is not None:
+                session.close()
+
             print("Cleanup complete")
             logger.info("Cleanup complete")
 
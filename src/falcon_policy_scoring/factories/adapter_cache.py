@@ -0,0 +1,49 @@
+"""Process-wide cache of connected database adapters."""
+import atexit
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from falcon_policy_scoring.factories.database_factory import DatabaseFactory
+
+# Connected database adapters keyed by (db_type, backend config), reused by
+# later setup_database() calls in the same process
+_ADAPTER_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def _cache_key(db_type: str, db_config: Dict) -> Tuple[str, str]:
+    return db_type, json.dumps(db_config, sort_keys=True, default=str)
+
+
+def get_cached_adapter(db_type: str, db_config: Dict) -> Optional[Any]:
+    """Return the cached adapter for this backend config while it is healthy, else None."""
+    adapter = _ADAPTER_CACHE.get(_cache_key(db_type, db_config))
+    if adapter is not None and adapter.is_healthy():
+        return adapter
+    return None
+
+
+def connect_adapter(db_type: str, db_config: Dict) -> Any:
+    """Create and connect an adapter for this backend config and cache it.
+
+    Args:
+        db_type: Database type (db.type config value)
+        db_config: Backend configuration section
+
+    Returns:
+        Connected database adapter
+    """
+    adapter = DatabaseFactory.create_adapter(db_type)
+    adapter.connect(db_config)
+    _ADAPTER_CACHE[_cache_key(db_type, db_config)] = adapter
+    return adapter
+
+
+def close_cached_adapters():
+    """Close every cached database adapter that is still open."""
+    while _ADAPTER_CACHE:
+        _, adapter = _ADAPTER_CACHE.popitem()
+        if adapter.is_healthy():
+            adapter.close()
+
+
+atexit.register(close_cached_adapters)
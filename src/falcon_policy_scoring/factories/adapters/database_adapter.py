@@ -83,6 +83,15 @@ class DatabaseAdapter(ABC):
         """Put a host record."""
         pass
 
+    def put_many_hosts(self, list_of_device_details, record_type=4):
+        """Put many host records at once.
+
+        Adapters override this to write the whole batch in one transaction;
+        the default stores each record with put_host().
+        """
+        for device_details in list_of_device_details:
+            self.put_host(device_details, record_type)
+
     def get_host(self, device_id):
         """Get a host record."""
         pass
@@ -99,6 +108,18 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    def put_many_host_zta(self, assessments):
+        """Store Zero Trust Assessment data for many hosts at once.
+
+        Adapters override this to write the whole set in one transaction;
+        the default stores each assessment with put_host_zta().
+
+        Args:
+            assessments: Iterable of (device_id, zta_data) pairs
+        """
+        for device_id, zta_data in assessments:
+            self.put_host_zta(device_id, zta_data)
+
     @abstractmethod
     def get_host_zta(self, device_id):
         """Get Zero Trust Assessment data for a host.
@@ -230,3 +251,7 @@ class DatabaseAdapter(ABC):
     def close(self):
         """Close the connection to the database."""
         pass
+
+    def is_healthy(self):
+        """Return True if the connection is open and can be reused."""
+        return True
@@ -47,6 +47,10 @@ class DynamoDBAdapter(DatabaseAdapter):
         self.dynamodb = None
         self._tables = {}
 
+    def is_healthy(self):
+        """Return True while the DynamoDB resource handle is held."""
+        return self.dynamodb is not None
+
     # ------------------------------------------------------------------
     # Connection lifecycle
     # ------------------------------------------------------------------
@@ -230,6 +234,21 @@ class DynamoDBAdapter(DatabaseAdapter):
             'device_id': device_id, 'epoch': epoch_now(), 'data': _pack(zta_data), })
         logging.info("DynamoDB ZTA record stored for device_id=%s", device_id)
 
+    def put_many_host_zta(self, assessments):
+        """Store Zero Trust Assessment data for many hosts via BatchWriteItem.
+
+        ``batch_writer`` sends up to 25 items per request and resends any
+        unprocessed items, instead of one PutItem round trip per host.
+        """
+        epoch = epoch_now()
+        count = 0
+        with self._table('host_zta').batch_writer(overwrite_by_pkeys=['device_id']) as batch:
+            for device_id, zta_data in assessments:
+                batch.put_item(Item={
+                    'device_id': device_id, 'epoch': epoch, 'data': _pack(zta_data), })
+                count += 1
+        logging.info("DynamoDB ZTA records stored for %s devices", count)
+
     def get_host_zta(self, device_id):
         """Get Zero Trust Assessment data for a host, or None."""
         response = self._table('host_zta').get_item(Key={'device_id': device_id})
@@ -25,6 +25,10 @@ class FoundryCollectionsAdapter(DatabaseAdapter):
         self.falcon = None
         self._app_id = None
 
+    def is_healthy(self):
+        """Return True while the Falcon API handle is held."""
+        return self.falcon is not None
+
     # ------------------------------------------------------------------
     # Connection lifecycle
     # ------------------------------------------------------------------
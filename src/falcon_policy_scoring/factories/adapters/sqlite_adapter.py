@@ -4,6 +4,23 @@ import logging
 from falcon_policy_scoring.factories.adapters.database_adapter import DatabaseAdapter
 from falcon_policy_scoring.utils.core import epoch_now
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dumps_text(obj):
+    """Serialize obj to a JSON string, using orjson's C encoder when installed.
+
+    Used on the bulk write paths (host details, ZTA) where encoding dominates;
+    the output parses back to the same data as ``json.dumps`` (orjson just
+    omits the spaces), including non-string keys, which both turn into strings.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
 
 class SQLiteAdapter(DatabaseAdapter):
     """SQLite adapter implementation."""
@@ -283,6 +300,32 @@ class SQLiteAdapter(DatabaseAdapter):
 
         self.conn.commit()
 
+    def put_many_hosts(self, list_of_device_details, record_type=4):
+        """
+        Store detailed device information for many hosts in one transaction.
+
+        Args:
+            list_of_device_details: List of dicts containing device information
+            record_type: Type of record (default: 4)
+        """
+        epoch = epoch_now()
+        rows = [
+            (device_details.get('cid', 'unknown_cid'), device_details.get('device_id', 'unknown_aid'),
+             record_type, epoch, _dumps_text(device_details))
+            for device_details in list_of_device_details
+        ]
+        if not rows:
+            return
+
+        self.cursor.executemany('''
+            INSERT INTO host_records (cid, aid, record_type, epoch, data)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(aid, record_type) DO UPDATE SET
+                cid = excluded.cid, epoch = excluded.epoch, data = excluded.data
+        ''', rows)
+        self.conn.commit()
+        logging.info(f"SQLite stored {len(rows)} host records, record_type {record_type}")
+
     def get_host(self, device_id, record_type=4):
         """
         Retrieve detailed device information.
@@ -330,6 +373,21 @@ class SQLiteAdapter(DatabaseAdapter):
         self.conn.commit()
         logging.info(f"Stored ZTA data for device {device_id}")
 
+    def put_many_host_zta(self, assessments):
+        """Store Zero Trust Assessment data for many hosts in one transaction."""
+        epoch = epoch_now()
+        rows = [(device_id, epoch, _dumps_text(zta_data)) for device_id, zta_data in assessments]
+        if not rows:
+            return
+
+        self.cursor.executemany('''
+            INSERT OR REPLACE INTO host_zta (device_id, epoch, data)
+            VALUES (?, ?, ?)
+        ''', rows)
+
+        self.conn.commit()
+        logging.info(f"Stored ZTA data for {len(rows)} devices")
+
     def get_host_zta(self, device_id):
         """Get Zero Trust Assessment data for a host."""
         self.cursor.execute('''
@@ -451,15 +509,10 @@ class SQLiteAdapter(DatabaseAdapter):
 
         graded_policies_json = json.dumps(graded_results)
 
-        # Delete existing record for this policy_type and CID
-        self.cursor.execute('''
-            DELETE FROM graded_policies
-            WHERE policy_type = ? AND cid = ?
-        ''', (policy_type, cid))
-
-        # Insert new record
+        # Replace any existing record for this policy_type and CID in one
+        # statement (UNIQUE(policy_type, cid))
         self.cursor.execute('''
-            INSERT INTO graded_policies (policy_type, cid, epoch, graded_policies,
+            INSERT OR REPLACE INTO graded_policies (policy_type, cid, epoch, graded_policies,
                                         total_policies, passed_policies, failed_policies)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', (policy_type, cid, epoch, graded_policies_json,
@@ -900,3 +953,13 @@ class SQLiteAdapter(DatabaseAdapter):
             self.conn.commit()
             self.conn.close()
             logging.info("SQLite database connection closed")
+
+    def is_healthy(self):
+        """Return True if the SQLite connection is open and responsive."""
+        if self.conn is None:
+            return False
+        try:
+            self.conn.execute('SELECT 1')
+        except sqlite3.Error:
+            return False
+        return True
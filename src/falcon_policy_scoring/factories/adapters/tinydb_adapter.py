@@ -134,6 +134,51 @@ class TinyDBAdapter(DatabaseAdapter):
         db_host_records = self.db.table('host_records', cache_size=0)
         self.update_or_create_record(db_host_records, resource, [device_details])
 
+    def put_many_hosts(self, list_of_device_details, record_type=4):
+        # Store many host records with one scan and at most three table writes
+        # (duplicate cleanup, updates, inserts) instead of one write per host
+        epoch = epoch_now()
+        new_values = {}
+        for device_details in list_of_device_details:
+            aid = device_details.get('device_id', 'unknown_aid')
+            new_values[aid] = {
+                'data': device_details,
+                'epoch': epoch,
+                'aid': aid,
+                'cid': device_details.get('cid', 'unknown_cid'),
+                'record_type': record_type
+            }
+        if not new_values:
+            return
+
+        q = Query()
+        db_host_records = self.db.table('host_records', cache_size=0)
+        existing = {}
+        duplicate_ids = []
+        for doc in db_host_records.search((q.record_type == record_type) & q.aid.one_of(list(new_values))):
+            current = existing.get(doc['aid'])
+            if current is None:
+                existing[doc['aid']] = doc
+                continue
+            # Keep the most recent record per aid, as update_or_create_record does
+            if doc.get('epoch', 0) > current.get('epoch', 0):
+                existing[doc['aid']], doc = doc, current
+            duplicate_ids.append(doc.doc_id)
+
+        if duplicate_ids:
+            logging.warning(f"Removing {len(duplicate_ids)} duplicate host records, record_type {record_type}")
+            db_host_records.remove(doc_ids=duplicate_ids)
+
+        if existing:
+            db_host_records.update(lambda doc: doc.update(new_values[doc['aid']]),
+                                   doc_ids=[doc.doc_id for doc in existing.values()])
+
+        inserts = [values for aid, values in new_values.items() if aid not in existing]
+        if inserts:
+            db_host_records.insert_multiple(inserts)
+
+        logging.info(f"TinyDB stored {len(new_values)} host records, record_type {record_type}")
+
     def get_host(self, device_id, record_type=4):
         # given a device_id, retrieve the latest host record from TinyDB
         q = Query()
@@ -193,6 +238,24 @@ class TinyDBAdapter(DatabaseAdapter):
         db_host_zta.insert(record)
         logging.info(f"Stored ZTA data for device {device_id}")
 
+    def put_many_host_zta(self, assessments):
+        """Store Zero Trust Assessment data for many hosts with one remove and one insert."""
+        epoch = epoch_now()
+        records = {
+            device_id: {'device_id': device_id, 'epoch': epoch, 'data': zta_data}
+            for device_id, zta_data in assessments
+        }
+        if not records:
+            return
+
+        q = Query()
+        db_host_zta = self.db.table('host_zta', cache_size=0)
+
+        # Replace any existing records for these devices
+        db_host_zta.remove(q.device_id.one_of(list(records)))
+        db_host_zta.insert_multiple(records.values())
+        logging.info(f"Stored ZTA data for {len(records)} devices")
+
     def get_host_zta(self, device_id):
         """Get Zero Trust Assessment data for a host."""
         q = Query()
@@ -323,11 +386,8 @@ class TinyDBAdapter(DatabaseAdapter):
         q = Query()
         db_graded = self.db.table(table_name, cache_size=0)
 
-        # Remove any existing record for this CID
-        db_graded.remove(q.cid == cid)
-
-        # Insert the new record
-        doc_id = db_graded.insert(record)
+        # Replace any existing record for this CID (a single write either way)
+        doc_id = db_graded.upsert(record, q.cid == cid)[0]
         logging.info(
             f"TinyDB {table_name} record created for CID {cid} with doc_id {doc_id} "
             f"({passed_policies}/{total_policies} policies passed)"
@@ -693,3 +753,7 @@ class TinyDBAdapter(DatabaseAdapter):
     def close(self):
         self.db.close()
         # Close the TinyDB database
+
+    def is_healthy(self):
+        # TinyDB tracks whether close() has been called on the instance
+        return self.db is not None and getattr(self.db, '_opened', True)
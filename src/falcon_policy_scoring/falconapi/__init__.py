@@ -13,6 +13,7 @@ from falcon_policy_scoring.falconapi.policies import (
 )
 from falcon_policy_scoring.falconapi.zero_trust import (
     fetch_zero_trust_assessments,
+    iter_zero_trust_assessments,
     query_assessments_by_score,
     get_audit_report
 )
@@ -43,6 +44,7 @@ __all__ = [
     'check_scope_permission_error',
     # Zero Trust
     'fetch_zero_trust_assessments',
+    'iter_zero_trust_assessments',
     'query_assessments_by_score',
     'get_audit_report',
     # Firewall
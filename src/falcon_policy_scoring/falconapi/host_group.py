@@ -6,7 +6,10 @@ Optimized for large host groups (20K+ members).
 """
 
 import logging
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List
+
+from falcon_policy_scoring.utils.constants import DEFAULT_FETCH_WORKERS
 
 
 class HostGroup:
@@ -149,32 +152,36 @@ class HostGroup:
         logging.info("Fetched %s device IDs from group %s", len(all_device_ids), group_id)
         return all_device_ids
 
-    def get_device_ids_from_groups(self, group_names: List[str]) -> List[str]:
+    def get_device_ids_from_groups(self, group_names: List[str]) -> FrozenSet[str]:
         """
         Get all unique device IDs from multiple host groups (union).
 
+        Overlapping groups are de-duplicated; convert to a list only where an
+        API call needs one.
+
         Args:
             group_names: List of host group names
 
         Returns:
-            List of unique device IDs across all groups
+            Frozen set of unique device IDs across all groups
         """
         if not group_names:
-            return []
+            return frozenset()
 
         # Resolve names to IDs
         name_to_id = self.resolve_group_names_to_ids(group_names)
 
-        # Collect all device IDs from all groups
-        all_device_ids = []
-        for group_name, group_id in name_to_id.items():
-            logging.info("Fetching members from group '%s' (%s)...", group_name, group_id)
-            device_ids = self.get_all_group_members(group_id)
-            all_device_ids.extend(device_ids)
+        # Page through each group's members concurrently; groups are independent
+        workers = min(DEFAULT_FETCH_WORKERS, len(name_to_id)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            members = list(executor.map(self.get_all_group_members, name_to_id.values()))
+
+        all_device_ids = set()
+        for group_name, device_ids in zip(name_to_id, members):
+            all_device_ids.update(device_ids)
             logging.info("  Found %s devices in '%s'", len(device_ids), group_name)
 
-        # Return unique device IDs (union of all groups)
-        unique_ids = list(set(all_device_ids))
-        logging.info("Total unique devices across %s groups: %s", len(group_names), len(unique_ids))
+        logging.info("Total unique devices across %s groups: %s", len(group_names), len(all_device_ids))
 
-        return unique_ids
+        # Unique device IDs (union of all groups)
+        return frozenset(all_device_ids)
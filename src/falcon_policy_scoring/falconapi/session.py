@@ -0,0 +1,75 @@
+"""Shared HTTP session and cached clients for FalconPy."""
+import atexit
+import hashlib
+from typing import TYPE_CHECKING, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from falconpy import APIHarnessV2
+
+# Sized for the concurrent host-detail and policy fetches, so worker threads
+# do not have to discard pooled connections.
+SESSION_POOL_MAXSIZE = 16
+
+
+def create_session() -> requests.Session:
+    """Create a keep-alive HTTP session to attach to an APIHarnessV2 client.
+
+    Without a session FalconPy opens a new connection (DNS lookup, TCP and TLS
+    handshake) for every request. The session pools connections across calls
+    and retries transient connection failures on idempotent requests with a
+    short backoff; HTTP error statuses are left to the callers.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=SESSION_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=None)
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+# Falcon API clients keyed by a hash of their credentials, so every setup path
+# in the process shares one authenticated client and its HTTP connections
+_FALCON_CLIENTS: Dict[str, 'APIHarnessV2'] = {}
+
+
+def get_falcon_client(**credentials: str) -> 'APIHarnessV2':
+    """Return the cached Falcon API client for these credentials, creating it on first use.
+
+    Args:
+        **credentials: APIHarnessV2 keyword arguments (client_id, client_secret, base_url)
+
+    Returns:
+        APIHarnessV2 instance backed by a keep-alive requests.Session
+    """
+    key_material = '|'.join(str(credentials.get(name)) for name in ('client_id', 'client_secret', 'base_url'))
+    cache_key = hashlib.sha256(key_material.encode()).hexdigest()
+
+    falcon = _FALCON_CLIENTS.get(cache_key)
+    if falcon is None:
+        from falconpy import APIHarnessV2
+
+        falcon = APIHarnessV2(**credentials)
+        falcon.session = create_session()
+        _FALCON_CLIENTS[cache_key] = falcon
+    return falcon
+
+
+def close_falcon_clients():
+    """Close the HTTP sessions of every cached Falcon API client."""
+    while _FALCON_CLIENTS:
+        _, falcon = _FALCON_CLIENTS.popitem()
+        session = getattr(falcon, 'session', None)
+        if session is not None:
+            session.close()
+
+
+atexit.register(close_falcon_clients)
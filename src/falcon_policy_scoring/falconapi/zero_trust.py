@@ -5,42 +5,29 @@ Handles fetching Zero Trust Assessment data for hosts.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
-def fetch_zero_trust_assessments(falcon, device_ids: List[str]) -> Dict:
+def iter_zero_trust_assessments(falcon, device_ids: List[str],
+                                errors: List[Dict]) -> Iterator[List[Tuple[str, Dict]]]:
     """
-    Fetch Zero Trust Assessment data for a list of device IDs (AIDs).
+    Yield Zero Trust Assessment data one API batch at a time.
 
-    Uses the getAssessmentV1 API endpoint which accepts device IDs (AIDs)
-    and returns ZTA assessment data including:
-    - aid: Agent/Device ID
-    - cid: Customer ID
-    - assessment: Dict with sensor_config, os, and overall scores
-    - assessment_items: Dict with os_signals and sensor_signals arrays
-    - modified_time: Last update timestamp
-    - sensor_file_status: Deployment status
+    Streaming variant of fetch_zero_trust_assessments(): each batch of
+    ``(device_id, assessment)`` pairs is yielded as soon as it is retrieved, so
+    only one batch is held in memory. The generator is synchronous; the next
+    batch is requested once the caller has finished with the current one.
 
     Args:
         falcon: FalconPy APIHarnessV2 instance
         device_ids: List of device IDs (AIDs) to fetch assessments for
+        errors: List that batch and exception error dicts are appended to
 
-    Returns:
-        dict: {
-            'assessments': {device_id: assessment_data},
-            'count': int,
-            'errors': list of error dicts
-        }
+    Yields:
+        list: ``(device_id, assessment_data)`` tuples for one batch
     """
-    if not device_ids:
-        logging.warning("No device IDs provided for ZTA fetch")
-        return {'assessments': {}, 'count': 0, 'errors': []}
-
     logging.info("Fetching Zero Trust Assessments for %s devices...", len(device_ids))
 
-    assessments = {}
-    errors = []
-
     try:
         # Fetch in batches of 100 (API limit)
         batch_size = 100
@@ -53,17 +40,14 @@ def fetch_zero_trust_assessments(falcon, device_ids: List[str]) -> Dict:
                 resources = response['body'].get('resources', [])
                 logging.info("Retrieved %s ZTA assessments from batch", len(resources))
 
-                # Index by device ID (aid)
-                for assessment in resources:
-                    aid = assessment.get('aid')
-                    if aid:
-                        assessments[aid] = assessment
-
                 # Capture any errors
                 batch_errors = response['body'].get('errors', [])
                 if batch_errors:
                     errors.extend(batch_errors)
                     logging.warning("Batch had %s errors", len(batch_errors))
+
+                # Index by device ID (aid)
+                yield [(assessment['aid'], assessment) for assessment in resources if assessment.get('aid')]
             else:
                 error_msg = f"Failed to fetch ZTA batch: status {response['status_code']}"
                 logging.error(error_msg)
@@ -81,6 +65,40 @@ def fetch_zero_trust_assessments(falcon, device_ids: List[str]) -> Dict:
             'message': error_msg
         })
 
+
+def fetch_zero_trust_assessments(falcon, device_ids: List[str]) -> Dict:
+    """
+    Fetch Zero Trust Assessment data for a list of device IDs (AIDs).
+
+    Uses the getAssessmentV1 API endpoint which accepts device IDs (AIDs)
+    and returns ZTA assessment data including:
+    - aid: Agent/Device ID
+    - cid: Customer ID
+    - assessment: Dict with sensor_config, os, and overall scores
+    - assessment_items: Dict with os_signals and sensor_signals arrays
+    - modified_time: Last update timestamp
+    - sensor_file_status: Deployment status
+
+    Args:
+        falcon: FalconPy APIHarnessV2 instance
+        device_ids: List of device IDs (AIDs) to fetch assessments for
+
+    Returns:
+        dict: {
+            'assessments': {device_id: assessment_data},
+            'count': int,
+            'errors': list of error dicts
+        }
+    """
+    if not device_ids:
+        logging.warning("No device IDs provided for ZTA fetch")
+        return {'assessments': {}, 'count': 0, 'errors': []}
+
+    assessments = {}
+    errors = []
+    for batch in iter_zero_trust_assessments(falcon, device_ids, errors):
+        assessments.update(batch)
+
     logging.info("ZTA fetch complete: %s assessments, %s errors", len(assessments), len(errors))
 
     return {
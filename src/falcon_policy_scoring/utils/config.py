@@ -1,8 +1,20 @@
 """Configuration file utilities for loading and parsing YAML config files."""
+import copy
 import os
+from collections import OrderedDict
 import yaml
 from falcon_policy_scoring.utils.constants import POLICY_TYPE_REGISTRY
 
+# libyaml's C-accelerated safe loader when PyYAML was built with it, otherwise
+# the pure-Python SafeLoader (identical safe_load semantics either way).
+YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML documents keyed by absolute path -> ((st_mtime_ns, st_size), data).
+# Every read re-stats the file, so an edited config is always reparsed; callers
+# get a deep copy so mutating the returned config cannot corrupt the cache.
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+
 
 def _load_config_defaults(config):
     # Ensure we have a dict to work with
@@ -32,7 +44,9 @@ def _load_config_defaults(config):
     config.setdefault('host_fetching', {})
     hf = config['host_fetching']
     hf['batch_size'] = hf.get('batch_size', 100)
+    hf['max_batch_size'] = hf.get('max_batch_size', 5000)
     hf['progress_threshold'] = hf.get('progress_threshold', 500)
+    hf['workers'] = hf.get('workers', 4)
 
     # Logging defaults
     config.setdefault('logging', {})
@@ -72,6 +86,38 @@ def _load_config_defaults(config):
     return config
 
 
+def _load_yaml_cached(config_file):
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        config_file: Path to the YAML file
+
+    Returns:
+        Deep copy of the parsed document (empty dict for an empty file)
+
+    Raises:
+        FileNotFoundError, PermissionError, yaml.YAMLError: As raised by the
+            underlying stat/open/parse.
+    """
+    path = os.path.abspath(config_file)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        _YAML_CACHE.move_to_end(path)
+        return copy.deepcopy(cached[1])
+
+    with open(path, 'r', encoding='utf-8') as file:
+        data = yaml.load(file, Loader=YamlSafeLoader) or {}
+
+    _YAML_CACHE[path] = (signature, data)
+    _YAML_CACHE.move_to_end(path)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
 def read_config_from_yaml(config_file="config/config.yaml"):
     """Read and parse YAML configuration file with defaults.
 
@@ -94,8 +140,7 @@ def read_config_from_yaml(config_file="config/config.yaml"):
     set_grading_dir(os.path.join(config_dir, 'grading'))
 
     try:
-        with open(config_file, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file) or {}
+        config = _load_yaml_cached(config_file)
     except (FileNotFoundError, PermissionError, yaml.YAMLError) as e:
         print(f"Error reading App configuration from {config_file}: {e}")
         config = {}
@@ -2,6 +2,7 @@
 
 Constants used across CLI, daemon, and utils modules.
 """
+import sys
 from enum import Enum
 from typing import Dict
 
@@ -11,6 +12,13 @@ DEFAULT_POLICY_TTL_SECONDS = 600
 DEFAULT_HOSTS_TTL_SECONDS = 300
 DEFAULT_BATCH_SIZE = 100
 DEFAULT_PROGRESS_THRESHOLD = 500
+DEFAULT_MAX_BATCH_SIZE = 5000  # GetDeviceDetailsV2 accepts up to 5000 IDs per request
+DEFAULT_FETCH_WORKERS = 4  # Concurrent device-details API calls during host fetch
+DEFAULT_POLICY_FETCH_WORKERS = 8  # Policy types fetched and graded concurrently
+MAX_RICH_TABLE_ROWS = 500  # Larger text tables render as a borderless PlainTable
+
+# Slotted dataclasses require Python 3.10+; older interpreters get a plain one.
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 # API constants
 API_COMMAND_GET_DEVICE_DETAILS = 'GetDeviceDetailsV2'
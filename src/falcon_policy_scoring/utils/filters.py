@@ -3,7 +3,7 @@
 Pure business logic for filtering data. No UI dependencies.
 Shared between CLI and daemon modules.
 """
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 
 from .constants import DEFAULT_TAG_PREFIX, VALID_TAG_PREFIXES
 
@@ -73,31 +73,68 @@ def parse_tags(tags_arg: Optional[str]) -> Optional[List[str]]:
     return tags if tags else None
 
 
-def matches_status_filter(policy: Dict, status_filter: Optional[str]) -> bool:
-    """Check if policy matches status filter.
+def _is_graded(policy: Dict) -> bool:
+    """True for policies that were graded (not ungradable)."""
+    return policy.get('grading_status', 'graded') == 'graded'
+
+
+def _is_passed(policy: Dict) -> bool:
+    """Predicate for the 'passed' status filter."""
+    return _is_graded(policy) and bool(policy.get('passed', False))
+
+
+def _is_failed(policy: Dict) -> bool:
+    """Predicate for the 'failed' status filter."""
+    return _is_graded(policy) and not policy.get('passed', False)
+
+
+def _is_ungradable(policy: Dict) -> bool:
+    """Predicate for the 'ungradable' status filter."""
+    return policy.get('grading_status', 'graded') == 'ungradable'
+
+
+def _match_all(_policy: Dict) -> bool:
+    """Predicate used when no status filter is set."""
+    return True
+
+
+def _match_none(_policy: Dict) -> bool:
+    """Predicate for unrecognised status filters."""
+    return False
+
+
+_STATUS_PREDICATES: Dict[str, Callable[[Dict], bool]] = {
+    'passed': _is_passed,
+    'failed': _is_failed,
+    'ungradable': _is_ungradable,
+}
+
+
+def make_status_predicate(status_filter: Optional[str]) -> Callable[[Dict], bool]:
+    """Resolve a status filter to a policy predicate once, ahead of a filter loop.
 
     Args:
-        policy: Policy dictionary with grading_status and passed fields
         status_filter: Filter string ('passed', 'failed', 'ungradable', or None)
 
     Returns:
-        True if matches filter, False otherwise
+        Callable taking a policy dictionary and returning whether it matches
     """
     if not status_filter:
-        return True
+        return _match_all
+    return _STATUS_PREDICATES.get(status_filter, _match_none)
 
-    grading_status = policy.get('grading_status', 'graded')
 
-    # Handle ungradable filter
-    if status_filter == 'ungradable':
-        return grading_status == 'ungradable'
+def matches_status_filter(policy: Dict, status_filter: Optional[str]) -> bool:
+    """Check if policy matches status filter.
 
-    # For passed/failed filters, only consider graded policies
-    if grading_status != 'graded':
-        return False
+    Args:
+        policy: Policy dictionary with grading_status and passed fields
+        status_filter: Filter string ('passed', 'failed', 'ungradable', or None)
 
-    passed = policy.get('passed', False)
-    return (status_filter == 'passed' and passed) or (status_filter == 'failed' and not passed)
+    Returns:
+        True if matches filter, False otherwise
+    """
+    return make_status_predicate(status_filter)(policy)
 
 
 def get_platform_name(policy_result: Dict) -> str:
@@ -129,16 +166,16 @@ def filter_policies(
     """
     filtered = []
 
-    for policy in policies:
-        # Get platform name
-        platform_name = get_platform_name(policy)
+    platform_filter = platform_filter.lower() if platform_filter else None
+    status_matches = make_status_predicate(status_filter)
 
+    for policy in policies:
         # Apply platform filter
-        if platform_filter and platform_name.lower() != platform_filter.lower():
+        if platform_filter and get_platform_name(policy).lower() != platform_filter:
             continue
 
         # Apply status filter
-        if status_filter and not matches_status_filter(policy, status_filter):
+        if not status_matches(policy):
             continue
 
         filtered.append(policy)
@@ -5,6 +5,8 @@ Shared between CLI and daemon modules.
 """
 from typing import Dict, List, Optional
 
+from .models import HostFetchingConfig
+
 
 def _get_sca_status(device_id: str, sca_coverage_index: Dict) -> str:
     """Determine Secure Configuration Assessment status for a single host.
@@ -107,7 +109,8 @@ def find_host_by_name(adapter, cid: str, hostname: str) -> Optional[Dict]:
 
 
 def collect_host_data(adapter, cid: str, policy_records: Dict,
-                      get_policy_status_func, config: Dict = None) -> List[Dict]:
+                      get_policy_status_func, config: Dict = None,
+                      hosts_in_db: Optional[Dict] = None) -> List[Dict]:
     """Collect host data with policy status.
 
     Args:
@@ -116,11 +119,14 @@ def collect_host_data(adapter, cid: str, policy_records: Dict,
         policy_records: Dictionary of policy records by type
         get_policy_status_func: Function to get policy status
         config: Configuration dictionary (optional)
+        hosts_in_db: Host list record already read via ``adapter.get_hosts(cid)``
+            (optional; read from the adapter when omitted)
 
     Returns:
         List of host data dictionaries
     """
-    hosts_in_db = adapter.get_hosts(cid)
+    if hosts_in_db is None:
+        hosts_in_db = adapter.get_hosts(cid)
     if not hosts_in_db or 'hosts' not in hosts_in_db:
         return []
 
@@ -133,6 +139,8 @@ def collect_host_data(adapter, cid: str, policy_records: Dict,
     sca_coverage_record = adapter.get_sca_coverage(cid)
     sca_coverage_index = sca_coverage_record.get('coverage_index', {}) if sca_coverage_record else {}
 
+    include_zta = HostFetchingConfig.from_config(config).include_zta
+
     host_rows = []
 
     for host in hosts_in_db['hosts']:
@@ -182,7 +190,6 @@ def collect_host_data(adapter, cid: str, policy_records: Dict,
 
         # Fetch Zero Trust Assessment data (if enabled)
         zta_assessment = None
-        include_zta = config.get('host_fetching', {}).get('include_zta', True) if config else True
         if include_zta:
             zta_data = adapter.get_host_zta(device_id)
             if zta_data and 'assessment' in zta_data:
@@ -245,33 +252,55 @@ def calculate_host_stats(host_rows: List[Dict]) -> Dict:
     }
 
 
-def process_host_batch(falcon, adapter, batch: List[str]) -> tuple:
-    """Process a batch of host IDs and fetch their details.
+def fetch_host_details(falcon, batch: List[str]) -> Optional[List[Dict]]:
+    """Fetch device details for a batch of host IDs (API call only, no storage).
+
+    Safe to call from worker threads; it does not touch the database adapter.
 
     Args:
         falcon: FalconPy API client
+        batch: List of host IDs to fetch
+
+    Returns:
+        List of device detail records, or None if the request failed
+    """
+    from .constants import API_COMMAND_GET_DEVICE_DETAILS
+
+    response = falcon.command(API_COMMAND_GET_DEVICE_DETAILS, ids=batch)
+    if response['status_code'] != 200:
+        return None
+    return response['body'].get('resources', [])
+
+
+def store_host_details(adapter, batch: List[str], resources: Optional[List[Dict]]) -> tuple:
+    """Store device detail records fetched for a batch of host IDs.
+
+    Args:
         adapter: Database adapter
-        batch: List of host IDs to process
+        batch: List of host IDs the records were fetched for
+        resources: Result of :func:`fetch_host_details`
 
     Returns:
         Tuple of (fetched_count, error_count)
     """
-    from .constants import API_COMMAND_GET_DEVICE_DETAILS
+    if resources is None:
+        return 0, len(batch)
 
-    fetched_count = 0
-    error_count = 0
+    records = [host_data for host_data in resources if host_data.get('device_id')]
+    adapter.put_many_hosts(records)
 
-    # Fetch host details
-    response = falcon.command(API_COMMAND_GET_DEVICE_DETAILS, ids=batch)
+    return len(records), 0
+
+
+def process_host_batch(falcon, adapter, batch: List[str]) -> tuple:
+    """Process a batch of host IDs and fetch their details.
 
-    if response['status_code'] == 200:
-        resources = response['body'].get('resources', [])
-        for host_data in resources:
-            device_id = host_data.get('device_id')
-            if device_id:
-                adapter.put_host(host_data)
-                fetched_count += 1
-    else:
-        error_count = len(batch)
-
-    return fetched_count, error_count
+    Args:
+        falcon: FalconPy API client
+        adapter: Database adapter
+        batch: List of host IDs to process
+
+    Returns:
+        Tuple of (fetched_count, error_count)
+    """
+    return store_host_details(adapter, batch, fetch_host_details(falcon, batch))
@@ -7,6 +7,7 @@ import sys
 from typing import Dict, List
 from falcon_policy_scoring import __version__ as APP_VERSION
 from .constants import POLICY_TYPE_REGISTRY
+from .models import HostFetchingConfig
 from .metadata_builder import build_report_metadata
 from .datetime_utils import get_utc_iso_timestamp
 from .policy_helpers import (
@@ -253,6 +254,7 @@ def build_json_output(adapter, cid: str, config: Dict, args) -> Dict:
 
         all_passed_count = 0
         any_failed_count = 0
+        include_zta = HostFetchingConfig.from_config(config).include_zta
 
         for host in host_data:
             # Apply filters
@@ -353,7 +355,6 @@ def build_json_output(adapter, cid: str, config: Dict, args) -> Dict:
                 host_output["host_record"] = host_record['data']
 
             # Include Zero Trust Assessment data if enabled and available
-            include_zta = config.get('host_fetching', {}).get('include_zta', True)
             if include_zta:
                 zta_data = adapter.get_host_zta(host['device_id']) if hasattr(adapter, 'get_host_zta') else None
                 if zta_data:
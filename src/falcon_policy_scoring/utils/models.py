@@ -1,9 +1,17 @@
 """Domain models for business logic."""
 from dataclasses import dataclass
-from typing import Optional, Callable
+from typing import Dict, List, Optional, Callable
 
+from .constants import (
+    DATACLASS_OPTIONS,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FETCH_WORKERS,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_PROGRESS_THRESHOLD,
+)
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class CacheInfo:
     """Cache information for a dataset.
 
@@ -57,6 +65,52 @@ class PolicyTypeInfo:
     grader_func: Optional[Callable] = None
 
 
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class HostFetchingConfig:
+    """Typed view of the ``host_fetching`` config section.
+
+    Attributes:
+        batch_size: Initial device-details batch size
+        max_batch_size: Upper bound for the adaptive batch size
+        progress_threshold: Host count above which a progress bar is shown
+        workers: Concurrent device-details API calls
+        include_zta: Whether Zero Trust Assessments are fetched and shown
+    """
+    batch_size: int = DEFAULT_BATCH_SIZE
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    progress_threshold: int = DEFAULT_PROGRESS_THRESHOLD
+    workers: int = DEFAULT_FETCH_WORKERS
+    include_zta: bool = True
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> 'HostFetchingConfig':
+        """Build from a loaded config dict; missing keys (or config) use defaults."""
+        section = (config or {}).get('host_fetching') or {}
+        return cls(
+            batch_size=section.get('batch_size', DEFAULT_BATCH_SIZE),
+            max_batch_size=section.get('max_batch_size', DEFAULT_MAX_BATCH_SIZE),
+            progress_threshold=section.get('progress_threshold', DEFAULT_PROGRESS_THRESHOLD),
+            workers=section.get('workers', DEFAULT_FETCH_WORKERS),
+            include_zta=section.get('include_zta', True),
+        )
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class HostFilters:
+    """Server-side host filters applied in the device query FQL.
+
+    Attributes:
+        host_group_names: Host group names to resolve to IDs and filter by
+        last_seen_filter: FQL filter for the last_seen time period
+        host_group_ids: Host group IDs to filter by directly
+        tags: Normalized Falcon tags to filter by
+    """
+    host_group_names: Optional[List[str]] = None
+    last_seen_filter: Optional[str] = None
+    host_group_ids: Optional[List[str]] = None
+    tags: Optional[List[str]] = None
+
+
 # Unused models - defined for future use but not currently implemented
 # These would be useful for replacing dict-based data passing with typed dataclasses
 
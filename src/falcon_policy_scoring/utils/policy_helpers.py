@@ -3,7 +3,8 @@
 Pure business logic for policy operations. No UI dependencies.
 Shared between CLI and daemon modules.
 """
-from typing import Dict, Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from falcon_policy_scoring.utils.constants import POLICY_TYPE_REGISTRY
 
 
@@ -111,19 +112,28 @@ def determine_policy_types_to_display(policy_type_arg: str) -> List[str]:
     Returns:
         List of policy type keys to display
     """
+    return list(_resolve_policy_type_arg(policy_type_arg))
+
+
+@lru_cache(maxsize=32)
+def _resolve_policy_type_arg(policy_type_arg: str) -> Tuple[str, ...]:
+    """Memoized resolution behind determine_policy_types_to_display.
+
+    A run resolves the same ``-t`` value from several views, so the parsed
+    result is cached per argument string and copied out by the caller.
+    """
     if policy_type_arg == 'all':
         # All gradable types in registry order
-        return [k for k, v in POLICY_TYPE_REGISTRY.items() if v.get('gradable', True)]
+        return tuple(k for k, v in POLICY_TYPE_REGISTRY.items() if v.get('gradable', True))
 
     # Map from CLI format (with hyphens) to internal format (with underscores)
     type_mapping = {v['cli_name']: k for k, v in POLICY_TYPE_REGISTRY.items()}
 
-    result = []
-    for policy_type in [t.strip() for t in policy_type_arg.split(',')]:
-        if policy_type in type_mapping:
-            result.append(type_mapping[policy_type])
-
-    return result
+    return tuple(
+        type_mapping[policy_type]
+        for policy_type in (t.strip() for t in policy_type_arg.split(','))
+        if policy_type in type_mapping
+    )
 
 
 def get_platform_name(policy_result: Dict) -> str:
@@ -1,5 +1,6 @@
 """Policy type registry for centralized policy metadata."""
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 from .models import PolicyTypeInfo
 from .constants import POLICY_TYPE_REGISTRY
 
@@ -43,6 +44,10 @@ class PolicyTypeRegistry:
             key: PolicyTypeInfo(**data, grader_func=_grader_funcs.get(key))
             for key, data in POLICY_TYPE_REGISTRY.items()
         }
+        # Reverse index for CLI argument names (e.g., 'sensor-update' -> 'sensor_update')
+        self._cli_index = {info.cli_name: key for key, info in self._registry.items()}
+        # The registry is fixed after init, so one read-only view serves every get_all()
+        self._registry_view = MappingProxyType(self._registry)
 
     def get(self, policy_type: str) -> Optional[PolicyTypeInfo]:
         """Get policy type information.
@@ -55,13 +60,13 @@ class PolicyTypeRegistry:
         """
         return self._registry.get(policy_type)
 
-    def get_all(self) -> Dict[str, PolicyTypeInfo]:
+    def get_all(self) -> Mapping[str, PolicyTypeInfo]:
         """Get all policy types.
 
         Returns:
-            Dictionary of all policy types
+            Read-only mapping of all policy types
         """
-        return self._registry.copy()
+        return self._registry_view
 
     def get_by_cli_name(self, cli_name: str) -> Optional[PolicyTypeInfo]:
         """Get policy type by CLI argument name.
@@ -72,10 +77,19 @@ class PolicyTypeRegistry:
         Returns:
             PolicyTypeInfo or None if not found
         """
-        for info in self._registry.values():
-            if info.cli_name == cli_name:
-                return info
-        return None
+        key = self._cli_index.get(cli_name)
+        return self._registry[key] if key is not None else None
+
+    def get_key_by_cli_name(self, cli_name: str) -> Optional[str]:
+        """Get the policy type key for a CLI argument name.
+
+        Args:
+            cli_name: CLI argument name (e.g., 'sensor-update')
+
+        Returns:
+            Policy type key (e.g., 'sensor_update') or None if not found
+        """
+        return self._cli_index.get(cli_name)
 
     def get_all_types(self) -> List[str]:
         """Get list of all policy type keys.
@@ -149,6 +149,13 @@ class TestDynamoDBHostZTA:
     def test_get_zta_returns_none_for_missing(self, dynamodb_adapter):
         assert dynamodb_adapter.get_host_zta('no-such-aid') is None
 
+    def test_put_many_host_zta(self, dynamodb_adapter):
+        assessments = [(f'aid-{i}', {'score': i}) for i in range(30)]
+        assessments.append(('aid-0', {'score': 99}))  # duplicate key: last write wins
+        dynamodb_adapter.put_many_host_zta(assessments)
+        assert dynamodb_adapter.get_host_zta('aid-29') == {'score': 29}
+        assert dynamodb_adapter.get_host_zta('aid-0') == {'score': 99}
+
 
 # ---------------------------------------------------------------------------
 # Policies
@@ -468,3 +468,38 @@ class TestSQLiteJSON:
         assert data['backslash'] == 'C:\\Windows\\System32'
         assert data['newline'] == 'Line1\nLine2'
         assert data['unicode'] == '你好世界 🌍'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_bulk_zta_json_round_trip(self, sqlite_adapter, use_orjson, monkeypatch):
+        """Test bulk ZTA writes round-trip with and without the orjson encoder."""
+        from falcon_policy_scoring.factories.adapters import sqlite_adapter as module
+        if use_orjson and module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(module, 'orjson', None)
+
+        zta = {'assessment': {'overall': 72}, 'note': 'Line1\nLine2 "quoted" 你好 🌍'}
+        sqlite_adapter.put_many_host_zta([('device-1', zta)])
+
+        assert sqlite_adapter.get_host_zta('device-1') == zta
+        raw = sqlite_adapter.cursor.execute(
+            "SELECT typeof(data) FROM host_zta WHERE device_id = 'device-1'"
+        ).fetchone()[0]
+        assert raw == 'text'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_bulk_host_json_round_trip(self, sqlite_adapter, use_orjson, monkeypatch):
+        """Test bulk host-detail writes round-trip with and without the orjson encoder."""
+        from falcon_policy_scoring.factories.adapters import sqlite_adapter as module
+        if use_orjson and module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(module, 'orjson', None)
+
+        details = {'cid': 'cid-1', 'device_id': 'device-1', 'hostname': 'h\u00f6st',
+                   'device_policies': {'prevention': {'policy_id': 'p-1', 'applied': True}},
+                   'slots': {1: 'numeric key'}}
+        sqlite_adapter.put_many_hosts([details])
+
+        expected = dict(details, slots={'1': 'numeric key'})
+        assert sqlite_adapter.get_host('device-1')['data'] == expected
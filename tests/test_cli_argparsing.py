@@ -7,11 +7,19 @@ position — before OR after the subcommand — via a shared parent parser with
 flag after the subcommand produced ``error: unrecognized arguments``.
 """
 import argparse
+from unittest.mock import patch
+
 import pytest
+from freezegun import freeze_time
 
 from falcon_policy_scoring.cli.cli_setup import (
     build_parser,
+    parse_arguments,
     _apply_global_defaults,
+    _cached_parser,
+    _fast_parse_arguments,
+    validate_policy_types,
+    validate_last_seen,
     GLOBAL_DEFAULTS,
 )
 
@@ -41,6 +49,11 @@ class TestGlobalDefaults:
         assert args.verbose is False
         assert args.client_id is None
 
+    @pytest.mark.parametrize("fmt,expected", [('text', False), ('json', True), ('csv', True)])
+    def test_json_output_mode_derived_from_format(self, fmt, expected):
+        args = _parse(['policies', '--output-format', fmt])
+        assert args.json_output_mode is expected
+
     def test_all_global_dests_present_after_defaults(self):
         args = _parse(['policies'])
         for dest in GLOBAL_DEFAULTS:
@@ -119,3 +132,120 @@ class TestSubcommandHelpAdvertisesGlobals:
             parser.parse_args([cmd, '--help'])
         out = capsys.readouterr().out
         assert '--output-format' in out
+
+
+class TestFastPathParser:
+    """The table-driven fast path must agree with the full argparse tree."""
+
+    @pytest.mark.parametrize("argv", [
+        ['fetch'],
+        ['fetch', '-t', 'prevention,firewall', '-v'],
+        ['policies', '--output-format', 'json', '-c', 'cfg.yaml'],
+        ['hosts', '--type', 'all', '--output-file', 'out.txt'],
+        ['regrade', '--client-id', 'id', '--client-secret', 'secret', '--base-url', 'EU1'],
+        ['daemon'],
+        ['daemon', '-c', 'cfg.yaml', '-o', '/tmp/out', '--health-port', '9000', '--immediate'],
+    ])
+    def test_matches_argparse(self, argv):
+        fast = _fast_parse_arguments(argv)
+        assert fast is not None
+        _apply_global_defaults(fast)
+        assert vars(fast) == vars(_parse(argv))
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        ['--version'],
+        ['-v', 'fetch'],
+        ['host', 'myhost'],
+        ['generate-schema'],
+        ['fetch', '--help'],
+        ['fetch', '--last-seen', 'day'],
+        ['fetch', '--type=prevention'],
+        ['fetch', '-t'],
+        ['fetch', '-t', 'bogus'],
+        ['policies', '--output-format', 'xml'],
+        ['daemon', '--health-port', 'abc'],
+    ])
+    def test_falls_back_to_argparse(self, argv):
+        assert _fast_parse_arguments(argv) is None
+
+
+class TestParserCache:
+    """The full argparse parser is built once and reused across parses."""
+
+    def test_parser_built_once(self):
+        _cached_parser.cache_clear()
+        try:
+            with patch('falcon_policy_scoring.cli.cli_setup.build_parser', wraps=build_parser) as mock_build:
+                first = parse_arguments(['host', 'myhost'])
+                second = parse_arguments(['host', 'other', '--output-format', 'json'])
+            assert mock_build.call_count == 1
+            assert (first.hostname, first.output_format) == ('myhost', 'text')
+            assert (second.hostname, second.output_format) == ('other', 'json')
+        finally:
+            _cached_parser.cache_clear()
+
+    def test_build_parser_returns_fresh_instance(self):
+        assert build_parser() is not build_parser()
+
+
+class TestChoiceOptions:
+    """Restricted-value options accept their choices and reject anything else."""
+
+    @pytest.mark.parametrize("argv,dest,expected", [
+        (['policies', '-p', 'Mac'], 'platform', 'Mac'),
+        (['policies', '-s', 'ungradable'], 'status', 'ungradable'),
+        (['hosts', '-s', 'any-failed'], 'host_status', 'any-failed'),
+        (['hosts', '--sort', 'hostname'], 'sort', 'hostname'),
+        (['generate-schema', 'metrics'], 'report_type', 'metrics'),
+        (['generate-schema'], 'report_type', None),
+    ])
+    def test_valid_choice(self, argv, dest, expected):
+        assert getattr(_parse(argv), dest) == expected
+
+    @pytest.mark.parametrize("argv", [
+        ['policies', '-p', 'mac'],
+        ['hosts', '--sort', 'score'],
+        ['generate-schema', 'bogus'],
+        ['--output-format', 'xml', 'policies'],
+    ])
+    def test_invalid_choice_rejected(self, argv, capsys):
+        with pytest.raises(SystemExit):
+            _parse(argv)
+        assert 'invalid choice' in capsys.readouterr().err
+
+
+class TestValidatePolicyTypes:
+    """-t/--type accepts 'all' or a list of registry CLI names."""
+
+    @pytest.mark.parametrize("value", ['all', 'prevention', 'prevention, firewall', 'sca,response'])
+    def test_valid_values_returned_unchanged(self, value):
+        assert validate_policy_types(value) == value
+
+    def test_all_cannot_be_combined(self):
+        with pytest.raises(argparse.ArgumentTypeError, match="'all' cannot be combined"):
+            validate_policy_types('all,prevention')
+
+    def test_invalid_types_reported_in_order(self):
+        with pytest.raises(argparse.ArgumentTypeError, match="Invalid policy type\\(s\\): zeta, alpha"):
+            validate_policy_types('zeta,prevention,alpha')
+
+
+class TestValidateLastSeen:
+    """--last-seen converts a look-back period into an FQL filter."""
+
+    @freeze_time("2026-01-15 12:34:56")
+    def test_filter_anchored_to_current_minute(self):
+        assert validate_last_seen('day') == "last_seen:>='2026-01-14T12:34:00Z'"
+        assert validate_last_seen('hour') == "last_seen:>='2026-01-15T11:34:00Z'"
+
+    def test_same_minute_returns_identical_filter(self):
+        with freeze_time("2026-01-15 12:34:01"):
+            first = validate_last_seen('week')
+        with freeze_time("2026-01-15 12:34:59"):
+            second = validate_last_seen('week')
+        assert first == second == "last_seen:>='2026-01-08T12:34:00Z'"
+
+    def test_invalid_value_rejected(self):
+        with pytest.raises(argparse.ArgumentTypeError, match="Invalid last-seen value"):
+            validate_last_seen('month')
@@ -0,0 +1,286 @@
+"""Tests for CLI table/cell formatters."""
+import time
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+
+from falcon_policy_scoring.cli.formatters import (
+    build_host_table, calculate_cache_info, calculate_host_cache_info, format_failure_details, format_policy_table_row, format_status_cell, format_zta_cell, print_host_stats,
+    print_host_policy_details, print_policy_details
+)
+from falcon_policy_scoring.cli.plain_table import PlainTable
+from falcon_policy_scoring.utils.constants import MAX_RICH_TABLE_ROWS, POLICY_TYPE_REGISTRY
+from falcon_policy_scoring.utils.models import CacheInfo
+
+
+class TestFormatStatusCell:
+    """Status cells render the same markup in wide and compact form."""
+
+    @pytest.mark.parametrize("status,wide,compact", [
+        ('PASSED', '[green]✓ PASSED[/green]', '[green]✓[/green]'),
+        ('FAILED', '[red]✗ FAILED[/red]', '[red]✗[/red]'),
+        ('UNGRADABLE', '[yellow]⚠ UNGRADABLE[/yellow]', '[yellow]⚠[/yellow]'),
+        ('NOT GRADED', '[yellow]NOT GRADED[/yellow]', '[yellow]–[/yellow]'),
+        ('N/A', '[dim]— N/A[/dim]', '[dim]—[/dim]'),
+        ('NO POLICY ASSIGNED', '[dim]NO POLICY[/dim]', '[dim]ⁿ/ₐ[/dim]'),
+        ('something-else', '[dim]NO POLICY[/dim]', '[dim]ⁿ/ₐ[/dim]'),
+    ])
+    def test_markup(self, status, wide, compact):
+        assert format_status_cell(status) == wide
+        assert format_status_cell(status, wide=False) == compact
+
+
+class TestBuildHostTable:
+    """Host table rows carry one cell per active policy column (+ ZTA)."""
+
+    ROW = {
+        'hostname': 'host-1', 'platform': 'Windows',
+        'prevention_status': 'PASSED', 'firewall_status': 'FAILED',
+        'zta_assessment': {'sensor_config': 90, 'os': 80, 'overall': 85},
+    }
+
+    @staticmethod
+    def _cells(table):
+        return [list(column.cells) for column in table.columns]
+
+    def test_wide_rows(self):
+        table = build_host_table([self.ROW], ctx=None, policy_types=['prevention', 'firewall'])
+        assert self._cells(table) == [
+            ['host-1'], ['Windows'], ['[green]✓ PASSED[/green]'], ['[red]✗ FAILED[/red]'],
+            ['[dim]( 90/ 80)[/dim] [bold] 85[/bold]'],
+        ]
+
+    def test_large_tables_render_plain(self):
+        config = {'host_fetching': {'include_zta': False}}
+        rows = [self.ROW, dict(self.ROW, hostname='host-2', platform='Linux', firewall_status='PASSED')]
+        with patch('falcon_policy_scoring.cli.formatters.MAX_RICH_TABLE_ROWS', 1):
+            table = build_host_table(rows, ctx=None, config=config, policy_types=['firewall'], wide=False)
+        assert isinstance(table, PlainTable)
+
+        console = Console(record=True, width=80, color_system=None)
+        console.print(table)
+        assert console.export_text().splitlines() == [
+            "           Host Policy Status",
+            "Hostname                        OS   FW ",
+            "─" * 40,
+            "host-1                         Win   ✗  ",
+            "host-2                         Lin   ✓  ",
+        ]
+
+    def test_large_tables_fit_narrow_consoles(self):
+        policy_types = list(POLICY_TYPE_REGISTRY)
+        row = dict(self.ROW, **{v['status_key']: 'PASSED' for v in POLICY_TYPE_REGISTRY.values()})
+        rows = [dict(row, hostname=f'host-{i:04d}') for i in range(MAX_RICH_TABLE_ROWS + 1)]
+        table = build_host_table(rows, ctx=None, policy_types=policy_types)
+        assert isinstance(table, PlainTable)
+
+        console = Console(record=True, width=120, color_system=None)
+        console.print(table)
+        lines = console.export_text().splitlines()
+        text = "\n".join(lines)
+        assert max(len(line) for line in lines) <= 120
+        for header, _, _, _ in table.columns:
+            for word in header.split():
+                assert word in text
+        assert all(f'host-{i:04d}' in text for i in range(len(rows)))
+        assert text.count('PASSED') == len(rows) * len(policy_types)
+        assert text.count('( 90/ 80)') == len(rows)
+        assert text.count(' 85') >= len(rows)
+
+    def test_compact_rows_without_zta(self):
+        config = {'host_fetching': {'include_zta': False}}
+        table = build_host_table([self.ROW], ctx=None, config=config, policy_types=['firewall'], wide=False)
+        assert self._cells(table) == [['host-1'], ['Win'], ['[red]✗[/red]']]
+
+
+class TestFormatZtaCell:
+    """ZTA cells align integer scores and dash out anything else."""
+
+    @pytest.mark.parametrize("assessment,wide,compact", [
+        (None, '[dim]N/A[/dim]', '[dim]N/A[/dim]'),
+        ({'sensor_config': 5, 'os': 100, 'overall': 42},
+         '[dim](  5/100)[/dim] [bold] 42[/bold]', '[dim]5/100[/dim]:[bold]42[/bold]'),
+        ({'sensor_config': 'n/a', 'overall': None},
+         '[dim](  -/  0)[/dim] [bold]  -[/bold]', '[dim]-/0[/dim]:[bold]-[/bold]'),
+        ({'sensor_config': True, 'os': 1, 'overall': 1},
+         '[dim](  -/  1)[/dim] [bold]  1[/bold]', '[dim]-/1[/dim]:[bold]1[/bold]'),
+    ])
+    def test_markup(self, assessment, wide, compact):
+        assert format_zta_cell(assessment) == wide
+        assert format_zta_cell(assessment, wide=False) == compact
+
+
+class TestFormatPolicyTableRow:
+    """Score colour follows pass/fail and the 80% threshold."""
+
+    @pytest.mark.parametrize("policy,checks,score", [
+        ({'passed': True, 'checks_count': 10, 'failures_count': 0},
+         '[green]0/10[/green] failed', '[green]100.0%[/green]'),
+        ({'passed': False, 'checks_count': 10, 'failures_count': 2},
+         '[red]2/10[/red] failed', '[yellow]80.0%[/yellow]'),
+        ({'passed': False, 'checks_count': 3, 'failures_count': 1},
+         '[red]1/3[/red] failed', '[red]66.7%[/red]'),
+        ({'passed': False, 'checks_count': 0, 'failures_count': 0},
+         '[red]0/0[/red] failed', '[dim]N/A[/dim]'),
+        ({'grading_status': 'ungradable'}, '[yellow]ungradable[/yellow]', '[yellow]N/A[/yellow]'),
+    ])
+    def test_cells(self, policy, checks, score):
+        row = format_policy_table_row({'policy_name': 'p', 'platform_name': 'Windows', **policy})
+        assert row[1:] == ('p', 'Windows', checks, score)
+
+    def test_compact(self):
+        policy = {'policy_name': 'x' * 40, 'platform_name': 'Windows', 'passed': True,
+                  'checks_count': 4, 'failures_count': 0}
+        assert format_policy_table_row(policy, wide=False) == (
+            '[green]✓[/green]', 'x' * 29 + '…', 'Win', '[green]0/4[/green]', '[green]100.0%[/green]'
+        )
+
+
+class TestPrintHostStats:
+    """The host summary is emitted as a single console block."""
+
+    def test_summary_block(self):
+        console = Console(record=True, width=80, color_system=None)
+        cache_info = CacheInfo(age_seconds=60, age_display='1m', ttl_seconds=600, expired=False)
+        print_host_stats({'total': 3, 'all_passed': 2, 'any_failed': 1}, cache_info,
+                         SimpleNamespace(console=console))
+        assert console.export_text() == (
+            "\nHost Summary:\n"
+            "  Total Hosts: 3\n"
+            "  ✅ All Policies Passed: 2\n"
+            "  ❌ Any Policy Failed: 1\n"
+            "  🕒 Cache Age: 1m\n"
+            "\n"
+        )
+
+    def test_expired_cache_warning_in_same_block(self):
+        console = MagicMock()
+        cache_info = CacheInfo(age_seconds=900, age_display='15m', ttl_seconds=600, expired=True)
+        print_host_stats({'total': 1, 'all_passed': 1, 'any_failed': 0}, cache_info,
+                         SimpleNamespace(console=console))
+        console.print.assert_called_once()
+        block = console.print.call_args.args[0]
+        assert block.endswith("Cache exceeded TTL. Consider using fetch subcommand to refresh[/yellow]\n")
+
+
+class TestPrintHostPolicyDetails:
+    """Host policy details render from pre-styled Text in one write."""
+
+    def test_details_block(self):
+        console = Console(record=True, width=80, color_system=None)
+        host_info = {'device_id': 'dev-1', 'device_data': {'hostname': 'host-1', 'platform_name': 'Linux'}}
+        rows = [
+            ('Prevention', 'Baseline [v2]', 'PASSED', []),
+            ('Firewall', 'Default', 'FAILED', ['  Failed Checks: 2/10']),
+        ]
+        print_host_policy_details(host_info, rows, SimpleNamespace(console=console))
+        assert console.export_text() == (
+            "\nPolicy Details for Host: host-1\n"
+            "Device ID: dev-1\n"
+            "Platform: Linux\n"
+            "\n"
+            "Prevention Policy: Baseline [v2]\n"
+            "  Status: ✓ PASSED\n"
+            "\n"
+            "Firewall Policy: Default\n"
+            "  Status: ✗ FAILED\n"
+            "  Failed Checks: 2/10\n"
+            "\n"
+        )
+
+
+class TestPrintPolicyDetails:
+    """Failed policies are listed before ungradable ones in a single pass."""
+
+    @staticmethod
+    def _render(policies):
+        console = Console(record=True, width=120, color_system=None)
+        print_policy_details({'graded_policies': policies}, 'device_control', SimpleNamespace(console=console))
+        return console.export_text()
+
+    def test_all_passed(self):
+        text = self._render([{'policy_name': 'ok', 'passed': True}])
+        assert text == "All Device Control policies passed! ✓\n\n"
+
+    def test_failed_before_ungradable(self):
+        text = self._render([
+            {'policy_name': 'odd', 'grading_status': 'ungradable', 'ungradable_reason': 'no_settings'},
+            {'policy_name': 'ok', 'passed': True},
+            {'policy_name': 'bad', 'passed': False, 'checks_count': 2, 'failures_count': 1},
+        ])
+        assert text.count("Failed Device Control Policies") == 1
+        assert text.index("Policy: bad") < text.index("Ungradable Device Control Policies") < text.index("Policy: odd")
+        assert "Policy: ok" not in text
+        assert "Reason: No Settings" in text
+
+    def test_zero_failure_count_skips_setting_walk(self):
+        with patch('falcon_policy_scoring.cli.formatters.format_failure_details') as details:
+            self._render([
+                {'policy_name': 'a', 'passed': False, 'checks_count': 1, 'failures_count': 0,
+                 'setting_results': [{'passed': False, 'setting_name': 's', 'setting_id': 'i'}]},
+                {'policy_name': 'b', 'passed': False, 'checks_count': 1, 'setting_results': []},
+            ])
+        details.assert_called_once()
+
+
+class TestFormatFailureDetails:
+    """Failure lines depend on the setting-result shape and field."""
+
+    @staticmethod
+    def _render(setting_results):
+        console = Console(record=True, width=120, color_system=None)
+        format_failure_details(setting_results, SimpleNamespace(console=console))
+        return console.export_text()
+
+    def test_list_results(self):
+        text = self._render([
+            {'passed': True, 'setting_name': 'ok', 'setting_id': 'a'},
+            {'passed': False, 'setting_name': 'Sensor', 'setting_id': 'b', 'failures': [
+                {'field': 'ring_points', 'actual': 5, 'minimum': 3},
+                {'field': 'level', 'actual': 1, 'minimum': 2},
+            ]},
+        ])
+        assert text == (
+            "  • Sensor (b)\n"
+            "    ✗ ring_points: 5 > 3 (maximum)\n"
+            "    ✗ level: 1 < 2 (minimum)\n"
+        )
+
+    def test_dict_results(self):
+        text = self._render({'failures': [{'field': 'class.USB', 'actual': 'ALLOW', 'expected': 'BLOCK'}]})
+        assert text == "  • USB\n    ✗ ALLOW != BLOCK\n"
+
+    def test_unknown_shape_prints_nothing(self):
+        assert self._render(None) == ""
+
+
+class TestCalculateCacheInfo:
+    """Cache info is reused within one second and recomputed afterwards."""
+
+    CONFIG = {'ttl': {'policies': {'prevention_policy': 120}}}
+
+    def test_reused_within_same_second(self):
+        record = {'epoch': int(time.time()) - 300}
+        with patch('falcon_policy_scoring.cli.formatters.time.time', return_value=1_000_000.2):
+            first = calculate_cache_info(record, self.CONFIG, 'prevention')
+        with patch('falcon_policy_scoring.cli.formatters.time.time', return_value=1_000_000.7):
+            assert calculate_cache_info(record, self.CONFIG, 'prevention') is first
+        with patch('falcon_policy_scoring.cli.formatters.time.time', return_value=1_000_001.0):
+            assert calculate_cache_info(record, self.CONFIG, 'prevention') is not first
+        assert first.ttl_seconds == 120
+        assert first.expired
+        with pytest.raises(FrozenInstanceError):
+            first.expired = False
+
+    def test_missing_epoch(self):
+        info = calculate_cache_info({}, {}, 'firewall')
+        assert (info.age_seconds, info.age_display, info.expired) == (0, "Unknown / 10 minutes max", False)
+
+    def test_host_cache_info_uses_hosts_ttl(self):
+        record = {'epoch': int(time.time()) - 30}
+        first = calculate_host_cache_info(record, {'ttl': {'hosts': 60}})
+        assert (first.ttl_seconds, first.expired) == (60, False)
+        assert calculate_host_cache_info(record, {'ttl': {'hosts': 10}}).expired
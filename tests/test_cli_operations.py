@@ -18,6 +18,7 @@ which have caused production issues in the past.
 
 import pytest
 import json
+from dataclasses import replace
 from unittest.mock import Mock, patch, MagicMock
 from argparse import Namespace
 from io import StringIO
@@ -30,7 +31,8 @@ from falcon_policy_scoring.cli.operations import (
     handle_regrade_operations,
     parse_product_types
 )
-from falcon_policy_scoring.cli.context import CliContext
+from falcon_policy_scoring.cli.context import ApiCreds, CliContext
+from falcon_policy_scoring.utils.models import HostFetchingConfig, HostFilters
 from rich.console import Console
 
 
@@ -132,13 +134,14 @@ class TestFetchHosts:
         # Execute
         result = fetch_and_store_hosts(
             mock_falcon, mock_adapter, 'test-cid',
-            ['Workstation'], mock_config, mock_ctx
+            ['Workstation'], HostFetchingConfig.from_config(mock_config), mock_ctx
         )
 
         # Verify
         assert result['fetched'] == 2
         assert result['total_hosts'] == 2
         assert result['errors'] == 0
+        assert result['host_ids'] == ['host-1', 'host-2']
         mock_hosts_instance.get_devices.assert_called_once()
 
     @patch('falcon_policy_scoring.cli.operations.Hosts')
@@ -174,8 +177,8 @@ class TestFetchHosts:
         # Execute
         result = fetch_and_store_hosts(
             mock_falcon, mock_adapter, 'test-cid',
-            ['Workstation'], mock_config, mock_ctx,
-            host_group_names=['group1', 'group2']
+            ['Workstation'], HostFetchingConfig.from_config(mock_config), mock_ctx,
+            HostFilters(host_group_names=['group1', 'group2'])
         )
 
         # Verify: names resolved to IDs, and group IDs passed into Hosts server-side
@@ -203,8 +206,8 @@ class TestFetchHosts:
 
         result = fetch_and_store_hosts(
             mock_falcon, mock_adapter, 'test-cid',
-            ['Workstation'], mock_config, mock_ctx,
-            host_group_ids=['gid-9'], tags=['FalconGroupingTags/prod']
+            ['Workstation'], HostFetchingConfig.from_config(mock_config), mock_ctx,
+            HostFilters(host_group_ids=['gid-9'], tags=['FalconGroupingTags/prod'])
         )
 
         assert result['fetched'] == 1
@@ -245,7 +248,7 @@ class TestFetchHosts:
         # Execute
         result = fetch_and_store_hosts(
             mock_falcon, mock_adapter, 'test-cid',
-            ['Workstation'], mock_config, mock_ctx
+            ['Workstation'], HostFetchingConfig.from_config(mock_config), mock_ctx
         )
 
         # Verify progress fetcher was called (not simple fetcher)
@@ -286,7 +289,7 @@ class TestFetchHosts:
         # Execute
         result = fetch_and_store_hosts(
             mock_falcon, mock_adapter, 'test-cid',
-            ['Workstation'], mock_config, mock_ctx
+            ['Workstation'], HostFetchingConfig.from_config(mock_config), mock_ctx
         )
 
         # Verify simple fetcher was called
@@ -330,7 +333,7 @@ class TestFetchHosts:
         # Execute with custom config
         result = fetch_and_store_hosts(
             mock_falcon, mock_adapter, 'test-cid',
-            ['Workstation'], custom_config, mock_ctx
+            ['Workstation'], HostFetchingConfig.from_config(custom_config), mock_ctx
         )
 
         # Verify progress fetcher was used due to custom threshold
@@ -342,22 +345,202 @@ class TestFetchHosts:
         assert call_args[0][3] == 50  # custom batch_size
 
 
+    def test_fetch_hosts_parallel_stores_on_calling_thread(self, mock_falcon, mock_adapter, mock_ctx):
+        """Test parallel batches fetch concurrently but write to the adapter from the caller."""
+        import threading
+        from falcon_policy_scoring.cli.data_fetcher import fetch_hosts_simple
+
+        def command(_name, ids):
+            if ids == ['host-3', 'host-4']:
+                return {'status_code': 500, 'body': {}}
+            return {'status_code': 200, 'body': {'resources': [{'device_id': i} for i in ids]}}
+
+        mock_falcon.command.side_effect = command
+        caller = threading.current_thread()
+        writer_threads = set()
+        original_put_many_hosts = mock_adapter.put_many_hosts
+
+        def put_many_hosts(records):
+            writer_threads.add(threading.current_thread())
+            return original_put_many_hosts(records)
+
+        with patch.object(mock_adapter, 'put_many_hosts', side_effect=put_many_hosts):
+            result = fetch_hosts_simple(
+                mock_falcon, mock_adapter, [f'host-{i}' for i in range(1, 8)], 2, mock_ctx,
+                workers=3
+            )
+
+        assert result == {'total_hosts': 7, 'fetched': 5, 'errors': 2}
+        assert mock_falcon.command.call_count == 4
+        assert writer_threads == {caller}
+
+
+@pytest.mark.unit
+class TestBatchSizeTuner:
+    """Test adaptive host-detail batch sizing."""
+
+    def test_doubles_while_latency_drops_then_reverts(self):
+        """Test the size grows until a larger batch is no faster per host."""
+        from falcon_policy_scoring.cli.data_fetcher import BatchSizeTuner
+
+        tuner = BatchSizeTuner(100, 1000)
+        tuner.record(100, 1.0)   # 10ms/host
+        assert tuner.batch_size == 200
+        tuner.record(200, 1.0)   # 5ms/host
+        assert tuner.batch_size == 400
+        tuner.record(400, 2.4)   # 6ms/host -> worse, settle on 200
+        assert tuner.batch_size == 200
+        tuner.record(200, 0.1)
+        assert tuner.batch_size == 200
+        assert tuner.best_batch_size == 200
+
+    def test_capped_and_ignores_short_batches(self):
+        """Test growth stops at the cap and partial batches are not sampled."""
+        from falcon_policy_scoring.cli.data_fetcher import BatchSizeTuner
+
+        tuner = BatchSizeTuner(100, 150)
+        tuner.record(40, 0.001)
+        assert tuner.batch_size == 100
+        tuner.record(100, 1.0)
+        assert tuner.batch_size == 150
+        tuner.record(150, 0.1)
+        assert tuner.batch_size == 150
+        assert BatchSizeTuner(100).batch_size == 100
+
+    def test_learned_size_seeds_next_fetch_for_cid(self):
+        """Test the learned size is reused for the same CID only."""
+        from falcon_policy_scoring.cli import data_fetcher
+        from falcon_policy_scoring.cli.data_fetcher import BatchSizeTuner
+
+        with patch.dict(data_fetcher._LEARNED_BATCH_SIZES, clear=True):
+            tuner = BatchSizeTuner.for_cid('cid-a', 100, 5000)
+            tuner.record(100, 1.0)
+            tuner.remember('cid-a')
+
+            assert BatchSizeTuner.for_cid('cid-a', 100, 5000).batch_size == 100
+            tuner.record(200, 1.0)
+            tuner.remember('cid-a')
+            assert BatchSizeTuner.for_cid('cid-a', 100, 5000).batch_size == 200
+            assert BatchSizeTuner.for_cid('cid-b', 100, 5000).batch_size == 100
+            # A lowered cap still bounds the learned size
+            assert BatchSizeTuner.for_cid('cid-a', 100, 150).batch_size == 150
+
+    def test_fetch_grows_batches_with_tuner(self, mock_falcon, mock_adapter, mock_ctx):
+        """Test later requests use the tuned size."""
+        from falcon_policy_scoring.cli.data_fetcher import fetch_hosts_simple, BatchSizeTuner
+
+        mock_falcon.command.side_effect = lambda _name, ids: {
+            'status_code': 200, 'body': {'resources': [{'device_id': i} for i in ids]}
+        }
+        host_ids = [f'host-{i}' for i in range(7)]
+
+        with patch('falcon_policy_scoring.cli.data_fetcher.time.perf_counter',
+                   side_effect=[0.0, 1.0, 1.0, 2.0, 2.0, 3.0]):
+            result = fetch_hosts_simple(mock_falcon, mock_adapter, host_ids, 1, mock_ctx,
+                                        tuner=BatchSizeTuner(1, 4))
+
+        assert result == {'total_hosts': 7, 'fetched': 7, 'errors': 0}
+        sizes = [len(c.kwargs['ids']) for c in mock_falcon.command.call_args_list]
+        assert sizes == [1, 2, 4]
+
+
+@pytest.mark.unit
+class TestSetupDatabase:
+    """Test database adapter setup and reuse."""
+
+    def test_adapter_reused_while_healthy(self, tmp_path, mock_ctx):
+        """Test the same backend config reuses the open adapter until it is closed."""
+        from falcon_policy_scoring.cli import cli_setup
+        from falcon_policy_scoring.factories import adapter_cache
+
+        config = {'db': {'type': 'sqlite'}, 'sqlite': {'path': str(tmp_path / 'cache.db')}}
+        other = {'db': {'type': 'sqlite'}, 'sqlite': {'path': str(tmp_path / 'other.db')}}
+
+        with patch.dict(adapter_cache._ADAPTER_CACHE, clear=True):
+            try:
+                first = cli_setup.setup_database(config, mock_ctx)
+                assert cli_setup.setup_database(config, mock_ctx) is first
+                assert cli_setup.setup_database(other, mock_ctx) is not first
+
+                first.close()
+                reconnected = cli_setup.setup_database(config, mock_ctx)
+                assert reconnected is not first
+                assert reconnected.is_healthy()
+            finally:
+                adapter_cache.close_cached_adapters()
+
+
+@pytest.mark.unit
+class TestFalconClientCache:
+    """Test Falcon API client reuse."""
+
+    @patch('falcon_policy_scoring.falconapi.cid.get_cid', return_value='cid-123')
+    @patch('falconpy.APIHarnessV2')
+    def test_client_shared_per_credentials(self, mock_harness, _mock_get_cid, mock_adapter, mock_ctx):
+        """Test setup paths share one client (and HTTP session) per credential set."""
+        import requests
+        from falcon_policy_scoring.cli import cli_setup
+        from falcon_policy_scoring.falconapi import session
+        from falcon_policy_scoring.falconapi.session import SESSION_POOL_MAXSIZE
+
+        mock_harness.side_effect = lambda **_kwargs: Mock(spec=['session'])
+        creds = ApiCreds(client_id='id', client_secret='secret', base_url='US1')
+
+        with patch.dict(session._FALCON_CLIENTS, clear=True):
+            try:
+                falcon, cid = cli_setup.setup_falcon_api(creds, mock_ctx)
+                assert cid == 'cid-123'
+                assert isinstance(falcon.session, requests.Session)
+                pooled = falcon.session.get_adapter('https://api.crowdstrike.com')
+                assert pooled._pool_maxsize == SESSION_POOL_MAXSIZE
+
+                fetched, _ = cli_setup.get_or_fetch_cid(mock_adapter, ApiCreds(**creds.to_kwargs()), True, mock_ctx)
+                assert fetched is falcon
+
+                rotated, _ = cli_setup.setup_falcon_api(replace(creds, client_secret='new'), mock_ctx)
+                assert rotated is not falcon
+                assert mock_harness.call_count == 2
+            finally:
+                session.close_falcon_clients()
+
+    @patch('falcon_policy_scoring.falconapi.cid.get_cid', return_value='cid-new')
+    @patch('falconpy.APIHarnessV2')
+    def test_cid_cache_only_read_when_usable(self, mock_harness, _mock_get_cid, mock_ctx):
+        """Test a fetch skips the cached-CID lookup and a cache hit skips the API."""
+        from falcon_policy_scoring.cli import cli_setup
+        from falcon_policy_scoring.falconapi import session
+
+        mock_harness.side_effect = lambda **_kwargs: Mock(spec=['session'])
+        adapter = Mock()
+        adapter.get_cid.return_value = 'cid-cached'
+        creds = ApiCreds(client_id='id', client_secret='secret', base_url='EU1')
+
+        with patch.dict(session._FALCON_CLIENTS, clear=True):
+            try:
+                assert cli_setup.get_or_fetch_cid(adapter, creds, False, mock_ctx) == (None, 'cid-cached')
+                mock_harness.assert_not_called()
+
+                adapter.get_cid.reset_mock()
+                _, cid = cli_setup.get_or_fetch_cid(adapter, creds, True, mock_ctx)
+                assert cid == 'cid-new'
+                adapter.get_cid.assert_not_called()
+                adapter.put_cid.assert_called_once_with('cid-new', 'EU1')
+            finally:
+                session.close_falcon_clients()
+
+
 @pytest.mark.unit
 class TestFetchZTA:
     """Test Zero Trust Assessment fetching."""
 
-    @patch('falcon_policy_scoring.cli.operations.fetch_zero_trust_assessments')
+    @patch('falcon_policy_scoring.cli.operations.iter_zero_trust_assessments')
     def test_fetch_zta_success(self, mock_fetch_zta, mock_falcon, mock_adapter, mock_ctx):
         """Test successful ZTA fetching."""
-        # Setup mock with correct structure
-        mock_fetch_zta.return_value = {
-            'assessments': {
-                'host-1': {'score': 85, 'assessment': 'high'},
-                'host-2': {'score': 70, 'assessment': 'medium'}
-            },
-            'count': 2,
-            'errors': []
-        }
+        # Setup mock yielding one batch per API page
+        mock_fetch_zta.return_value = iter([
+            [('host-1', {'score': 85, 'assessment': 'high'})],
+            [('host-2', {'score': 70, 'assessment': 'medium'})]
+        ])
 
         # Execute
         result = fetch_and_store_zta(
@@ -368,9 +551,27 @@ class TestFetchZTA:
         # Verify
         assert result['fetched'] == 2
         assert result['errors'] == 0
-        mock_fetch_zta.assert_called_once_with(mock_falcon, ['host-1', 'host-2'])
-
-    @patch('falcon_policy_scoring.cli.operations.fetch_zero_trust_assessments')
+        mock_fetch_zta.assert_called_once_with(mock_falcon, ['host-1', 'host-2'], [])
+        assert mock_adapter.get_host_zta('host-1') == {'score': 85, 'assessment': 'high'}
+        assert mock_adapter.get_host_zta('host-2') == {'score': 70, 'assessment': 'medium'}
+
+    def test_fetch_zta_streams_batches_and_counts_errors(self, mock_adapter, mock_ctx):
+        """Each API batch is stored as it arrives; failed batches count as errors."""
+        host_ids = [f'host-{i}' for i in range(150)]
+        falcon = Mock()
+        falcon.command.side_effect = [
+            {'status_code': 200, 'body': {'resources': [{'aid': aid} for aid in host_ids[:100]]}},
+            {'status_code': 500, 'body': {}},
+        ]
+
+        result = fetch_and_store_zta(falcon, mock_adapter, host_ids, mock_ctx)
+
+        assert result == {'fetched': 100, 'errors': 1}
+        assert falcon.command.call_count == 2
+        assert mock_adapter.get_host_zta('host-99') == {'aid': 'host-99'}
+        assert mock_adapter.get_host_zta('host-100') is None
+
+    @patch('falcon_policy_scoring.cli.operations.iter_zero_trust_assessments')
     def test_fetch_zta_empty_list(self, mock_fetch_zta, mock_falcon, mock_adapter, mock_ctx):
         """Test ZTA fetching with empty host list."""
         # No need to mock - function returns early for empty list
@@ -444,6 +645,59 @@ class TestFetchPolicies:
         # Verify get_all_types was called
         mock_registry.get_all_types.assert_called_once()
 
+    @patch('falcon_policy_scoring.cli.operations.get_policy_registry')
+    def test_policy_types_graded_concurrently(self, mock_get_registry, mock_falcon,
+                                              mock_adapter, mock_ctx):
+        """Policy types run in parallel, share a locked adapter and report in order."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make_info(name):
+            def grader(falcon, adapter, cid):
+                barrier.wait()  # only passes if both graders run at once
+                adapter.put_cid(cid, 'US1')
+                return {'grade_success': True, 'passed_policies': 1, 'policies_count': 1}
+            return Mock(grader_func=grader, display_name=name)
+
+        infos = {'prevention': make_info('Prevention'), 'firewall': make_info('Firewall')}
+        mock_registry = Mock()
+        mock_registry.get_all_types.return_value = list(infos)
+        mock_registry.get.side_effect = infos.get
+        mock_get_registry.return_value = mock_registry
+
+        fetch_and_grade_all_policies(mock_falcon, mock_adapter, 'test-cid', ['all'], mock_ctx)
+
+        output = mock_ctx.console.file.getvalue()
+        assert output.index('Prevention Policies: 1/1') < output.index('Firewall Policies: 1/1')
+        assert mock_adapter.get_cid('US1') == 'test-cid'
+
+    def test_resolve_policy_types_accepts_keys_and_cli_names(self):
+        """Policy type arguments resolve by key or CLI name; unknown names are dropped."""
+        from falcon_policy_scoring.cli.operations import _iter_resolved_policy_types
+        from falcon_policy_scoring.utils.policy_registry import get_policy_registry
+
+        resolved = _iter_resolved_policy_types(
+            ['prevention', 'sensor-update', 'no-such-type'], get_policy_registry()
+        )
+
+        assert list(resolved) == ['prevention', 'sensor_update']
+        assert list(_iter_resolved_policy_types(['prevention', 'all'], get_policy_registry())) == \
+            get_policy_registry().get_all_types()
+        assert get_policy_registry().get_by_cli_name('sensor-update').display_name == \
+            get_policy_registry().get('sensor_update').display_name
+
+    def test_registry_get_all_is_shared_read_only_view(self):
+        """get_all() returns the same read-only mapping on every call."""
+        from falcon_policy_scoring.utils.policy_registry import get_policy_registry
+
+        registry = get_policy_registry()
+        all_types = registry.get_all()
+
+        assert all_types is registry.get_all()
+        assert list(all_types) == registry.get_all_types()
+        with pytest.raises(TypeError):
+            all_types['bogus'] = None
+
 
 @pytest.mark.unit
 class TestHandleFetchOperations:
@@ -469,20 +723,12 @@ class TestHandleFetchOperations:
                 # Setup mocks
                 mock_parse_groups.return_value = None
 
-                mock_fetch_hosts.return_value = {
-                    'fetched': 10,
-                    'total_hosts': 10,
-                    'errors': 0
-                }
+                host_ids = [f'host-{i}' for i in range(10)]
 
-                # Store host list in adapter
-                adapter.put_hosts({
-                    'cid': 'test-cid',
-                    'base_url': 'https://test.com',
-                    'hosts': [f'host-{i}' for i in range(10)],
-                    'total': 10,
-                    'epoch': 1234567890
-                })
+                def fetch_hosts(*_args, on_host_ids=None, **_kwargs):
+                    on_host_ids(host_ids)
+                    return {'fetched': 10, 'total_hosts': 10, 'errors': 0, 'host_ids': host_ids}
+                mock_fetch_hosts.side_effect = fetch_hosts
 
                 mock_fetch_zta.return_value = {
                     'fetched': 10,
@@ -506,10 +752,76 @@ class TestHandleFetchOperations:
                 # Verify all fetchers were called
                 mock_fetch_hosts.assert_called_once()
                 mock_fetch_policies.assert_called_once()
-                mock_fetch_zta.assert_called_once()
+                zta_args, zta_kwargs = mock_fetch_zta.call_args
+                assert zta_args[0] is mock_falcon
+                assert zta_args[2:] == (host_ids, mock_ctx)
+                assert zta_kwargs['show_status'] is False
+                assert not zta_kwargs['cancel_event'].is_set()
             finally:
                 adapter.close()
 
+    @patch('falcon_policy_scoring.cli.operations.fetch_and_store_hosts')
+    @patch('falcon_policy_scoring.cli.operations.fetch_and_grade_all_policies')
+    @patch('falcon_policy_scoring.cli.operations.fetch_and_store_zta')
+    def test_zta_overlaps_host_detail_fetch(self, mock_fetch_zta, _mock_fetch_policies,
+                                            mock_fetch_hosts, mock_falcon, mock_adapter,
+                                            mock_config, mock_ctx):
+        """ZTA fetching starts once host IDs are known, while host details are still fetching."""
+        import threading
+        zta_started = threading.Event()
+
+        def fetch_zta(*_args, **_kwargs):
+            zta_started.set()
+            return {'fetched': 2, 'errors': 0}
+        mock_fetch_zta.side_effect = fetch_zta
+
+        def fetch_hosts(*_args, on_host_ids=None, **_kwargs):
+            on_host_ids(['host-1', 'host-2'])
+            assert zta_started.wait(timeout=5)  # host details still "in flight"
+            return {'fetched': 2, 'total_hosts': 2, 'errors': 0, 'host_ids': ['host-1', 'host-2']}
+        mock_fetch_hosts.side_effect = fetch_hosts
+
+        args = Namespace(policy_type='prevention', product_types='Workstation')
+        handle_fetch_operations(mock_falcon, mock_adapter, 'test-cid', args, mock_config, mock_ctx)
+
+        assert 'Fetched 2 Zero Trust Assessments' in mock_ctx.console.file.getvalue()
+
+    @patch('falcon_policy_scoring.cli.operations.fetch_and_store_hosts')
+    @patch('falcon_policy_scoring.cli.operations.fetch_and_grade_all_policies')
+    @patch('falcon_policy_scoring.cli.operations.iter_zero_trust_assessments')
+    def test_host_fetch_error_stops_zta_fetch(self, mock_iter_zta, mock_fetch_policies,
+                                              mock_fetch_hosts, mock_falcon, mock_adapter,
+                                              mock_config, mock_ctx):
+        """A host fetch error propagates without draining the background ZTA batches."""
+        import threading
+        import time
+        first_batch = threading.Event()
+        requested = []
+
+        def iter_zta(_falcon, host_ids, _errors):
+            for i in range(0, len(host_ids), 100):
+                time.sleep(0.05)
+                requested.append(i)
+                first_batch.set()
+                yield [(host_id, {'aid': host_id}) for host_id in host_ids[i:i + 100]]
+        mock_iter_zta.side_effect = iter_zta
+
+        def fetch_hosts(*_args, on_host_ids=None, **_kwargs):
+            on_host_ids([f'host-{i}' for i in range(1000)])
+            assert first_batch.wait(timeout=5)
+            raise KeyboardInterrupt
+        mock_fetch_hosts.side_effect = fetch_hosts
+
+        args = Namespace(policy_type='prevention', product_types='Workstation')
+        started = time.monotonic()
+        with pytest.raises(KeyboardInterrupt):
+            handle_fetch_operations(mock_falcon, mock_adapter, 'test-cid', args, mock_config, mock_ctx)
+        assert time.monotonic() - started < 0.4
+
+        time.sleep(0.2)  # let the worker finish the batch in flight
+        assert len(requested) <= 2
+        mock_fetch_policies.assert_not_called()
+
     def test_fetch_operations_requires_falcon(self, mock_adapter, mock_config, mock_ctx):
         """Test that fetch operations requires falcon API."""
         args = Namespace(policy_type='all', product_types='all')
@@ -545,6 +857,65 @@ class TestHandleRegradeOperations:
         # Verify regrade was called with policy types
         mock_regrade.assert_called_once()
 
+    @patch('falcon_policy_scoring.cli.operations.load_grading_config', return_value={'loaded': True})
+    def test_regrade_passes_stored_metadata_maps(self, _mock_load_config, mock_ctx):
+        """Firewall and device control graders receive their stored metadata maps."""
+        adapter = Mock()
+        adapter.get_policies.return_value = {
+            'policies': [{'id': 'p1'}],
+            'policy_containers': {'p1': 'container'},
+            'policy_settings': {'p1': 'settings'},
+        }
+        firewall = Mock(return_value=[{'passed': True}])
+        device_control = Mock(return_value=[{'passed': True}])
+        prevention = Mock(return_value=[{'passed': True}])
+
+        with patch.dict('falcon_policy_scoring.cli.operations.POLICY_GRADERS',
+                        {'firewall': firewall, 'device_control': device_control, 'prevention': prevention}):
+            regrade_policies(adapter, 'test-cid', ['firewall', 'device-control', 'prevention'], mock_ctx)
+
+        firewall.assert_called_once_with([{'id': 'p1'}], {'p1': 'container'}, {'loaded': True})
+        device_control.assert_called_once_with([{'id': 'p1'}], {'p1': 'settings'}, {'loaded': True})
+        prevention.assert_called_once_with([{'id': 'p1'}], {'loaded': True})
+
+    @patch('falcon_policy_scoring.cli.operations.load_grading_config', return_value={'loaded': True})
+    def test_regrade_json_mode_skips_spinner(self, _mock_load_config):
+        """JSON output mode never starts a console status spinner."""
+        ctx = CliContext(console=Mock(), verbose=False, json_output_mode=True)
+        adapter = Mock()
+        adapter.get_policies.return_value = {'policies': [{'id': 'p1'}]}
+
+        with patch.dict('falcon_policy_scoring.cli.operations.POLICY_GRADERS',
+                        {'prevention': lambda _policies, _config: [{'passed': True}]}):
+            result = regrade_policies(adapter, 'test-cid', ['prevention'], ctx)
+
+        assert result['summary']['total_policies'] == 1
+        ctx.console.status.assert_not_called()
+
+    @patch('falcon_policy_scoring.cli.operations.load_grading_config', return_value={'loaded': True})
+    def test_regrade_summary_counts(self, _mock_load_config, mock_ctx):
+        """Regrade summary splits results into passed, failed and ungradable."""
+        graded = [
+            {'passed': True},
+            {'grading_status': 'graded', 'passed': True},
+            {'passed': False},
+            {'grading_status': 'ungradable', 'passed': True},
+        ]
+        adapter = Mock()
+        adapter.get_policies.return_value = {'policies': [{'id': 'p1'}]}
+
+        with patch.dict('falcon_policy_scoring.cli.operations.POLICY_GRADERS',
+                        {'prevention': lambda _policies, _config: graded}):
+            result = regrade_policies(adapter, 'test-cid', ['prevention'], mock_ctx)
+
+        assert result['policy_types']['prevention'] == {
+            'display_name': 'Prevention', 'passed': 2, 'failed': 1, 'ungradable': 1, 'total': 4
+        }
+        adapter.put_graded_policies.assert_called_once_with('prevention_policies', 'test-cid', graded)
+        output = mock_ctx.console.file.getvalue()
+        assert '✓ Prevention Policies: 2/4 passed, 1 failed, 1 ungradable\n\nRe-grade Complete!' in output
+        assert 'Total: 2/4 policies passed, 1 failed' in output
+
 
 @pytest.mark.unit
 class TestOutputFormats:
@@ -564,6 +935,20 @@ class TestOutputFormats:
 
         assert ctx.json_output_mode is False
 
+    def test_json_error_output_is_valid_json(self, capsys):
+        """Test JSON-mode errors stay parseable when the message has quotes."""
+        from falcon_policy_scoring.__main__ import _handle_error
+
+        console = Console(file=StringIO(), force_terminal=False)
+        ctx = CliContext(console=console, verbose=False, json_output_mode=True)
+
+        with pytest.raises(SystemExit) as exc_info:
+            _handle_error(ValueError('bad "value" in C:\\path'), "Error", ctx)
+
+        assert exc_info.value.code == 1
+        payload = json.loads(capsys.readouterr().out)
+        assert payload == {"error": "Error", "message": 'bad "value" in C:\\path'}
+
     def test_verbose_logging(self):
         """Test verbose mode enables logging."""
         console = Console(file=StringIO(), force_terminal=False)
@@ -629,3 +1014,8 @@ class TestCLIHelpers:
         # Test with None
         result = parse_host_groups(None)
         assert result is None
+
+        # Names keep inner spaces; empty entries are dropped
+        result = parse_host_groups('  Prod Servers ,, \tDMZ ,  ')
+        assert result == ['Prod Servers', 'DMZ']
+        assert parse_host_groups(' , ') is None
@@ -8,7 +8,8 @@ import pytest
 import os
 from pathlib import Path
 import yaml
-from falcon_policy_scoring.utils.config import read_config_from_yaml, _load_config_defaults
+from unittest.mock import patch
+from falcon_policy_scoring.utils.config import read_config_from_yaml, _load_config_defaults, _YAML_CACHE
 
 
 # Get test fixtures directory
@@ -327,6 +328,20 @@ class TestConfigBatchSizeValidation:
             config = _load_config_defaults(config)
             assert config['host_fetching']['batch_size'] == batch_size
 
+    def test_host_fetching_config_view(self):
+        """Test the typed host_fetching view reads values and fills defaults."""
+        import dataclasses
+        from falcon_policy_scoring.utils.models import HostFetchingConfig
+
+        view = HostFetchingConfig.from_config({'host_fetching': {'batch_size': 50, 'include_zta': False}})
+
+        assert view.batch_size == 50
+        assert view.include_zta is False
+        assert view.workers == HostFetchingConfig().workers
+        assert HostFetchingConfig.from_config(None) == HostFetchingConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            view.batch_size = 10
+
 
 class TestConfigLogLevelValidation:
     """Test log level validation (logical tests)."""
@@ -528,3 +543,42 @@ class TestConfigEdgeCases:
 
         # Clean up
         os.remove(FIXTURES_DIR / "temp_test.yaml")
+
+
+class TestConfigCache:
+    """Test the parsed-YAML cache behind read_config_from_yaml."""
+
+    def test_repeated_load_reuses_parse(self, tmp_path):
+        """Test an unchanged file is parsed only once."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text('db:\n  type: tiny_db\n')
+
+        read_config_from_yaml(str(config_path))
+        with patch('falcon_policy_scoring.utils.config.yaml.load') as mock_load:
+            config = read_config_from_yaml(str(config_path))
+
+        mock_load.assert_not_called()
+        assert config['db']['type'] == 'tiny_db'
+
+    def test_cached_config_is_isolated_from_caller_mutation(self, tmp_path):
+        """Test mutating a returned config does not leak into later loads."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text('db:\n  type: tiny_db\n')
+
+        first = read_config_from_yaml(str(config_path))
+        first['db']['type'] = 'sqlite'
+        second = read_config_from_yaml(str(config_path))
+
+        assert second['db']['type'] == 'tiny_db'
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test a change in size/mtime invalidates the cached parse."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text('db:\n  type: tiny_db\n')
+        read_config_from_yaml(str(config_path))
+
+        config_path.write_text('db:\n  type: sqlite\nsqlite:\n  path: x.sqlite\n')
+        config = read_config_from_yaml(str(config_path))
+
+        assert config['db']['type'] == 'sqlite'
+        assert _YAML_CACHE[os.path.abspath(config_path)][1]['db']['type'] == 'sqlite'
@@ -76,13 +76,29 @@ class TestAdapterInterface:
             'put_graded_policies', 'get_graded_policies',
             'put_firewall_policy_containers', 'get_firewall_policy_containers',
             'put_device_control_policy_settings', 'get_device_control_policy_settings',
-            'put_cid', 'get_cid', 'get_cached_cid_info'
+            'put_cid', 'get_cid', 'get_cached_cid_info',
+            'is_healthy', 'put_many_hosts', 'put_many_host_zta'
         ]
 
         for method in required_methods:
             assert hasattr(adapter, method), f"Adapter missing method: {method}"
             assert callable(getattr(adapter, method)), f"Method not callable: {method}"
 
+    @pytest.mark.parametrize("adapter_class,filename", [
+        (SQLiteAdapter, "health.db"),
+        (TinyDBAdapter, "health.json"),
+    ])
+    def test_is_healthy_until_closed(self, adapter_class, filename, tmp_path):
+        """Test that adapters report healthy while open and unhealthy after close."""
+        adapter_instance = adapter_class()
+        assert not adapter_instance.is_healthy()
+
+        adapter_instance.connect({'path': str(tmp_path / filename)})
+        assert adapter_instance.is_healthy()
+
+        adapter_instance.close()
+        assert not adapter_instance.is_healthy()
+
 
 @pytest.mark.unit
 class TestHostsOperations:
@@ -211,6 +227,21 @@ class TestHostRecordsOperations:
         assert 'epoch' in retrieved
         assert before_epoch <= retrieved['epoch'] <= after_epoch
 
+    def test_put_many_hosts_inserts_and_updates(self, adapter):
+        """Test that put_many_hosts upserts a whole batch."""
+        adapter.put_host({'cid': 'test-cid', 'device_id': 'device-1', 'hostname': 'old-hostname'})
+
+        adapter.put_many_hosts([
+            {'cid': 'test-cid', 'device_id': 'device-1', 'hostname': 'new-hostname'},
+            {'cid': 'test-cid', 'device_id': 'device-2', 'hostname': 'second-host'},
+        ])
+        adapter.put_many_hosts([])
+
+        first = adapter.get_host('device-1')
+        assert first['data']['hostname'] == 'new-hostname'
+        assert first['cid'] == 'test-cid'
+        assert adapter.get_host('device-2')['data']['hostname'] == 'second-host'
+
 
 @pytest.mark.unit
 class TestZTAOperations:
@@ -260,6 +291,19 @@ class TestZTAOperations:
         retrieved = adapter.get_host_zta('device-123')
         assert retrieved['assessment']['overall'] == 95
 
+    def test_put_many_host_zta(self, adapter):
+        """Test that put_many_host_zta stores and replaces a whole set."""
+        adapter.put_host_zta('device-1', {'assessment': {'overall': 10}})
+
+        adapter.put_many_host_zta({
+            'device-1': {'assessment': {'overall': 80}},
+            'device-2': {'assessment': {'overall': 90}},
+        }.items())
+        adapter.put_many_host_zta([])
+
+        assert adapter.get_host_zta('device-1')['assessment']['overall'] == 80
+        assert adapter.get_host_zta('device-2')['assessment']['overall'] == 90
+
 
 @pytest.mark.unit
 class TestPoliciesOperations:
@@ -574,6 +618,19 @@ class TestIdempotency:
         retrieved = adapter.get_graded_policies('prevention_policies', 'test-cid')
         assert len(retrieved['graded_policies']) == 1
 
+    def test_put_graded_policies_replaces_in_place(self, adapter):
+        """Test that regrading replaces the stored record rather than adding one."""
+        adapter.put_graded_policies('prevention_policies', 'test-cid', [{'policy_id': 'p1', 'passed': True}])
+        adapter.put_graded_policies('prevention_policies', 'other-cid', [{'policy_id': 'p9', 'passed': True}])
+        adapter.put_graded_policies('prevention_policies', 'test-cid', [
+            {'policy_id': 'p1', 'passed': False}, {'policy_id': 'p2', 'passed': True}
+        ])
+
+        retrieved = adapter.get_graded_policies('prevention_policies', 'test-cid')
+        assert [r['passed'] for r in retrieved['graded_policies']] == [False, True]
+        assert retrieved['passed_policies'] == 1
+        assert adapter.get_graded_policies('prevention_policies', 'other-cid')['graded_policies'][0]['policy_id'] == 'p9'
+
 
 @pytest.mark.unit
 class TestMultiplePolicyTypes:
@@ -488,3 +488,77 @@ class TestPythonDotenvIntegration:
                 os.environ.pop(var, None)
                 if original_values[var] is not None:
                     os.environ[var] = original_values[var]
+
+
+class TestBuildApiCredentials:
+    """Test CLI credential resolution (CLI arg > ENV var > config file)."""
+
+    @staticmethod
+    def _args(**overrides):
+        from argparse import Namespace
+        values = {'client_id': None, 'client_secret': None, 'base_url': None}
+        values.update(overrides)
+        return Namespace(**values)
+
+    @pytest.fixture(autouse=True)
+    def _no_dotenv(self):
+        with patch('falcon_policy_scoring.cli.cli_setup._load_dotenv_once'):
+            yield
+
+    def test_precedence_cli_env_config(self):
+        """Test each credential resolves from the highest-priority source."""
+        from falcon_policy_scoring.cli.cli_setup import build_api_credentials
+
+        config = {'falcon_credentials': {
+            'prefix': 'FALCON_', 'client_id': 'cfg_id', 'client_secret': 'cfg_secret', 'base_url': 'EU1'
+        }}
+        with patch.dict(os.environ, {'FALCON_CLIENT_SECRET': 'env_secret'}, clear=True):
+            creds = build_api_credentials(self._args(client_id='cli_id'), config)
+
+        assert creds.to_kwargs() == {'client_id': 'cli_id', 'client_secret': 'env_secret', 'base_url': 'EU1'}
+
+    def test_base_url_defaults_to_us1_when_required(self):
+        """Test base_url falls back to US1 only for API operations."""
+        from falcon_policy_scoring.cli.cli_setup import build_api_credentials
+
+        with patch.dict(os.environ, {'CLIENT_ID': 'id', 'CLIENT_SECRET': 'secret'}, clear=True):
+            assert build_api_credentials(self._args(), {}).base_url == 'US1'
+            assert build_api_credentials(self._args(), {}, required=False).base_url is None
+
+    def test_missing_required_credential_raises(self):
+        """Test a missing client_id names the prefixed env var."""
+        from falcon_policy_scoring.cli.cli_setup import build_api_credentials
+        from falcon_policy_scoring.utils.exceptions import ConfigurationError
+
+        config = {'falcon_credentials': {'prefix': 'FALCON_'}}
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ConfigurationError, match='FALCON_CLIENT_ID'):
+                build_api_credentials(self._args(), config)
+            assert build_api_credentials(self._args(), config, required=False).to_kwargs() == {}
+
+    def test_secret_not_in_repr(self):
+        """Test the resolved client secret is never rendered in reprs/logs."""
+        from falcon_policy_scoring.cli.cli_setup import build_api_credentials
+
+        with patch.dict(os.environ, {'CLIENT_ID': 'id', 'CLIENT_SECRET': 'hunter2'}, clear=True):
+            creds = build_api_credentials(self._args(), {})
+        assert 'hunter2' not in repr(creds)
+
+
+class TestDotEnvLoadOnce:
+    """Test the CLI's .env loading."""
+
+    def test_dotenv_loaded_once_per_process(self):
+        """Test the .env lookup runs once and is skipped when no file is found."""
+        from falcon_policy_scoring.cli.cli_setup import _load_dotenv_once
+
+        _load_dotenv_once.cache_clear()
+        try:
+            with patch('dotenv.find_dotenv', return_value='') as mock_find, \
+                    patch('dotenv.load_dotenv') as mock_load:
+                assert _load_dotenv_once() is False
+                assert _load_dotenv_once() is False
+            mock_find.assert_called_once()
+            mock_load.assert_not_called()
+        finally:
+            _load_dotenv_once.cache_clear()
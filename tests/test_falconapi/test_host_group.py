@@ -0,0 +1,54 @@
+"""
+Tests for FalconAPI HostGroup module.
+
+Tests cover: name-to-ID resolution and member ID union across groups.
+"""
+import threading
+
+import pytest
+from unittest.mock import Mock
+from falcon_policy_scoring.falconapi.host_group import HostGroup
+
+
+def _group_falcon(members_by_group):
+    """Mock Falcon client serving host groups and their member IDs."""
+    barrier = threading.Barrier(len(members_by_group), timeout=5)
+
+    def command(name, **kwargs):
+        if name == 'queryHostGroups':
+            return {'status_code': 200, 'body': {'resources': list(members_by_group)}}
+        if name == 'getHostGroups':
+            return {'status_code': 200, 'body': {'resources': [
+                {'id': gid, 'name': gid.upper()} for gid in kwargs['ids']
+            ]}}
+        if name == 'queryGroupMembers':
+            barrier.wait()  # only passes if every group is paged concurrently
+            members = members_by_group[kwargs['id']]
+            return {'status_code': 200, 'body': {
+                'resources': members, 'meta': {'pagination': {'total': len(members)}}
+            }}
+        raise AssertionError(f"unexpected command {name}")
+
+    falcon = Mock()
+    falcon.command.side_effect = command
+    return falcon
+
+
+@pytest.mark.unit
+class TestGetDeviceIdsFromGroups:
+    """Test member ID collection across host groups."""
+
+    def test_groups_fetched_concurrently_and_unioned(self):
+        """Member pages for each group are fetched in parallel and de-duplicated."""
+        falcon = _group_falcon({'g1': ['a', 'b'], 'g2': ['b', 'c'], 'g3': ['d']})
+
+        device_ids = HostGroup(falcon).get_device_ids_from_groups(['G1', 'G2', 'G3'])
+
+        assert device_ids == frozenset({'a', 'b', 'c', 'd'})
+
+    def test_empty_group_names(self):
+        """No group names means no API calls."""
+        falcon = Mock()
+
+        assert HostGroup(falcon).get_device_ids_from_groups([]) == frozenset()
+        falcon.command.assert_not_called()
@@ -1,4 +1,4 @@
-"""Tests for host group ID / tag parsing and client-side host filtering."""
+"""Tests for host group ID / tag parsing and client-side host and policy filtering."""
 import pytest
 
 from falcon_policy_scoring.utils.filters import (
@@ -6,6 +6,9 @@ from falcon_policy_scoring.utils.filters import (
     parse_tags,
     normalize_tag,
     filter_hosts,
+    filter_policies,
+    make_status_predicate,
+    matches_status_filter,
 )
 
 
@@ -113,3 +116,33 @@ class TestFilterHostsGroupsAndTags:
     def test_missing_groups_field_excluded_when_filtering(self):
         hosts = [{'device_id': 'a', 'platform': 'Windows'}]  # no 'groups' key
         assert filter_hosts(hosts, group_ids=['g1']) == []
+
+
+class TestPolicyStatusFilter:
+    """Status filters resolve to one predicate per filter value."""
+
+    POLICIES = [
+        {'policy_id': 'p', 'passed': True, 'platform_name': 'Windows'},
+        {'policy_id': 'f', 'passed': False, 'target': 'Linux'},
+        {'policy_id': 'u', 'grading_status': 'ungradable', 'platform_name': 'Windows'},
+    ]
+
+    @pytest.mark.parametrize("status_filter,expected", [
+        (None, ['p', 'f', 'u']),
+        ('passed', ['p']),
+        ('failed', ['f']),
+        ('ungradable', ['u']),
+        ('bogus', []),
+    ])
+    def test_filter_policies(self, status_filter, expected):
+        result = filter_policies(self.POLICIES, status_filter=status_filter)
+        assert [p['policy_id'] for p in result] == expected
+        assert [p['policy_id'] for p in self.POLICIES if matches_status_filter(p, status_filter)] == expected
+
+    def test_platform_and_status(self):
+        result = filter_policies(self.POLICIES, platform_filter='WINDOWS', status_filter='passed')
+        assert [p['policy_id'] for p in result] == ['p']
+
+    def test_predicate_is_shared(self):
+        assert make_status_predicate('failed') is make_status_predicate('failed')
+        assert make_status_predicate('') is make_status_predicate(None)
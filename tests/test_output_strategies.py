@@ -12,7 +12,10 @@ from falcon_policy_scoring.cli.output_strategies import (
     TextOutputStrategy,
     JsonOutputStrategy,
     CsvOutputStrategy,
-    get_output_strategy
+    get_output_strategy,
+    _policy_id_to_name,
+    _index_device_policies,
+    _graded_policies_by_id
 )
 
 
@@ -155,6 +158,78 @@ class TestOutputStrategyFactory:
         strategy = get_output_strategy('unknown')
         assert isinstance(strategy, TextOutputStrategy)
 
+    def test_strategies_are_shared(self):
+        """Test repeated lookups return the same instance."""
+        assert get_output_strategy('json') is get_output_strategy('json')
+        assert get_output_strategy('unknown') is get_output_strategy('text')
+
+
+class TestPolicyIdToName:
+    """Tests for the policy ID to name lookup."""
+
+    def test_skips_missing_ids_names_and_types(self):
+        """Test only complete policies from the requested types are mapped."""
+        records = {
+            'prevention': {'graded_policies': [
+                {'policy_id': 'p1', 'policy_name': 'One'},
+                {'policy_id': 'p2'},
+                {'policy_name': 'Orphan'},
+            ]},
+            'firewall': {'graded_policies': [{'policy_id': 'f1', 'policy_name': 'Fw'}]},
+            'sensor_update': None,
+        }
+
+        result = _policy_id_to_name(records, ['prevention', 'sensor_update', 'device_control'])
+
+        assert result == {'p1': 'One'}
+
+
+class TestGradedPoliciesById:
+    """Tests for the graded policy result index."""
+
+    def test_first_result_wins_and_missing_ids_skipped(self):
+        """Test results are keyed by policy_id, keeping the first occurrence."""
+        record = {'graded_policies': [
+            {'policy_id': 'p1', 'failures_count': 2},
+            {'policy_id': 'p1', 'failures_count': 9},
+            {'policy_name': 'no id'},
+        ]}
+
+        index = _graded_policies_by_id(record)
+
+        assert list(index) == ['p1']
+        assert index['p1']['failures_count'] == 2
+
+
+class TestIndexDevicePolicies:
+    """Tests for the device_policies key-variant index."""
+
+    def test_indexes_hyphen_and_underscore_variants(self):
+        """Test lookups succeed under either spelling, preferring exact keys."""
+        index = _index_device_policies({
+            'content-update': {'policy_id': 'cu'},
+            'it_automation': {'policy_id': 'ita'},
+            'firewall': {},
+        })
+
+        assert index['content_update'] == {'policy_id': 'cu'}
+        assert index['content-update'] == {'policy_id': 'cu'}
+        assert index['it-automation'] == {'policy_id': 'ita'}
+        assert 'firewall' not in index
+
+
+class TestDeterminePolicyTypes:
+    """Tests for the memoized policy type resolution."""
+
+    def test_returns_independent_lists(self):
+        """Test cached results are copied so callers cannot mutate the cache."""
+        from falcon_policy_scoring.cli.helpers import determine_policy_types_to_display
+
+        first = determine_policy_types_to_display('prevention,firewall')
+        first.append('mutated')
+
+        assert determine_policy_types_to_display('prevention,firewall') == ['prevention', 'firewall']
+
 
 class TestTextOutputStrategy:
     """Tests for text output strategy."""
@@ -204,13 +279,124 @@ class TestTextOutputStrategy:
         mock_fetch_policies.assert_called_once_with(mock_adapter, 'test-cid')
         assert mock_print_table.call_count == 2  # prevention and firewall
 
+    @patch('falcon_policy_scoring.cli.helpers.fetch_all_graded_policies')
+    @patch('falcon_policy_scoring.cli.helpers.determine_policy_types_to_display')
+    @patch('falcon_policy_scoring.cli.data_fetcher.collect_host_data')
+    @patch('falcon_policy_scoring.cli.formatters.build_host_table')
+    @patch('falcon_policy_scoring.cli.formatters.print_host_stats')
+    def test_output_hosts_reads_host_list_once(self, mock_print_stats, mock_build_table,
+                                               mock_collect_hosts, mock_determine_types,
+                                               mock_fetch_policies, mock_context, mock_adapter,
+                                               sample_policy_records, sample_host_data):
+        """Test the host summary shares one get_hosts read with host collection."""
+        mock_fetch_policies.return_value = sample_policy_records
+        mock_determine_types.return_value = ['prevention', 'firewall']
+        mock_collect_hosts.return_value = sample_host_data
+
+        args = Mock()
+        args.show_hosts = True
+        args.show_policies = False
+        args.hostname = None
+        args.details = False
+        args.policy_type = 'all'
+        args.platform = None
+        args.status = None
+        args.host_status = None
+        args.sort_hosts = 'hostname'
+        args.host_group_ids = None
+        args.host_groups = None
+        args.tags = None
+
+        data = {
+            'adapter': mock_adapter,
+            'cid': 'test-cid',
+            'config': {},
+            'args': args
+        }
+
+        TextOutputStrategy().output(data, mock_context)
+
+        mock_adapter.get_hosts.assert_called_once_with('test-cid')
+        mock_determine_types.assert_called_once_with('all')
+        assert mock_collect_hosts.call_args.args[-1] == {'epoch': 1704067200}
+        mock_build_table.assert_called_once()
+        mock_print_stats.assert_called_once()
+
+    @pytest.mark.parametrize("show_hosts,hostname,details,expected", [
+        (True, 'host1', True, '_render_host_details_view'),
+        (True, 'host1', False, '_render_host_view'),
+        (True, None, True, '_render_default_view'),
+        (False, 'host1', True, '_render_default_view'),
+    ])
+    @patch('falcon_policy_scoring.cli.helpers.fetch_all_graded_policies', return_value={})
+    def test_output_dispatches_view(self, _mock_fetch, show_hosts, hostname, details, expected,
+                                    mock_context, mock_adapter):
+        """Test the view is chosen from the host/hostname/details flags."""
+        args = Mock(show_hosts=show_hosts, hostname=hostname, details=details,
+                    policy_type='all', host_group_ids=None, host_groups=None, tags=None)
+        data = {'adapter': mock_adapter, 'cid': 'test-cid', 'config': {}, 'args': args}
+        views = ('_render_host_details_view', '_render_host_view', '_render_default_view')
+
+        with patch.multiple(TextOutputStrategy, **{name: Mock() for name in views}):
+            TextOutputStrategy().output(data, mock_context)
+            called = [name for name in views if getattr(TextOutputStrategy, name).called]
+
+        assert called == [expected]
+
+    @patch('falcon_policy_scoring.cli.helpers.fetch_all_graded_policies')
+    @patch('falcon_policy_scoring.cli.helpers.determine_policy_types_to_display')
+    @patch('falcon_policy_scoring.cli.data_fetcher.find_host_by_name')
+    @patch('falcon_policy_scoring.cli.helpers.get_policy_status')
+    def test_output_host_details_single_write(self, mock_get_status, mock_find_host,
+                                              mock_determine_types, mock_fetch_policies,
+                                              mock_context, mock_adapter, sample_policy_records,
+                                              sample_host_info):
+        """Test the host policy details render in one console write."""
+        mock_fetch_policies.return_value = sample_policy_records
+        mock_determine_types.return_value = ['prevention', 'firewall']
+        mock_find_host.return_value = sample_host_info
+        mock_get_status.side_effect = ['PASSED', 'FAILED']
+        mock_adapter.get_ods_scan_coverage.return_value = None
+        mock_adapter.get_sca_coverage.return_value = None
+
+        args = Mock()
+        args.show_hosts = True
+        args.show_policies = False
+        args.hostname = 'host1.example.com'
+        args.details = True
+        args.policy_type = 'prevention,firewall'
+        args.host_group_ids = None
+        args.host_groups = None
+        args.tags = None
+
+        data = {'adapter': mock_adapter, 'cid': 'test-cid', 'config': {}, 'args': args}
+
+        # The summary table is covered separately; only the details block prints here
+        with patch.object(TextOutputStrategy, '_render_host_summary') as mock_summary:
+            TextOutputStrategy().output(data, mock_context)
+
+        mock_summary.assert_called_once()
+        mock_context.console.print.assert_called_once()
+        rendered = mock_context.console.print.call_args.args[0].plain
+        assert 'Policy Details for Host: host1.example.com' in rendered
+        assert 'Prevention Policy: Test Prevention Policy\n  Status: ✓ PASSED' in rendered
+        assert 'Firewall Policy: Firewall Policy\n  Status: ✗ FAILED' in rendered
+
 
 class TestJsonOutputStrategy:
     """Tests for JSON output strategy."""
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
     @patch('falcon_policy_scoring.utils.json_builder.build_json_output')
-    def test_output_to_stdout(self, mock_build_json, mock_context, mock_adapter):
-        """Test JSON output to stdout."""
+    def test_output_to_stdout(self, mock_build_json, use_orjson, mock_context, mock_adapter,
+                              capsys, monkeypatch):
+        """Test JSON output to stdout with and without the orjson encoder."""
+        from falcon_policy_scoring.cli import output_strategies as module
+        if use_orjson and module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(module, 'orjson', None)
+
         # Setup mock
         mock_build_json.return_value = {'test': 'data'}
 
@@ -228,19 +414,22 @@ class TestJsonOutputStrategy:
 
         # Execute with stdout capture
         strategy = JsonOutputStrategy()
-        with patch('builtins.print') as mock_print:
-            strategy.output(data, mock_context)
+        strategy.output(data, mock_context)
 
         # Verify
         mock_build_json.assert_called_once()
-        mock_print.assert_called_once()
-        output = mock_print.call_args[0][0]
+        output = capsys.readouterr().out
+        assert output.endswith('\n')
         assert json.loads(output) == {'test': 'data'}
 
     @patch('falcon_policy_scoring.utils.json_builder.build_json_output')
     @patch('builtins.open', new_callable=mock_open)
-    def test_output_to_file(self, mock_file, mock_build_json, mock_context, mock_adapter):
-        """Test JSON output to file."""
+    def test_output_to_file(self, mock_file, mock_build_json, mock_context, mock_adapter,
+                            monkeypatch):
+        """Test JSON output to file with the stdlib encoder."""
+        from falcon_policy_scoring.cli import output_strategies as module
+        monkeypatch.setattr(module, 'orjson', None)
+
         # Setup mock
         mock_build_json.return_value = {'test': 'data'}
 
@@ -261,8 +450,52 @@ class TestJsonOutputStrategy:
         strategy.output(data, mock_context)
 
         # Verify
-        mock_file.assert_called_once_with('output.json', 'w', encoding='utf-8')
+        mock_file.assert_called_once_with('output.json', 'w', encoding='utf-8', newline='\n')
         mock_build_json.assert_called_once()
+        written = ''.join(call.args[0] for call in mock_file().write.call_args_list)
+        assert json.loads(written) == {'test': 'data'}
+
+    @patch('falcon_policy_scoring.utils.json_builder.build_json_output')
+    def test_output_to_file_orjson(self, mock_build_json, mock_context, mock_adapter, tmp_path):
+        """Test orjson file output matches the stdlib encoding of the same data."""
+        from falcon_policy_scoring.cli import output_strategies as module
+        if module.orjson is None:
+            pytest.skip("orjson not installed")
+        payload = {'hosts': [{'hostname': 'h\u00f6st', 'score': 95.5}], 'counts': {1: 2}}
+        mock_build_json.return_value = payload
+
+        args = Mock()
+        args.output_file = str(tmp_path / 'output.json')
+        data = {'adapter': mock_adapter, 'cid': 'test-cid', 'config': {}, 'args': args}
+
+        JsonOutputStrategy().output(data, mock_context)
+
+        written = Path(args.output_file).read_text(encoding='utf-8')
+        assert json.loads(written) == json.loads(json.dumps(payload))
+        assert written.startswith('{\n  "hosts": [')
+
+    @pytest.mark.parametrize("to_file", [True, False])
+    @patch('falcon_policy_scoring.utils.json_builder.build_json_output')
+    def test_encoders_write_identical_bytes(self, mock_build_json, to_file, mock_context, mock_adapter,
+                                            tmp_path, capsysbinary, monkeypatch):
+        """Test the orjson and stdlib encoders produce byte-identical output."""
+        from falcon_policy_scoring.cli import output_strategies as module
+        if module.orjson is None:
+            pytest.skip("orjson not installed")
+        mock_build_json.return_value = {'hosts': [{'hostname': 'h\u00f6st', 'tags': []}], 'counts': {1: 2}}
+
+        outputs = []
+        for encoder in (module.orjson, None):
+            monkeypatch.setattr(module, 'orjson', encoder)
+            args = Mock()
+            args.output_file = str(tmp_path / f'output-{len(outputs)}.json') if to_file else None
+            JsonOutputStrategy().output({'adapter': mock_adapter, 'cid': 'test-cid', 'config': {}, 'args': args},
+                                        mock_context)
+            outputs.append(Path(args.output_file).read_bytes() if to_file else capsysbinary.readouterr().out)
+
+        assert outputs[0] == outputs[1]
+        assert outputs[0].endswith(b'\n')
+        assert 'h\u00f6st'.encode('utf-8') in outputs[0]
 
 
 class TestCsvOutputStrategy: